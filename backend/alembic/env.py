@@ -15,7 +15,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.core.database import Base
-from src.models import User, Session, NotationSession
+from src.models import User, Session, NotationSession, SessionArchive, UserStatsRollup, UserDrillStatsRollup, ImprovementBenchmarkSnapshot
 
 # this is the Alembic Config object
 config = context.config
@@ -0,0 +1,62 @@
+"""Add per-user stats rollup tables
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create user_stats_rollup and user_drill_stats_rollup tables.
+    
+    Existing users are backfilled with ``python -m src.jobs.rebuild_stats_rollup``.
+    Until then their stats are computed on the fly and their rollup is built
+    on their next session write.
+    """
+    op.create_table(
+        'user_stats_rollup',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('session_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('notation_session_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_pairs', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('session_accuracy_sum', sa.DECIMAL(precision=14, scale=2), nullable=False, server_default='0'),
+        sa.Column('notation_accuracy_sum', sa.DECIMAL(precision=14, scale=2), nullable=False, server_default='0'),
+        sa.Column('session_speed_sum', sa.DECIMAL(precision=16, scale=3), nullable=False, server_default='0'),
+        sa.Column('best_accuracy', sa.DECIMAL(precision=5, scale=2), nullable=True),
+        sa.Column('best_speed', sa.DECIMAL(precision=10, scale=3), nullable=True),
+        sa.Column('best_quality', sa.Integer(), nullable=True),
+        sa.Column('current_streak', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_session_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+    
+    op.create_table(
+        'user_drill_stats_rollup',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('drill_type', sa.String(length=50), nullable=False),
+        sa.Column('session_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('accuracy_sum', sa.DECIMAL(precision=14, scale=2), nullable=False, server_default='0'),
+        sa.Column('speed_sum', sa.DECIMAL(precision=16, scale=3), nullable=False, server_default='0'),
+        sa.Column('best_accuracy', sa.DECIMAL(precision=5, scale=2), nullable=True),
+        sa.Column('best_speed', sa.DECIMAL(precision=10, scale=3), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['user_stats_rollup.user_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'drill_type')
+    )
+
+
+def downgrade() -> None:
+    """Drop stats rollup tables."""
+    op.drop_table('user_drill_stats_rollup')
+    op.drop_table('user_stats_rollup')
@@ -0,0 +1,35 @@
+"""Add improvement benchmark snapshot table
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create improvement_benchmarks table.
+    
+    Filled by ``python -m src.jobs.compute_improvement_benchmarks``.
+    """
+    op.create_table(
+        'improvement_benchmarks',
+        sa.Column('sessions', sa.Integer(), nullable=False),
+        sa.Column('avg_improvement', sa.DECIMAL(precision=6, scale=2), nullable=False),
+        sa.Column('user_count', sa.Integer(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.PrimaryKeyConstraint('sessions')
+    )
+
+
+def downgrade() -> None:
+    """Drop improvement_benchmarks table."""
+    op.drop_table('improvement_benchmarks')
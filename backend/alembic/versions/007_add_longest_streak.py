@@ -0,0 +1,29 @@
+"""Add longest streak to stats rollup
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add longest_streak column to user_stats_rollup.
+    
+    Existing rollups start at 0; run ``python -m src.jobs.rebuild_stats_rollup --all``
+    to fill in historical streaks.
+    """
+    op.add_column('user_stats_rollup', sa.Column('longest_streak', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    """Remove longest_streak column from user_stats_rollup."""
+    op.drop_column('user_stats_rollup', 'longest_streak')
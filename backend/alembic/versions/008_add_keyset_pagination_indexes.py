@@ -0,0 +1,38 @@
+"""Add keyset pagination indexes
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index (user_id, session_date DESC, id DESC) on both session tables.
+    
+    Matches the listing order so cursor pages are an index range scan. The
+    sessions index replaces idx_sessions_user_date, which it covers.
+    """
+    op.create_index(
+        'idx_sessions_user_date_id', 'sessions', ['user_id', 'session_date', 'id'],
+        postgresql_ops={'session_date': 'DESC', 'id': 'DESC'}
+    )
+    op.drop_index('idx_sessions_user_date', table_name='sessions')
+    op.create_index(
+        'idx_notation_sessions_user_date_id', 'notation_sessions', ['user_id', 'session_date', 'id'],
+        postgresql_ops={'session_date': 'DESC', 'id': 'DESC'}
+    )
+
+
+def downgrade() -> None:
+    """Restore the original (user_id, session_date) index."""
+    op.drop_index('idx_notation_sessions_user_date_id', table_name='notation_sessions')
+    op.create_index('idx_sessions_user_date', 'sessions', ['user_id', 'session_date'], postgresql_ops={'session_date': 'DESC'})
+    op.drop_index('idx_sessions_user_date_id', table_name='sessions')
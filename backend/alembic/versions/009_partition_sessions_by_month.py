@@ -0,0 +1,134 @@
+"""Partition session tables by month and add the detail archive
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from datetime import date, datetime, timezone
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+PARTITIONED_TABLES = ('sessions', 'notation_sessions')
+# Monthly partitions created ahead of the current month; later ones come from
+# python -m src.jobs.maintain_session_storage
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partition(table: str, month: date) -> None:
+    """Create the partition holding one UTC calendar month of ``table``."""
+    op.execute(
+        f"CREATE TABLE {table}_y{month:%Y}m{month:%m} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{_add_months(month, 1).isoformat()} 00:00:00+00')"
+    )
+
+
+def upgrade() -> None:
+    """Rebuild sessions and notation_sessions as monthly range partitions on session_date.
+    
+    Rows are copied into the new tables, so run this in a maintenance window.
+    The primary key becomes (id, session_date) because Postgres requires the
+    partition key in every unique index. A BRIN index replaces the btree
+    session_date index, and (user_id, session_date, id) replaces the plain
+    user_id index. Rows outside the created months land in a DEFAULT partition.
+    
+    Also adds archived_at and the session_archive side table for the detail
+    moved out by the archival job.
+    """
+    conn = op.get_bind()
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    
+    for table in PARTITIONED_TABLES:
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_unpartitioned")
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {table}_unpartitioned INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE (session_date)"
+        )
+        
+        first = conn.execute(sa.text(
+            f"SELECT min(session_date AT TIME ZONE 'UTC') FROM {table}_unpartitioned"
+        )).scalar()
+        month = first.date().replace(day=1) if first else this_month
+        while month <= _add_months(this_month, MONTHS_AHEAD):
+            _create_partition(table, month)
+            month = _add_months(month, 1)
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+        
+        op.execute(f"INSERT INTO {table} SELECT * FROM {table}_unpartitioned")
+        op.execute(f"DROP TABLE {table}_unpartitioned")
+        
+        op.add_column(table, sa.Column('archived_at', sa.DateTime(timezone=True), nullable=True))
+        op.create_primary_key(f'{table}_pkey', table, ['id', 'session_date'])
+        op.create_foreign_key(f'{table}_user_id_fkey', table, 'users', ['user_id'], ['id'], ondelete='CASCADE')
+        op.create_index(f'idx_{table}_drill_type', table, ['drill_type'])
+        op.create_index(
+            f'idx_{table}_user_date_id', table, ['user_id', 'session_date', 'id'],
+            postgresql_ops={'session_date': 'DESC', 'id': 'DESC'}
+        )
+        op.create_index(f'idx_{table}_date_brin', table, ['session_date'], postgresql_using='brin')
+    
+    op.create_table(
+        'session_archive',
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.PrimaryKeyConstraint('kind', 'session_id')
+    )
+    # Payloads are TOAST-compressed; prefer lz4 where the server supports it (PG14+)
+    op.execute("""
+        DO $$
+        BEGIN
+            ALTER TABLE session_archive ALTER COLUMN payload SET COMPRESSION lz4;
+        EXCEPTION WHEN others THEN
+            NULL;
+        END $$
+    """)
+
+
+def downgrade() -> None:
+    """Restore archived detail and rebuild both tables unpartitioned (as of revision 008)."""
+    op.execute("""
+        UPDATE sessions s
+        SET pairs = a.payload->'pairs',
+            user_recall = a.payload->>'user_recall',
+            recall_validation = a.payload->'recall_validation'
+        FROM session_archive a
+        WHERE a.kind = 'session' AND a.session_id = s.id
+    """)
+    op.execute("""
+        UPDATE notation_sessions s
+        SET attempts = a.payload->'attempts'
+        FROM session_archive a
+        WHERE a.kind = 'notation_session' AND a.session_id = s.id
+    """)
+    op.drop_table('session_archive')
+    
+    for table in PARTITIONED_TABLES:
+        op.drop_column(table, 'archived_at')
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_partitioned")
+        op.execute(f"CREATE TABLE {table} (LIKE {table}_partitioned INCLUDING DEFAULTS)")
+        op.execute(f"INSERT INTO {table} SELECT * FROM {table}_partitioned")
+        op.execute(f"DROP TABLE {table}_partitioned CASCADE")
+        
+        op.create_primary_key(f'{table}_pkey', table, ['id'])
+        op.create_foreign_key(f'{table}_user_id_fkey', table, 'users', ['user_id'], ['id'], ondelete='CASCADE')
+        op.create_index(f'idx_{table}_user_id', table, ['user_id'])
+        op.create_index(f'idx_{table}_date', table, ['session_date'], postgresql_ops={'session_date': 'DESC'})
+        op.create_index(f'idx_{table}_drill_type', table, ['drill_type'])
+        op.create_index(
+            f'idx_{table}_user_date_id', table, ['user_id', 'session_date', 'id'],
+            postgresql_ops={'session_date': 'DESC', 'id': 'DESC'}
+        )
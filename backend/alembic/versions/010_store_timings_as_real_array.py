@@ -0,0 +1,36 @@
+"""Store session timings as real[]
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Convert sessions.timings from a JSONB array to real[] (4 bytes per pair).
+    
+    ALTER COLUMN ... USING can't contain a subquery, so the conversion goes
+    through a temporary function. Element order is preserved; JSON nulls
+    become NULL elements.
+    """
+    op.execute("""
+        CREATE FUNCTION pg_temp.jsonb_to_real_array(value jsonb) RETURNS real[]
+        LANGUAGE sql IMMUTABLE AS $$
+            SELECT coalesce(array_agg(element::real ORDER BY position), '{}')
+            FROM jsonb_array_elements_text(value) WITH ORDINALITY AS t(element, position)
+        $$
+    """)
+    op.execute("ALTER TABLE sessions ALTER COLUMN timings TYPE real[] USING pg_temp.jsonb_to_real_array(timings)")
+
+
+def downgrade() -> None:
+    """Convert sessions.timings back to a JSONB array."""
+    op.execute("ALTER TABLE sessions ALTER COLUMN timings TYPE jsonb USING to_jsonb(timings)")
@@ -0,0 +1,27 @@
+"""Add users.data_version for conditional GETs
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the per-user session data version behind list and stats ETags."""
+    op.add_column('users', sa.Column('data_version', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('data_updated_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove data_version and data_updated_at from users."""
+    op.drop_column('users', 'data_updated_at')
+    op.drop_column('users', 'data_version')
@@ -0,0 +1,46 @@
+"""Add the session_ids registry
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add session_ids, which keeps session ids unique across partitions.
+    
+    Backfilled from both session tables. If an id was already stored twice
+    the earliest created row keeps it.
+    """
+    op.create_table(
+        'session_ids',
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('kind', 'id')
+    )
+    op.create_index('idx_session_ids_user_id', 'session_ids', ['user_id'])
+    
+    for kind, table in (('session', 'sessions'), ('notation_session', 'notation_sessions')):
+        op.execute(f"""
+            INSERT INTO session_ids (kind, id, user_id)
+            SELECT '{kind}', id, user_id FROM {table} ORDER BY created_at
+            ON CONFLICT DO NOTHING
+        """)
+
+
+def downgrade() -> None:
+    """Drop session_ids."""
+    op.drop_index('idx_session_ids_user_id', table_name='session_ids')
+    op.drop_table('session_ids')
@@ -0,0 +1,94 @@
+"""Concurrent load benchmark for the API.
+
+Fires requests from N concurrent clients and reports throughput and latency
+percentiles. To compare two builds (e.g. sync vs async database access), run
+each with one uvicorn worker against the same seeded database and repeat at
+--concurrency 10, 50 and 100:
+
+    python benchmarks/load_test.py --url http://localhost:8000 \\
+        --path /api/v1/stats --token "$ID_TOKEN" --concurrency 50 --requests 2000
+    python benchmarks/load_test.py --url http://localhost:8000 \\
+        --path "/api/v1/sessions?limit=50" --token "$ID_TOKEN" --concurrency 50 --requests 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Optional
+import httpx
+
+
+async def _client_worker(
+    client: httpx.AsyncClient,
+    path: str,
+    remaining: List[int],
+    latencies: List[float],
+    errors: List[int]
+) -> None:
+    while remaining[0] > 0:
+        remaining[0] -= 1
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors[0] += 1
+        except httpx.HTTPError:
+            errors[0] += 1
+        latencies.append(time.perf_counter() - started)
+
+
+async def run_load_test(
+    url: str,
+    path: str,
+    concurrency: int,
+    requests: int,
+    token: Optional[str] = None
+) -> dict:
+    """Run the benchmark and return summary statistics."""
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    limits = httpx.Limits(max_connections=concurrency)
+    remaining, latencies, errors = [requests], [], [0]
+    
+    async with httpx.AsyncClient(base_url=url, headers=headers, limits=limits, timeout=60) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            _client_worker(client, path, remaining, latencies, errors)
+            for _ in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    
+    def percentile(p: float) -> float:
+        return latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000
+    
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 2),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "latency_ms_mean": round(statistics.mean(latencies) * 1000, 1),
+        "latency_ms_p50": round(percentile(0.50), 1),
+        "latency_ms_p95": round(percentile(0.95), 1),
+        "latency_ms_p99": round(percentile(0.99), 1)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent API load benchmark.")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/api/v1/stats/population")
+    parser.add_argument("--token", help="Firebase ID token for authenticated endpoints")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    
+    result = asyncio.run(run_load_test(args.url, args.path, args.concurrency, args.requests, args.token))
+    for key, value in result.items():
+        print(f"{key:>22}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Serialization benchmark for list responses.
+
+Compares encoding a page of sessions the default FastAPI way (response_model
+validation of every row, then json.dumps) with the fast path the list
+endpoints use (orm_rows + ORJSONResponse). Runs in-process on synthetic rows,
+no database or server needed:
+
+    python -m benchmarks.serialization --rows 500 --pairs 20
+"""
+
+import argparse
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Callable, List
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from src.core.responses import ORJSONResponse, orm_rows
+from src.schemas.session import SessionResponse
+
+
+def _make_rows(count: int, pairs: int, seed: int = 1) -> List[SimpleNamespace]:
+    """Rows shaped like Session objects loaded from the database."""
+    rng = random.Random(seed)
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rows = []
+    for i in range(count):
+        timings = [round(rng.uniform(0.5, 9.0), 3) for _ in range(pairs)]
+        rows.append(SimpleNamespace(
+            id=uuid.UUID(int=rng.getrandbits(128)),
+            user_id=uuid.UUID(int=1),
+            session_date=started + timedelta(hours=i, microseconds=rng.randint(0, 999999)),
+            drill_type=rng.choice(["edges", "corners", "parity"]),
+            pair_count=pairs,
+            pairs=[{"pair": f"{chr(65 + j % 24)}{chr(66 + j % 23)}", "word": "letterpair", "correct": rng.random() > 0.2}
+                   for j in range(pairs)],
+            timings=timings,
+            average_time=Decimal(f"{sum(timings) / pairs:.3f}"),
+            total_time=Decimal(f"{sum(timings):.3f}"),
+            recall_accuracy=Decimal(f"{rng.uniform(0, 100):.2f}"),
+            user_recall="AB CD EF",
+            recall_validation={"correct": pairs - 2, "errors": [{"index": 3, "expected": "AB"}]},
+            vividness=rng.choice([None, 3, 5]),
+            flow=rng.choice([None, 2, 4]),
+            notes=None,
+            created_at=started + timedelta(hours=i, seconds=5),
+            archived_at=None
+        ))
+    return rows
+
+
+def _default_path(rows) -> bytes:
+    """What FastAPI does for ``response_model=List[SessionResponse]`` with JSONResponse."""
+    validated = TypeAdapter(List[SessionResponse]).validate_python(rows, from_attributes=True)
+    content = jsonable_encoder(validated)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def _fast_path(rows) -> bytes:
+    return ORJSONResponse(orm_rows(rows, SessionResponse)).body
+
+
+def _time(render: Callable, rows, repeat: int) -> float:
+    """Best-of-``repeat`` milliseconds to render one page."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render(rows)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare list response serialization paths.")
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--pairs", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = _make_rows(args.rows, args.pairs)
+    default_body, fast_body = _default_path(rows), _fast_path(rows)
+    # Numbers may differ in spelling only (json writes 1e-05, orjson 0.00001)
+    assert json.loads(default_body) == json.loads(fast_body), "fast path changed the response"
+
+    default_ms = _time(_default_path, rows, args.repeat)
+    fast_ms = _time(_fast_path, rows, args.repeat)
+    print(f"{args.rows} rows x {args.pairs} pairs, {len(fast_body) / 1024:.0f} KiB")
+    print(f"  response_model + json: {default_ms:8.2f} ms")
+    print(f"  orm_rows + orjson:     {fast_ms:8.2f} ms  ({default_ms / fast_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
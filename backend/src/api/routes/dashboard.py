@@ -0,0 +1,48 @@
+"""Home dashboard route."""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...core.auth import get_current_user
+from ...core.database import get_async_db
+from ...core.responses import ORJSONResponse
+from ...models.user import User
+from ...schemas.stats import DashboardResponse
+from ...repositories.aio import stats_repository
+from .stats import cached_population_stats
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"], default_response_class=ORJSONResponse)
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> DashboardResponse:
+    """Get the user's stats and the population stats in one request.
+    
+    Replaces GET /stats, GET /stats/population and the full session lists
+    the home page used to compute stats from. Both parts load concurrently:
+    user stats on the request's session, population stats from the worker
+    cache (a miss loads them on a second pooled connection).
+    ``population_stats`` is null while there isn't enough data, or if
+    loading it fails.
+    """
+    user_stats, population_stats = await asyncio.gather(
+        stats_repository.get_user_stats(db, current_user.id),
+        _population_stats_or_none()
+    )
+    return DashboardResponse(user_stats=user_stats, population_stats=population_stats)
+
+
+async def _population_stats_or_none() -> Optional[Dict[str, Any]]:
+    """Population stats, or None on failure (the page renders without them)."""
+    try:
+        return (await cached_population_stats()).value
+    except Exception as e:
+        logger.warning("dashboard population stats failed: %r", e)
+        return None
@@ -0,0 +1,71 @@
+"""Full-history export routes."""
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Literal, Optional
+from datetime import datetime, timezone
+from uuid import UUID
+from ...core.auth import get_current_user
+from ...core.config import settings
+from ...core.database import AsyncSessionLocal
+from ...core.export import EXPORT_FORMATS, encode_export, parquet_available
+from ...core.replica import pin_to_primary, wrote_recently
+from ...models.user import User
+from ...repositories.aio import export_repository
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+
+@router.get("")
+async def export_user_history(
+    format: Literal["csv", "ndjson", "parquet"] = "csv",
+    drill_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    current_user: User = Depends(get_current_user)
+) -> StreamingResponse:
+    """Download all of the user's sessions and notation sessions, oldest first.
+    
+    Streamed from a server-side cursor, so there is no page limit. CSV and
+    Parquet share one header for both kinds (``kind`` tells them apart);
+    nested detail (pairs, attempts, recall_validation) is JSON text. Parquet
+    needs pyarrow on the server.
+    """
+    if format == "parquet" and not parquet_available():
+        raise HTTPException(status_code=400, detail="Parquet export is not available on this server")
+    
+    media_type, extension = EXPORT_FORMATS[format]
+    filename = f"bld-history-{datetime.now(timezone.utc):%Y%m%d}.{extension}"
+    return StreamingResponse(
+        _export_chunks(
+            current_user.id,
+            format,
+            read_primary=wrote_recently(current_user.data_updated_at),
+            drill_type=drill_type,
+            start_date=start_date,
+            end_date=end_date
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+async def _export_chunks(
+    user_id: UUID,
+    export_format: str,
+    read_primary: bool,
+    **filters: Any
+) -> AsyncIterator[bytes]:
+    """Encoded export on its own session (the response outlives the request's dependencies).
+    
+    ``read_primary`` carries get_current_user's read-your-writes decision,
+    which was made on the request's session.
+    """
+    async with AsyncSessionLocal() as db:
+        if read_primary:
+            pin_to_primary(db, user_id)
+        batches = export_repository.stream_user_export(
+            db, user_id, batch_size=settings.EXPORT_BATCH_SIZE, **filters
+        )
+        async for chunk in encode_export(batches, export_format):
+            yield chunk
@@ -0,0 +1,51 @@
+"""Merged session history routes."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Dict
+from datetime import datetime
+from ...core.auth import get_current_user
+from ...core.conditional import user_cache_headers
+from ...core.database import get_async_db
+from ...core.pagination import decode_cursor, set_next_cursor
+from ...core.responses import ORJSONResponse, orm_rows
+from ...models.user import User
+from ...schemas.session import HistoryItemResponse
+from ...repositories.aio import history_repository
+
+router = APIRouter(prefix="/history", tags=["history"])
+
+
+@router.get("", response_model=List[HistoryItemResponse])
+async def get_user_history(
+    limit: int = Query(100, ge=1, le=500),
+    drill_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    cache_headers: Dict[str, str] = Depends(user_cache_headers),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
+    """Get sessions and notation sessions as one newest-first list.
+    
+    ``item_count`` is pair_count for sessions and total_pieces for notation
+    sessions. Paged with X-Next-Cursor like GET /sessions.
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    rows = await history_repository.get_user_history(
+        db,
+        current_user.id,
+        limit=limit,
+        drill_type=drill_type,
+        start_date=start_date,
+        end_date=end_date,
+        after=after
+    )
+    response = ORJSONResponse(orm_rows(rows, HistoryItemResponse), headers=cache_headers)
+    set_next_cursor(response, rows, limit)
+    return response
@@ -1,15 +1,22 @@
 """Notation session routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, status, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, List, Optional, Dict
 from datetime import datetime
 from uuid import UUID
 from ...core.auth import get_current_user
-from ...core.database import get_db
+from ...core.conditional import user_cache_headers
+from ...core.bulk import validate_bulk_items
+from ...core.database import get_async_db
+from ...core.idempotency import IDEMPOTENCY_KEY_HEADER, idempotent_id, assign_bulk_ids
+from ...core.pagination import decode_cursor, set_next_cursor
+from ...core.responses import ORJSONResponse, orm_rows
 from ...models.user import User
-from ...schemas.session import NotationSessionCreate, NotationSessionResponse
-from ...repositories import notation_session_repository
+from ...schemas.session import (
+    NotationSessionCreate, NotationSessionResponse, NotationSessionSummaryResponse, BulkCreateResponse
+)
+from ...repositories.aio import notation_session_repository
 
 router = APIRouter(prefix="/notation-sessions", tags=["notation-sessions"])
 
@@ -17,27 +24,119 @@ router = APIRouter(prefix="/notation-sessions", tags=["notation-sessions"])
 @router.post("", response_model=NotationSessionResponse, status_code=status.HTTP_201_CREATED)
 async def create_notation_session(
     session_data: NotationSessionCreate,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER, max_length=255),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> NotationSessionResponse:
-    """Create a new notation training session."""
-    session = notation_session_repository.create_notation_session(
+    """Create a new notation training session.
+    
+    Send a client-generated ``id`` or an Idempotency-Key header to make
+    retries safe: a repeated request returns the stored session (200)
+    without writing it again.
+    """
+    if session_data.id is None and idempotency_key:
+        session_data.id = idempotent_id(current_user.id, idempotency_key)
+    
+    session, created = await notation_session_repository.create_notation_session(
         db, current_user.id, session_data
     )
+    
+    if session is None:
+        raise HTTPException(status_code=409, detail="Session id already in use")
+    
+    if not created:
+        response.status_code = status.HTTP_200_OK
     return session
 
 
+@router.post("/bulk", response_model=BulkCreateResponse)
+async def create_notation_sessions_bulk(
+    items: List[Any] = Body(..., description="Notation sessions in NotationSessionCreate format"),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER, max_length=255),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> BulkCreateResponse:
+    """Create many notation sessions in one transaction (see POST /sessions/bulk)."""
+    valid, errors = validate_bulk_items(items, NotationSessionCreate)
+    assign_bulk_ids(current_user.id, valid, idempotency_key)
+    
+    created, db_errors = await notation_session_repository.create_notation_sessions_bulk(
+        db, current_user.id, valid
+    )
+    return BulkCreateResponse(
+        created=[
+            {"index": index, "id": session_id, "existing": existing}
+            for index, session_id, existing in created
+        ],
+        errors=[
+            {"index": index, "detail": detail}
+            for index, detail in sorted(errors + db_errors, key=lambda error: error[0])
+        ]
+    )
+
+
 @router.get("", response_model=List[NotationSessionResponse])
 async def get_user_notation_sessions(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
     drill_type: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    cache_headers: Dict[str, str] = Depends(user_cache_headers),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
+    """Get all notation sessions for current user (cursor paging as for /sessions)."""
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    sessions = await notation_session_repository.get_user_notation_sessions(
+        db, current_user.id, skip=skip, limit=limit, drill_type=drill_type, after=after
+    )
+    response = ORJSONResponse(orm_rows(sessions, NotationSessionResponse), headers=cache_headers)
+    set_next_cursor(response, sessions, limit)
+    return response
+
+
+@router.get("/summary", response_model=List[NotationSessionSummaryResponse])
+async def get_user_notation_session_summaries(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    drill_type: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    cache_headers: Dict[str, str] = Depends(user_cache_headers),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-) -> List[NotationSessionResponse]:
-    """Get all notation sessions for current user."""
-    sessions = notation_session_repository.get_user_notation_sessions(
-        db, current_user.id, skip=skip, limit=limit, drill_type=drill_type
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
+    """Get notation session list rows without attempts or notes."""
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    sessions = await notation_session_repository.get_user_notation_sessions(
+        db, current_user.id, skip=skip, limit=limit, drill_type=drill_type, after=after, summary=True
     )
-    return sessions
+    response = ORJSONResponse(orm_rows(sessions, NotationSessionSummaryResponse), headers=cache_headers)
+    set_next_cursor(response, sessions, limit)
+    return response
 
+
+@router.get("/{session_id}", response_model=NotationSessionResponse)
+async def get_notation_session(
+    session_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> NotationSessionResponse:
+    """Get specific notation session by ID."""
+    session = await notation_session_repository.get_notation_session_by_id(db, session_id)
+    
+    if not session:
+        raise HTTPException(status_code=404, detail="Notation session not found")
+    
+    if session.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to access this notation session")
+    
+    return session
@@ -1,15 +1,20 @@
 """Training session routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, status, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, List, Optional, Dict
 from datetime import datetime
 from uuid import UUID
 from ...core.auth import get_current_user
-from ...core.database import get_db
+from ...core.conditional import user_cache_headers
+from ...core.bulk import validate_bulk_items
+from ...core.database import get_async_db
+from ...core.idempotency import IDEMPOTENCY_KEY_HEADER, idempotent_id, assign_bulk_ids
+from ...core.pagination import decode_cursor, set_next_cursor
+from ...core.responses import ORJSONResponse, orm_rows
 from ...models.user import User
-from ...schemas.session import SessionCreate, SessionResponse
-from ...repositories import session_repository
+from ...schemas.session import SessionCreate, SessionResponse, SessionSummaryResponse, BulkCreateResponse
+from ...repositories.aio import session_repository
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
@@ -17,14 +22,58 @@ router = APIRouter(prefix="/sessions", tags=["sessions"])
 @router.post("", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
 async def create_session(
     session_data: SessionCreate,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER, max_length=255),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> SessionResponse:
-    """Create a new training session."""
-    session = session_repository.create_session(db, current_user.id, session_data)
+    """Create a new training session.
+    
+    Send a client-generated ``id`` or an Idempotency-Key header to make
+    retries safe: a repeated request returns the stored session (200)
+    without writing it again.
+    """
+    if session_data.id is None and idempotency_key:
+        session_data.id = idempotent_id(current_user.id, idempotency_key)
+    
+    session, created = await session_repository.create_session(db, current_user.id, session_data)
+    
+    if session is None:
+        raise HTTPException(status_code=409, detail="Session id already in use")
+    
+    if not created:
+        response.status_code = status.HTTP_200_OK
     return session
 
 
+@router.post("/bulk", response_model=BulkCreateResponse)
+async def create_sessions_bulk(
+    items: List[Any] = Body(..., description="Sessions in SessionCreate format"),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER, max_length=255),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> BulkCreateResponse:
+    """Create many training sessions in one transaction (offline sync uploads).
+    
+    Each item is validated and stored independently; rejected items are listed
+    in ``errors`` by their index in the request.
+    """
+    valid, errors = validate_bulk_items(items, SessionCreate)
+    assign_bulk_ids(current_user.id, valid, idempotency_key)
+    
+    created, db_errors = await session_repository.create_sessions_bulk(db, current_user.id, valid)
+    return BulkCreateResponse(
+        created=[
+            {"index": index, "id": session_id, "existing": existing}
+            for index, session_id, existing in created
+        ],
+        errors=[
+            {"index": index, "detail": detail}
+            for index, detail in sorted(errors + db_errors, key=lambda error: error[0])
+        ]
+    )
+
+
 @router.get("", response_model=List[SessionResponse])
 async def get_user_sessions(
     skip: int = Query(0, ge=0),
@@ -32,30 +81,82 @@ async def get_user_sessions(
     drill_type: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    cache_headers: Dict[str, str] = Depends(user_cache_headers),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-) -> List[SessionResponse]:
-    """Get all sessions for current user with optional filters."""
-    sessions = session_repository.get_user_sessions(
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
+    """Get all sessions for current user with optional filters.
+    
+    Full pages carry an X-Next-Cursor header; pass it back as ``cursor`` to
+    fetch the next page without an OFFSET scan (``skip`` is then ignored).
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    sessions = await session_repository.get_user_sessions(
         db, 
         current_user.id, 
         skip=skip, 
         limit=limit,
         drill_type=drill_type,
         start_date=start_date,
-        end_date=end_date
+        end_date=end_date,
+        after=after
+    )
+    response = ORJSONResponse(orm_rows(sessions, SessionResponse), headers=cache_headers)
+    set_next_cursor(response, sessions, limit)
+    return response
+
+
+@router.get("/summary", response_model=List[SessionSummaryResponse])
+async def get_user_session_summaries(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    drill_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    cache_headers: Dict[str, str] = Depends(user_cache_headers),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
+    """Get session list rows without pairs, timings or recall detail.
+    
+    Same filters and paging as GET /sessions; fetch GET /sessions/{id} for
+    a session's full detail.
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    sessions = await session_repository.get_user_sessions(
+        db,
+        current_user.id,
+        skip=skip,
+        limit=limit,
+        drill_type=drill_type,
+        start_date=start_date,
+        end_date=end_date,
+        after=after,
+        summary=True
     )
-    return sessions
+    response = ORJSONResponse(orm_rows(sessions, SessionSummaryResponse), headers=cache_headers)
+    set_next_cursor(response, sessions, limit)
+    return response
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session(
     session_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> SessionResponse:
     """Get specific session by ID."""
-    session = session_repository.get_session_by_id(db, session_id)
+    session = await session_repository.get_session_by_id(db, session_id)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -70,10 +171,10 @@ async def get_session(
 async def delete_session(
     session_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a session."""
-    session = session_repository.get_session_by_id(db, session_id)
+    session = await session_repository.get_session_by_id(db, session_id)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -81,5 +182,5 @@ async def delete_session(
     if session.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this session")
     
-    session_repository.delete_session(db, session_id)
+    await session_repository.delete_session(db, session_id)
 
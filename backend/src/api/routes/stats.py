@@ -1,42 +1,183 @@
 """Stats routes for user and population statistics."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from functools import partial
+from typing import Dict, Literal, Optional
+from datetime import datetime
 from ...core.auth import get_current_user
-from ...core.database import get_db
+from ...core.cache import SWRCache, CacheEntry, etag_matches
+from ...core.conditional import user_cache_headers
+from ...core.config import settings
+from ...core.database import get_async_db, AsyncSessionLocal
+from ...core.responses import ORJSONResponse
 from ...models.user import User
-from ...schemas.stats import UserStatsResponse, PopulationStatsResponse
-from ...repositories import stats_repository
+from ...schemas.stats import (
+    UserStatsResponse, PopulationStatsResponse, PopulationHistogramResponse,
+    TimeseriesResponse, StreakResponse, TimingProfileResponse
+)
+from ...repositories.aio import stats_repository
 
-router = APIRouter(prefix="/stats", tags=["stats"])
+router = APIRouter(prefix="/stats", tags=["stats"], default_response_class=ORJSONResponse)
+
+# Shared by every request on this worker; see /metrics for hit/miss counters
+population_stats_cache = SWRCache(
+    "population_stats",
+    ttl=settings.POPULATION_STATS_CACHE_TTL,
+    stale_ttl=settings.POPULATION_STATS_STALE_TTL
+)
 
 
 @router.get("", response_model=UserStatsResponse)
 async def get_user_stats(
+    response: Response,
+    cache_headers: Dict[str, str] = Depends(user_cache_headers),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> UserStatsResponse:
     """Get user-specific statistics."""
-    stats = stats_repository.get_user_stats(db, current_user.id)
+    stats = await stats_repository.get_user_stats(db, current_user.id)
+    response.headers.update(cache_headers)
     return UserStatsResponse(**stats)
 
 
+@router.get("/streak", response_model=StreakResponse)
+async def get_user_streak(
+    response: Response,
+    cache_headers: Dict[str, str] = Depends(user_cache_headers),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> StreakResponse:
+    """Get current and longest practice streaks (lightweight, for the home page badge)."""
+    streak = await stats_repository.get_user_streak(db, current_user.id)
+    response.headers.update(cache_headers)
+    return StreakResponse(**streak)
+
+
+@router.get("/timeseries", response_model=TimeseriesResponse)
+async def get_user_timeseries(
+    response: Response,
+    bucket: Literal["day", "week", "month"] = "day",
+    drill_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    max_points: Optional[int] = Query(None, ge=3, le=1000),
+    cache_headers: Dict[str, str] = Depends(user_cache_headers),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> TimeseriesResponse:
+    """Get per-drill progress aggregated into day, week or month buckets (UTC).
+    
+    ``max_points`` downsamples each drill's series (LTTB) for long histories.
+    """
+    points = await stats_repository.get_user_timeseries(
+        db,
+        current_user.id,
+        bucket=bucket,
+        drill_type=drill_type,
+        start_date=start_date,
+        end_date=end_date,
+        max_points=max_points
+    )
+    response.headers.update(cache_headers)
+    return TimeseriesResponse(bucket=bucket, points=points)
+
+
+@router.get("/timings", response_model=TimingProfileResponse)
+async def get_user_timing_profile(
+    response: Response,
+    drill_type: Optional[str] = None,
+    cache_headers: Dict[str, str] = Depends(user_cache_headers),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> TimingProfileResponse:
+    """Get average and percentile recall time for each pair position (1-based)."""
+    positions = await stats_repository.get_user_timing_profile(db, current_user.id, drill_type=drill_type)
+    response.headers.update(cache_headers)
+    return TimingProfileResponse(drill_type=drill_type, positions=positions)
+
+
 @router.get("/population", response_model=PopulationStatsResponse)
 async def get_population_stats(
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response
 ) -> PopulationStatsResponse:
     """Get population-wide statistics (aggregate across all users).
     
     Public endpoint - no authentication required. Returns aggregate statistics only - no individual user data.
     This allows unregistered users to see how they compare to the community.
+    Served from an in-process cache with ETag/Cache-Control so nginx and browsers can cache it too.
     """
-    stats = stats_repository.get_population_stats(db, min_users=1)
+    entry = await cached_population_stats()
     
-    if stats is None:
+    if entry.value is None:
         raise HTTPException(
             status_code=503,
             detail="Population statistics not available. Insufficient data (need at least 1 user)."
         )
     
-    return PopulationStatsResponse(**stats)
+    not_modified = _apply_cache_headers(request, response, entry)
+    if not_modified:
+        return not_modified
+    
+    return PopulationStatsResponse(**entry.value)
+
 
+@router.get("/population/histogram", response_model=PopulationHistogramResponse)
+async def get_population_histogram(
+    request: Request,
+    response: Response,
+    metric: Literal["accuracy", "speed", "quality"] = "accuracy",
+    bins: int = Query(20, ge=1, le=100)
+) -> PopulationHistogramResponse:
+    """Get the population distribution of a metric as equal-width bins.
+    
+    Public endpoint - no authentication required. Used by the population chart.
+    """
+    entry = await population_stats_cache.get(
+        f"histogram:{metric}:{bins}",
+        partial(_load_with_session, stats_repository.get_population_histogram, metric, bins=bins)
+    )
+    
+    if entry.value is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Population statistics not available. Insufficient data."
+        )
+    
+    not_modified = _apply_cache_headers(request, response, entry)
+    if not_modified:
+        return not_modified
+    
+    return PopulationHistogramResponse(**entry.value)
+
+
+async def cached_population_stats() -> CacheEntry:
+    """Population stats through this worker's cache (``value`` is None with too little data)."""
+    return await population_stats_cache.get(
+        "population",
+        partial(_load_with_session, stats_repository.get_population_stats, min_users=1)
+    )
+
+
+async def _load_with_session(query, *args, **kwargs):
+    """Run a repository query on its own session (cache loads outlive the request)."""
+    async with AsyncSessionLocal() as db:
+        return await query(db, *args, **kwargs)
+
+
+def _apply_cache_headers(request: Request, response: Response, entry: CacheEntry):
+    """Set ETag/Cache-Control and return a 304 response if the client copy is current."""
+    headers = {
+        "ETag": entry.etag,
+        "Cache-Control": (
+            f"public, max-age={population_stats_cache.ttl}, "
+            f"stale-while-revalidate={population_stats_cache.stale_ttl}"
+        )
+    }
+    
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    response.headers.update(headers)
+    return None
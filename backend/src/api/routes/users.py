@@ -1,13 +1,13 @@
 """User routes."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from ...core.auth import get_current_user
-from ...core.database import get_db
+from ...core.database import get_async_db
 from ...models.user import User
 from ...schemas.user import UserResponse, UserUpdate
-from ...repositories import user_repository
+from ...repositories.aio import user_repository
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -24,9 +24,9 @@ async def get_current_user_profile(
 async def update_current_user_profile(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> UserResponse:
     """Update current user profile."""
-    updated_user = user_repository.update_user(db, current_user.id, user_update)
+    updated_user = await user_repository.update_user(db, current_user.id, user_update)
     return updated_user
 
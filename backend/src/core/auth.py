@@ -1,20 +1,28 @@
 """Authentication middleware and dependencies."""
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from .firebase import verify_firebase_token
-from .database import get_db
+from .database import get_async_db
+from .last_login import last_login_buffer
+from .replica import pin_to_primary, wrote_recently
 from ..models.user import User
+from ..repositories.aio import user_repository
 from typing import Optional
-from datetime import datetime
 
 security = HTTPBearer()
 
 
+# Methods that don't write; any other request keeps the user's reads on the primary
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> User:
     """Extract and validate Firebase token, return current user."""
     try:
@@ -24,7 +32,7 @@ async def get_current_user(
         firebase_uid = decoded_token['uid']
         
         # Get or create user
-        user = db.query(User).filter(User.firebase_uid == firebase_uid).first()
+        user = await user_repository.get_user_by_firebase_uid(db, firebase_uid)
         
         if not user:
             # Create new user from Firebase claims
@@ -35,12 +43,13 @@ async def get_current_user(
                 profile_picture_url=decoded_token.get('picture')
             )
             db.add(user)
-            db.commit()
-            db.refresh(user)
-        
-        # Update last login
-        user.last_login = datetime.utcnow()
-        db.commit()
+            try:
+                await db.commit()
+                await db.refresh(user)
+            except IntegrityError:
+                # A concurrent first request already created this user
+                await db.rollback()
+                user = await user_repository.get_user_by_firebase_uid(db, firebase_uid)
         
         if not user.is_active:
             raise HTTPException(
@@ -48,6 +57,14 @@ async def get_current_user(
                 detail="User account is inactive"
             )
         
+        # Update last login (buffered, flushed in bulk in the background)
+        last_login_buffer.record(user)
+        
+        # Read-your-writes: neither this request's writes nor recent ones handled
+        # by any other worker may have reached the replica yet
+        if request.method not in SAFE_METHODS or wrote_recently(user.data_updated_at):
+            pin_to_primary(db, user.id)
+        
         return user
     except HTTPException:
         # Re-raise HTTP exceptions (like 403)
@@ -0,0 +1,31 @@
+"""Per-item validation for bulk create endpoints."""
+
+from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError
+from typing import Any, List, Tuple, Type
+from .config import settings
+
+
+def validate_bulk_items(
+    items: List[Any],
+    schema: Type[BaseModel]
+) -> Tuple[List[Tuple[int, BaseModel]], List[Tuple[int, Any]]]:
+    """Validate each raw item against ``schema`` independently.
+
+    Returns ``(index, model)`` for valid items and ``(index, errors)`` for
+    invalid ones, so one bad session doesn't reject the whole upload.
+    Raises 413 when the batch exceeds ``BULK_MAX_ITEMS``.
+    """
+    if len(items) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many items: {len(items)} (max {settings.BULK_MAX_ITEMS} per request)"
+        )
+
+    valid, errors = [], []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema.model_validate(item)))
+        except ValidationError as e:
+            errors.append((index, e.errors(include_url=False, include_context=False, include_input=False)))
+    return valid, errors
@@ -0,0 +1,134 @@
+"""In-process response cache with stale-while-revalidate and single-flight loading."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry:
+    """Cached value with its ETag and load time."""
+
+    def __init__(self, value: Any, loaded_at: float):
+        self.value = value
+        self.loaded_at = loaded_at
+        self.etag = _compute_etag(value)
+
+
+class SWRCache:
+    """TTL cache that serves stale entries while a single background refresh runs.
+
+    - Fresh entries (younger than ``ttl``) are served directly.
+    - Stale entries (younger than ``ttl + stale_ttl``) are served immediately and
+      trigger one background reload.
+    - Missing or expired entries are loaded once; concurrent callers for the same
+      key await the same load instead of each hitting the database.
+
+    Loaders are coroutine functions taking no arguments.
+    """
+
+    def __init__(self, name: str, ttl: float, stale_ttl: float = 0.0):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: Dict[str, CacheEntry] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.loads = 0
+        self.load_errors = 0
+
+    async def get(self, key: str, loader: Callable[[], Awaitable[Any]]) -> CacheEntry:
+        """Return the cached entry for ``key``, loading it if needed."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.loaded_at
+            if age < self.ttl:
+                self.hits += 1
+                return entry
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._start_load(key, loader)
+                return entry
+
+        self.misses += 1
+        # Shield so a cancelled request doesn't cancel the load other callers await
+        return await asyncio.shield(self._start_load(key, loader))
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one key, or every key when none is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        return {
+            "name": self.name,
+            "ttl": self.ttl,
+            "stale_ttl": self.stale_ttl,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "loads": self.loads,
+            "load_errors": self.load_errors,
+            "inflight": len(self._inflight)
+        }
+
+    def _start_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Start a load for ``key`` unless one is already running."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+
+        task = asyncio.get_running_loop().create_task(self._load(key, loader))
+        task.add_done_callback(self._log_failure)
+        self._inflight[key] = task
+        return task
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> CacheEntry:
+        try:
+            value = await loader()
+            entry = CacheEntry(value, time.monotonic())
+            self._entries[key] = entry
+            self.loads += 1
+            return entry
+        except Exception:
+            self.load_errors += 1
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def _log_failure(self, task: asyncio.Task) -> None:
+        """Retrieve background load errors so they are logged, not lost."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Cache %s load failed: %r", self.name, task.exception())
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [_opaque_tag(tag.strip()) for tag in if_none_match.split(",")]
+    return "*" in candidates or _opaque_tag(etag) in candidates
+
+
+def _opaque_tag(tag: str) -> str:
+    """ETag without its weak ``W/`` prefix."""
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _compute_etag(value: Any) -> str:
+    """Strong ETag from the JSON form of a cached value."""
+    payload = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return f'"{hashlib.sha1(payload).hexdigest()}"'
@@ -0,0 +1,21 @@
+"""Response compression middleware."""
+
+from fastapi import FastAPI
+from starlette.middleware.gzip import GZipMiddleware
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # optional: gzip only
+    BrotliMiddleware = None
+
+
+def add_compression(app: FastAPI, minimum_size: int) -> None:
+    """Compress responses of at least ``minimum_size`` bytes.
+    
+    Uses brotli for clients that accept it (gzip for the rest) when
+    brotli-asgi is installed, otherwise gzip.
+    """
+    if BrotliMiddleware is not None:
+        app.add_middleware(BrotliMiddleware, minimum_size=minimum_size, gzip_fallback=True)
+    else:
+        app.add_middleware(GZipMiddleware, minimum_size=minimum_size)
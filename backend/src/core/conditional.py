@@ -0,0 +1,37 @@
+"""Conditional GETs for responses built from the current user's session data."""
+
+from datetime import datetime, timezone
+from typing import Dict
+from fastapi import Depends, HTTPException, Request
+from .auth import get_current_user
+from .cache import etag_matches
+from ..models.user import User
+
+
+def user_data_etag(user: User) -> str:
+    """Weak ETag for the user's session data as of now.
+    
+    Built from users.data_version, which every session write bumps, so no
+    list or stats query is needed. The UTC date is included because streaks
+    and days-since counts change at midnight without a write.
+    """
+    today = datetime.now(timezone.utc).date()
+    return f'W/"{user.id.hex}.{user.data_version}.{today:%Y%m%d}"'
+
+
+async def user_cache_headers(
+    request: Request,
+    current_user: User = Depends(get_current_user)
+) -> Dict[str, str]:
+    """ETag and Cache-Control headers for a per-user response.
+    
+    Raises a 304 before the route runs any query when the client's
+    If-None-Match still matches.
+    """
+    headers = {"ETag": user_data_etag(current_user), "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        raise HTTPException(status_code=304, headers=headers)
+    
+    # get_current_user keeps reads on the primary until recent writes have
+    # reached the replica, so lagging rows are never cached under this ETag
+    return headers
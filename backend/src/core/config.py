@@ -11,15 +11,50 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    # Defaults to DATABASE_URL with the asyncpg driver
+    DATABASE_ASYNC_URL: Optional[str] = None
+    # Optional read replica for list and stats queries (async URL derived like DATABASE_ASYNC_URL)
+    DATABASE_REPLICA_URL: Optional[str] = None
+    DATABASE_REPLICA_ASYNC_URL: Optional[str] = None
+    # Seconds a user's reads stay on the primary after they write (should exceed replica lag)
+    REPLICA_READ_YOUR_WRITES_WINDOW: float = 10.0
     DB_ECHO: bool = False
+    # Connection pool, per engine and per worker process
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
     
     # Firebase
     FIREBASE_PROJECT_ID: str
     FIREBASE_CREDENTIALS_PATH: Optional[str] = None
+    # Max verified tokens cached per worker (0 disables the cache)
+    FIREBASE_TOKEN_CACHE_SIZE: int = 10000
+    
+    # last_login write-behind (seconds): skip updates newer than RESOLUTION, flush every INTERVAL
+    LAST_LOGIN_RESOLUTION: int = 300
+    LAST_LOGIN_FLUSH_INTERVAL: int = 30
+    
+    # Session storage: archive detail of sessions older than this many months;
+    # keep monthly partitions created this far ahead
+    SESSION_ARCHIVE_AFTER_MONTHS: int = 12
+    SESSION_PARTITION_MONTHS_AHEAD: int = 3
     
     # API
     API_V1_PREFIX: str = "/api/v1"
     PROJECT_NAME: str = "BLD Memory Trainer API"
+    # Max items per POST /sessions/bulk or /notation-sessions/bulk request
+    BULK_MAX_ITEMS: int = 500
+    # Rows fetched per round trip by GET /export
+    EXPORT_BATCH_SIZE: int = 1000
+    
+    # Compress responses at least this large (bytes); brotli when brotli-asgi is installed, else gzip
+    COMPRESSION_MIN_SIZE: int = 1024
+    
+    # Population stats cache (seconds). Stale entries are served while one refresh runs.
+    POPULATION_STATS_CACHE_TTL: int = 60
+    POPULATION_STATS_STALE_TTL: int = 600
     
     # CORS - Accept as string to avoid pydantic-settings parsing issues
     # Map ALLOWED_ORIGINS env var to this field
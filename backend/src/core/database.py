@@ -1,15 +1,88 @@
 """Database configuration and session management."""
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 from .config import settings
+from .db_pool import PoolMetrics, instrumented_pool_class
+from .replica import RoutingSession
 
+
+# Async driver used for each sync database backend
+ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+
+def _async_database_url(url: str) -> str:
+    """Swap a sync database URL onto its async driver (e.g. psycopg2 -> asyncpg)."""
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if drivername:
+        parsed = parsed.set(drivername=drivername)
+    return parsed.render_as_string(hide_password=False)
+
+
+def _pool_options() -> dict:
+    """Pool sizing shared by the sync and async engines."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING
+    }
+
+
+# Pool metrics, exposed on /metrics
+sync_pool_metrics = PoolMetrics("sync")
+async_pool_metrics = PoolMetrics("async")
+replica_pool_metrics = PoolMetrics("async_replica")
+
+
+# Sync engine: Alembic, CLI jobs and scripts
 engine = create_engine(
     settings.DATABASE_URL,
-    echo=settings.DB_ECHO
+    echo=settings.DB_ECHO,
+    poolclass=instrumented_pool_class(QueuePool, sync_pool_metrics),
+    **_pool_options()
 )
+sync_pool_metrics.attach(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async engine: the API
+async_engine = create_async_engine(
+    settings.DATABASE_ASYNC_URL or _async_database_url(settings.DATABASE_URL),
+    echo=settings.DB_ECHO,
+    poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, async_pool_metrics),
+    **_pool_options()
+)
+async_pool_metrics.attach(async_engine.sync_engine)
+
+# Optional read replica: reads inside replica.use_replica() go here
+async_replica_engine = None
+replica_url = settings.DATABASE_REPLICA_ASYNC_URL or (
+    settings.DATABASE_REPLICA_URL and _async_database_url(settings.DATABASE_REPLICA_URL)
+)
+if replica_url:
+    async_replica_engine = create_async_engine(
+        replica_url,
+        echo=settings.DB_ECHO,
+        poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, replica_pool_metrics),
+        **_pool_options()
+    )
+    replica_pool_metrics.attach(async_replica_engine.sync_engine)
+
+# Objects stay usable after commit; lazy loads aren't possible outside the session's greenlet
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    sync_session_class=RoutingSession,
+    replica_bind=async_replica_engine.sync_engine if async_replica_engine is not None else None,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 Base = declarative_base()
 
 
@@ -21,3 +94,8 @@ def get_db():
     finally:
         db.close()
 
+
+async def get_async_db():
+    """Dependency for getting an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
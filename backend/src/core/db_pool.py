@@ -0,0 +1,105 @@
+"""Connection pool instrumentation: checkout wait times, usage and timeouts."""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Type
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+
+class PoolMetrics:
+    """Counters and recent checkout wait times for one engine's pool."""
+
+    def __init__(self, name: str, sample_size: int = 1000):
+        self.name = name
+        self.engine: Optional[Engine] = None
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.connections_opened = 0
+        self.invalidations = 0
+        self.peak_in_use = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._waits: Deque[float] = deque(maxlen=sample_size)
+
+    def record_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+        self._waits.append(seconds)
+        if self.engine is not None:
+            self.peak_in_use = max(self.peak_in_use, self.engine.pool.checkedout())
+
+    def attach(self, engine: Engine) -> None:
+        """Listen to connection lifecycle events on ``engine``'s pool."""
+        self.engine = engine
+
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            self.connections_opened += 1
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            self.checkins += 1
+
+        @event.listens_for(engine, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring. Wait times are in milliseconds."""
+        waits = sorted(self._waits)
+        pool = self.engine.pool if self.engine is not None else None
+        return {
+            "name": self.name,
+            "pool_size": pool.size() if pool is not None else None,
+            "in_use": pool.checkedout() if pool is not None else None,
+            "idle": pool.checkedin() if pool is not None else None,
+            "overflow": pool.overflow() if pool is not None else None,
+            "peak_in_use": self.peak_in_use,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "timeouts": self.timeouts,
+            "connections_opened": self.connections_opened,
+            "invalidations": self.invalidations,
+            "wait_ms_mean": _ms(self.wait_total / self.checkouts) if self.checkouts else 0.0,
+            "wait_ms_max": _ms(self.wait_max),
+            "wait_ms_p50": _ms(_percentile(waits, 0.50)),
+            "wait_ms_p95": _ms(_percentile(waits, 0.95)),
+            "wait_ms_p99": _ms(_percentile(waits, 0.99))
+        }
+
+
+def instrumented_pool_class(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """Subclass of ``base`` that times every checkout into ``metrics``.
+
+    Pool events only fire once a connection has been handed out, so the wait
+    for a free connection is measured around ``Pool.connect``. Defined as a
+    class attribute so the timing survives ``Pool.recreate`` on dispose.
+    """
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = base.connect(self)
+        except exc.TimeoutError:
+            metrics.timeouts += 1
+            raise
+        metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+    return type(f"Instrumented{base.__name__}", (base,), {"connect": connect})
+
+
+def _percentile(values: list, fraction: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
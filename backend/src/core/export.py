@@ -0,0 +1,174 @@
+"""Streaming encoders for history export (CSV, NDJSON and, with pyarrow, Parquet)."""
+
+import csv
+import io
+from typing import Any, AsyncIterator, Dict, Iterable, List
+import orjson
+from pydantic_core import to_jsonable_python
+from starlette.concurrency import run_in_threadpool
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: no Parquet export
+    pa = pq = None
+
+# Columns of a CSV or Parquet export: both session kinds share one header and
+# leave the other kind's columns empty
+EXPORT_FIELDS = (
+    "kind", "id", "session_date", "drill_type", "pair_count", "total_pieces", "correct_count",
+    "recall_accuracy", "accuracy", "average_time", "total_time", "timings", "pairs", "attempts",
+    "user_recall", "recall_validation", "vividness", "flow", "notes", "created_at"
+)
+# Nested columns, written as JSON text in CSV and Parquet
+JSON_FIELDS = ("pairs", "attempts", "recall_validation")
+
+# Format -> (media type, file extension)
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet")
+}
+
+
+def parquet_available() -> bool:
+    return pq is not None
+
+
+class _CSVEncoder:
+    def start(self) -> bytes:
+        return self._rows([EXPORT_FIELDS])
+    
+    def batch(self, rows: List[Dict[str, Any]]) -> bytes:
+        return self._rows([[self._cell(row.get(name)) for name in EXPORT_FIELDS] for row in rows])
+    
+    def finish(self) -> bytes:
+        return b""
+    
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        if value is None:
+            return ""
+        if isinstance(value, (list, dict)):
+            return orjson.dumps(value).decode()
+        # Same spelling as the JSON API (Decimal("80.00") -> "80.00", datetimes with "Z")
+        return to_jsonable_python(value)
+    
+    @staticmethod
+    def _rows(rows: Iterable[Iterable[Any]]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+
+
+class _NDJSONEncoder:
+    def start(self) -> bytes:
+        return b""
+    
+    def batch(self, rows: List[Dict[str, Any]]) -> bytes:
+        return b"".join(
+            orjson.dumps(
+                row,
+                default=to_jsonable_python,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_APPEND_NEWLINE
+            )
+            for row in rows
+        )
+    
+    def finish(self) -> bytes:
+        return b""
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file handing over what was written since the last take()."""
+    
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+    
+    def tell(self) -> int:
+        # The Parquet footer records offsets, so this counts everything written
+        return self.position
+    
+    def take(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+class _ParquetEncoder:
+    """One row group per batch, so only a batch is held in memory."""
+    
+    def start(self) -> bytes:
+        self.schema = pa.schema([
+            ("kind", pa.string()),
+            ("id", pa.string()),
+            ("session_date", pa.timestamp("us", tz="UTC")),
+            ("drill_type", pa.string()),
+            ("pair_count", pa.int32()),
+            ("total_pieces", pa.int32()),
+            ("correct_count", pa.int32()),
+            ("recall_accuracy", pa.decimal128(5, 2)),
+            ("accuracy", pa.decimal128(5, 2)),
+            ("average_time", pa.decimal128(10, 3)),
+            ("total_time", pa.decimal128(10, 3)),
+            ("timings", pa.list_(pa.float32())),
+            ("pairs", pa.string()),
+            ("attempts", pa.string()),
+            ("user_recall", pa.string()),
+            ("recall_validation", pa.string()),
+            ("vividness", pa.int32()),
+            ("flow", pa.int32()),
+            ("notes", pa.string()),
+            ("created_at", pa.timestamp("us", tz="UTC"))
+        ])
+        self.sink = _ChunkSink()
+        self.writer = pq.ParquetWriter(self.sink, self.schema, compression="zstd")
+        return self.sink.take()
+    
+    def batch(self, rows: List[Dict[str, Any]]) -> bytes:
+        columns = {name: [row.get(name) for row in rows] for name in EXPORT_FIELDS}
+        columns["id"] = [str(value) for value in columns["id"]]
+        for name in JSON_FIELDS:
+            columns[name] = [None if value is None else orjson.dumps(value).decode() for value in columns[name]]
+        self.writer.write_table(pa.table(columns, schema=self.schema))
+        return self.sink.take()
+    
+    def finish(self) -> bytes:
+        self.writer.close()
+        return self.sink.take()
+
+
+ENCODERS = {"csv": _CSVEncoder, "ndjson": _NDJSONEncoder, "parquet": _ParquetEncoder}
+
+
+async def encode_export(batches: AsyncIterator[List[Dict[str, Any]]], export_format: str) -> AsyncIterator[bytes]:
+    """Encode batches of export rows (see export_repository) as they arrive.
+    
+    Yields one chunk per batch; CSV and Parquet rows are laid out on
+    EXPORT_FIELDS, NDJSON rows keep only their own kind's columns. Parquet
+    batches are encoded in the threadpool: building and compressing a row
+    group is CPU-bound and would otherwise stall the event loop.
+    """
+    encoder = ENCODERS[export_format]()
+    chunk = encoder.start()
+    if chunk:
+        yield chunk
+    async for rows in batches:
+        if export_format == "parquet":
+            chunk = await run_in_threadpool(encoder.batch, rows)
+        else:
+            chunk = encoder.batch(rows)
+        if chunk:
+            yield chunk
+    chunk = encoder.finish()
+    if chunk:
+        yield chunk
@@ -1,8 +1,13 @@
 """Firebase Admin SDK initialization and utilities."""
 
+import hashlib
 import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 import firebase_admin
 from firebase_admin import credentials, auth
+from starlette.concurrency import run_in_threadpool
 from .config import settings
 
 
@@ -19,8 +24,89 @@ def initialize_firebase() -> None:
     })
 
 
+class VerifiedTokenCache:
+    """LRU cache of verified token claims, keyed by token hash.
+    
+    Entries never outlive the token's own ``exp`` claim, so a cached token is
+    accepted exactly as long as Firebase would accept it.
+    """
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.verifications = 0
+        self.verification_seconds_total = 0.0
+        self.verification_seconds_max = 0.0
+    
+    def get(self, key: str) -> Optional[dict]:
+        """Return cached claims if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        claims, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return claims
+    
+    def put(self, key: str, claims: dict) -> None:
+        """Cache claims until the token expires, evicting least recently used entries."""
+        expires_at = float(claims.get('exp', 0))
+        if self.max_size <= 0 or expires_at <= time.time():
+            return
+        self._entries[key] = (claims, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def record_verification(self, seconds: float) -> None:
+        """Track the latency of a full signature verification."""
+        self.verifications += 1
+        self.verification_seconds_total += seconds
+        self.verification_seconds_max = max(self.verification_seconds_max, seconds)
+    
+    def stats(self) -> Dict:
+        """Counters for monitoring."""
+        avg = self.verification_seconds_total / self.verifications if self.verifications else 0.0
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "verifications": self.verifications,
+            "verification_ms_avg": round(avg * 1000, 2),
+            "verification_ms_max": round(self.verification_seconds_max * 1000, 2)
+        }
+
+
+token_cache = VerifiedTokenCache(settings.FIREBASE_TOKEN_CACHE_SIZE)
+
+
 async def verify_firebase_token(id_token: str) -> dict:
-    """Verify Firebase ID token and return decoded claims."""
-    decoded_token = auth.verify_id_token(id_token)
+    """Verify Firebase ID token and return decoded claims.
+    
+    Verified claims are cached per token; cache misses are verified on the
+    threadpool so signature checks don't block the event loop.
+    """
+    key = hashlib.sha256(id_token.encode('utf-8')).hexdigest()
+    decoded_token = token_cache.get(key)
+    if decoded_token is not None:
+        return decoded_token
+    
+    started = time.perf_counter()
+    decoded_token = await run_in_threadpool(auth.verify_id_token, id_token)
+    token_cache.record_verification(time.perf_counter() - started)
+    
+    token_cache.put(key, decoded_token)
     return decoded_token
-
@@ -0,0 +1,38 @@
+"""Idempotency keys for session writes."""
+
+import uuid
+from pydantic import BaseModel
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+# Request header clients may send instead of a session id
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+# Fixed namespace so the same (user, key) always maps to the same session id
+_NAMESPACE = uuid.UUID("6f3b1c52-8d8e-4f55-9a59-2f7e0f6b4c1d")
+
+
+def idempotent_id(user_id: UUID, key: str, index: Optional[int] = None) -> UUID:
+    """Session id derived from a user's Idempotency-Key (and bulk item index).
+
+    Retrying a request with the same key produces the same id, so the insert
+    conflicts with the stored row instead of creating a duplicate.
+    """
+    name = f"{user_id}:{key}" if index is None else f"{user_id}:{key}:{index}"
+    return uuid.uuid5(_NAMESPACE, name)
+
+
+def assign_bulk_ids(user_id: UUID, items: List[Tuple[int, BaseModel]], batch_key: Optional[str] = None) -> None:
+    """Set the id of bulk items that came without one.
+
+    An item's own ``idempotency_key`` gives the id a single POST with that
+    Idempotency-Key gets, so a session keeps its id however it is uploaded.
+    Items without one fall back to the request's key and their index.
+    """
+    for index, item in items:
+        if item.id is not None:
+            continue
+        if item.idempotency_key:
+            item.id = idempotent_id(user_id, item.idempotency_key)
+        elif batch_key:
+            item.id = idempotent_id(user_id, batch_key, index)
@@ -0,0 +1,110 @@
+"""Write-behind buffering of users.last_login.
+
+Authenticated requests no longer write to ``users``. ``get_current_user``
+records the login time here, and a background task flushes all pending
+values in one ``UPDATE ... FROM (VALUES ...)`` statement.
+
+Staleness and loss bounds:
+- ``last_login`` is only refreshed when the stored value is older than
+  LAST_LOGIN_RESOLUTION seconds, so it can lag by up to that much.
+- Pending values are flushed every LAST_LOGIN_FLUSH_INTERVAL seconds and on
+  shutdown. A worker that crashes loses at most one interval of updates;
+  the user's next request after that records a fresh value.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+from uuid import UUID
+from sqlalchemy import update, values, column, or_, DateTime
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from .config import settings
+from .database import AsyncSessionLocal
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginBuffer:
+    """Pending last_login values per user, flushed in bulk."""
+    
+    def __init__(self, resolution_seconds: int):
+        self.resolution = timedelta(seconds=resolution_seconds)
+        self._pending: Dict[UUID, datetime] = {}
+        self.recorded = 0
+        self.skipped = 0
+        self.flushed = 0
+        self.flush_errors = 0
+    
+    def record(self, user: User) -> None:
+        """Queue a last_login update unless the stored value is recent enough."""
+        now = datetime.now(timezone.utc)
+        if user.last_login is not None and now - user.last_login < self.resolution:
+            self.skipped += 1
+            return
+        self._pending[user.id] = now
+        self.recorded += 1
+    
+    async def flush(self) -> int:
+        """Write all pending values in one statement. Returns the number of users flushed."""
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        
+        login_times = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("last_login", DateTime(timezone=True)),
+            name="login_times"
+        ).data(list(pending.items()))
+        
+        stmt = update(User).where(
+            User.id == login_times.c.id,
+            or_(User.last_login.is_(None), User.last_login < login_times.c.last_login)
+        ).values(last_login=login_times.c.last_login).execution_options(synchronize_session=False)
+        
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(stmt)
+                await db.commit()
+        except Exception:
+            self.flush_errors += 1
+            # Put values back so the next flush retries them (newer values win)
+            for user_id, login_time in pending.items():
+                self._pending.setdefault(user_id, login_time)
+            raise
+        
+        self.flushed += len(pending)
+        return len(pending)
+    
+    def stats(self) -> Dict:
+        """Counters for monitoring."""
+        return {
+            "pending": len(self._pending),
+            "recorded": self.recorded,
+            "skipped": self.skipped,
+            "flushed": self.flushed,
+            "flush_errors": self.flush_errors
+        }
+
+
+last_login_buffer = LastLoginBuffer(settings.LAST_LOGIN_RESOLUTION)
+
+
+async def run_last_login_flusher(interval: Optional[float] = None) -> None:
+    """Flush the buffer periodically until cancelled, then flush once more."""
+    interval = interval or settings.LAST_LOGIN_FLUSH_INTERVAL
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            await _flush_logged()
+    finally:
+        await _flush_logged()
+
+
+async def _flush_logged() -> None:
+    """Flush, logging failures (pending values are kept for the next attempt)."""
+    try:
+        await last_login_buffer.flush()
+    except Exception as e:
+        logger.warning("last_login flush failed: %r", e)
@@ -0,0 +1,35 @@
+"""Opaque keyset cursors for listing endpoints."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Sequence, Tuple
+from uuid import UUID
+from fastapi import Response
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(session_date: datetime, row_id: UUID) -> str:
+    """Encode the (session_date, id) key of the last row on a page."""
+    payload = json.dumps([session_date.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor from ``encode_cursor``. Raises ValueError if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        session_date, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(session_date), UUID(row_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def set_next_cursor(response: Response, rows: Sequence, limit: int) -> None:
+    """Set the next-page cursor header when a page came back full."""
+    if rows and len(rows) == limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.session_date, last.id)
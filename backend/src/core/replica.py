@@ -0,0 +1,98 @@
+"""Read-replica routing for read-only repository calls."""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Union
+from uuid import UUID
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from .config import settings
+
+# Session.info key marking reads that may go to the replica
+USE_REPLICA = "use_replica"
+# Session.info key holding the user whose reads must stay on the primary
+PINNED_USER = "pinned_user"
+
+
+class RoutingSession(Session):
+    """Session that sends reads inside ``use_replica`` to the replica engine.
+
+    Everything else (writes, auth lookups, reads not marked read-only) uses
+    the primary bind. Without a replica this behaves like a plain Session.
+    """
+
+    def __init__(self, *args, replica_bind: Optional[Engine] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replica_bind is not None and self.info.get(USE_REPLICA):
+            return self.replica_bind
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def wrote_recently(data_updated_at: Optional[datetime]) -> bool:
+    """Whether a user's session data changed within the read-your-writes window.
+
+    Takes users.data_updated_at, which every session write bumps and which is
+    read from the primary on each request, so a write handled by any worker
+    or container counts. The window should exceed the replica's lag.
+    """
+    if data_updated_at is None:
+        return False
+    if data_updated_at.tzinfo is None:
+        # func.now() without a time zone (SQLite) is UTC
+        data_updated_at = data_updated_at.replace(tzinfo=timezone.utc)
+    age = datetime.now(timezone.utc) - data_updated_at
+    return age < timedelta(seconds=settings.REPLICA_READ_YOUR_WRITES_WINDOW)
+
+
+def pin_to_primary(db: Union[Session, AsyncSession], user_id: UUID) -> None:
+    """Keep ``user_id``'s reads on the primary for the rest of this session."""
+    session = db.sync_session if isinstance(db, AsyncSession) else db
+    session.info[PINNED_USER] = user_id
+
+
+class ReplicaRoutingStats:
+    """Counters of reads sent to the replica vs kept on the primary (per process)."""
+
+    def __init__(self):
+        self.replica_reads = 0
+        self.primary_reads = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        return {
+            "window": settings.REPLICA_READ_YOUR_WRITES_WINDOW,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads
+        }
+
+
+@contextmanager
+def use_replica(db: Union[Session, AsyncSession], user_id: Optional[UUID] = None):
+    """Route reads made in this block to the replica.
+
+    Reads for a ``user_id`` pinned with pin_to_primary() stay on the primary.
+    """
+    session = db.sync_session if isinstance(db, AsyncSession) else db
+    if not getattr(session, "replica_bind", None) or session.info.get(USE_REPLICA):
+        yield
+        return
+
+    if user_id is not None and session.info.get(PINNED_USER) == user_id:
+        routing_stats.primary_reads += 1
+        yield
+        return
+
+    routing_stats.replica_reads += 1
+    session.info[USE_REPLICA] = True
+    try:
+        yield
+    finally:
+        session.info.pop(USE_REPLICA, None)
+
+
+routing_stats = ReplicaRoutingStats()
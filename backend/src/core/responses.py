@@ -0,0 +1,34 @@
+"""orjson-encoded responses and unvalidated ORM-to-dict conversion for list endpoints."""
+
+from typing import Any, Dict, Iterable, List, Type
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson.
+    
+    Decimals, datetimes and other types orjson leaves alone are encoded the
+    way pydantic encodes them (Decimal("80.00") -> "80.00", UTC datetimes
+    with a trailing "Z"), so the bytes match a response_model response.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=to_jsonable_python,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        )
+
+
+def orm_rows(rows: Iterable[Any], schema: Type[BaseModel]) -> List[Dict[str, Any]]:
+    """Read ``schema``'s fields straight off ORM objects or result rows.
+    
+    Skips pydantic validation, so only pass rows loaded from our own tables
+    (already typed by their columns) and return them in an ORJSONResponse;
+    ``schema`` stays the route's response_model for the OpenAPI docs.
+    """
+    names = tuple(schema.model_fields)
+    return [{name: getattr(row, name) for name in names} for row in rows]
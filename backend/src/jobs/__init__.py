@@ -0,0 +1 @@
+"""Maintenance jobs runnable from the command line (``python -m src.jobs.<job>``)."""
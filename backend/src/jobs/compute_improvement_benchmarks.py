@@ -0,0 +1,45 @@
+"""Recompute the population improvement benchmark snapshot.
+
+Run once:        python -m src.jobs.compute_improvement_benchmarks
+Run on schedule: python -m src.jobs.compute_improvement_benchmarks --interval 3600
+"""
+
+import argparse
+import time
+from ..core.database import SessionLocal
+from ..repositories import stats_repository
+
+
+def compute_benchmarks() -> None:
+    """Recompute and store the benchmark snapshot in one transaction."""
+    db = SessionLocal()
+    try:
+        snapshots = stats_repository.refresh_improvement_benchmarks(db)
+        db.commit()
+        for snapshot in snapshots:
+            print(
+                f"{snapshot.sessions} sessions: {snapshot.avg_improvement:+}% "
+                f"({snapshot.user_count} users)",
+                flush=True
+            )
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recompute improvement benchmarks.")
+    parser.add_argument(
+        "--interval", type=int, default=0,
+        help="keep running and recompute every INTERVAL seconds"
+    )
+    args = parser.parse_args()
+    
+    while True:
+        compute_benchmarks()
+        if args.interval <= 0:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Delete duplicate sessions left by retried uploads and rebuild affected rollups.
+
+Run: python -m src.jobs.dedupe_sessions [--dry-run]
+"""
+
+import argparse
+from typing import Set
+from uuid import UUID
+from ..core.database import SessionLocal
+from ..models.session import Session as SessionModel, NotationSession
+from ..repositories import (
+    session_repository, notation_session_repository, stats_rollup_repository, session_storage_repository
+)
+from ..repositories.bulk import release_session_ids
+
+# Rows deleted per statement
+BATCH_SIZE = 1000
+
+
+def dedupe_sessions(dry_run: bool = False) -> dict:
+    """Delete duplicate sessions and notation sessions, keeping the earliest of each."""
+    db = SessionLocal()
+    try:
+        counts = {}
+        users: Set[UUID] = set()
+        for model, kind, find in (
+            (SessionModel, "session", session_repository.find_duplicate_session_ids),
+            (NotationSession, "notation_session", notation_session_repository.find_duplicate_notation_session_ids)
+        ):
+            duplicates = find(db)
+            counts[model.__tablename__] = len(duplicates)
+            users.update(user_id for _, user_id in duplicates)
+            if dry_run:
+                continue
+            
+            ids = [row_id for row_id, _ in duplicates]
+            for start in range(0, len(ids), BATCH_SIZE):
+                db.query(model).filter(
+                    model.id.in_(ids[start:start + BATCH_SIZE])
+                ).delete(synchronize_session=False)
+                session_storage_repository.delete_archived_detail(db, kind, ids[start:start + BATCH_SIZE])
+                release_session_ids(db, kind, ids[start:start + BATCH_SIZE])
+            db.commit()
+        
+        if not dry_run:
+            for user_id in users:
+                # One transaction per user keeps row locks short
+                stats_rollup_repository.rebuild_user_rollup(db, user_id)
+                db.commit()
+        
+        counts["users"] = len(users)
+        return counts
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Delete duplicate sessions and rebuild affected stats rollups.")
+    parser.add_argument("--dry-run", action="store_true", help="only count duplicates")
+    args = parser.parse_args()
+    
+    counts = dedupe_sessions(dry_run=args.dry_run)
+    action = "Found" if args.dry_run else "Deleted"
+    print(
+        f"{action} {counts['sessions']} duplicate session(s) and "
+        f"{counts['notation_sessions']} duplicate notation session(s) for {counts['users']} user(s)",
+        flush=True
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Create upcoming session partitions and archive the detail of old sessions.
+
+Run once:        python -m src.jobs.maintain_session_storage
+Run on schedule: python -m src.jobs.maintain_session_storage --interval 86400
+"""
+
+import argparse
+import time
+from datetime import datetime, timezone
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..repositories import session_storage_repository
+
+
+def maintain_storage(archive_after_months: int, months_ahead: int, batch_size: int) -> None:
+    """Add missing monthly partitions, then archive sessions older than the cutoff."""
+    db = SessionLocal()
+    try:
+        created = session_storage_repository.ensure_monthly_partitions(db, months_ahead=months_ahead)
+        db.commit()
+        for name in created:
+            print(f"Created partition {name}", flush=True)
+        
+        now = datetime.now(timezone.utc)
+        # Archive whole months: everything before the first of the cutoff month
+        cutoff = session_storage_repository.add_months(now.date().replace(day=1), -archive_after_months)
+        counts = session_storage_repository.archive_sessions(
+            db,
+            before=datetime(cutoff.year, cutoff.month, 1, tzinfo=timezone.utc),
+            batch_size=batch_size
+        )
+        print(
+            f"Archived {counts['session']} session(s) and {counts['notation_session']} "
+            f"notation session(s) dated before {cutoff.isoformat()}",
+            flush=True
+        )
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Maintain session partitions and archive old session detail.")
+    parser.add_argument(
+        "--archive-after-months", type=int, default=settings.SESSION_ARCHIVE_AFTER_MONTHS,
+        help="archive detail of sessions older than this many months"
+    )
+    parser.add_argument(
+        "--months-ahead", type=int, default=settings.SESSION_PARTITION_MONTHS_AHEAD,
+        help="create monthly partitions this many months ahead"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000, help="sessions archived per transaction")
+    parser.add_argument(
+        "--interval", type=int, default=0,
+        help="keep running and repeat every INTERVAL seconds"
+    )
+    args = parser.parse_args()
+    
+    while True:
+        maintain_storage(args.archive_after_months, args.months_ahead, args.batch_size)
+        if args.interval <= 0:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Backfill or rebuild per-user stats rollups.
+
+Run: python -m src.jobs.rebuild_stats_rollup [--all] [--user-id UUID]
+"""
+
+import argparse
+from uuid import UUID
+from ..core.database import SessionLocal
+from ..models.user import User
+from ..models.stats import UserStatsRollup
+from ..repositories import stats_rollup_repository
+
+
+def rebuild_rollups(rebuild_all: bool = False, user_id: UUID = None) -> int:
+    """Rebuild rollups, by default only for users that don't have one yet."""
+    db = SessionLocal()
+    try:
+        query = db.query(User.id)
+        if user_id:
+            query = query.filter(User.id == user_id)
+        elif not rebuild_all:
+            query = query.outerjoin(
+                UserStatsRollup, UserStatsRollup.user_id == User.id
+            ).filter(UserStatsRollup.user_id.is_(None))
+        
+        user_ids = [row[0] for row in query.all()]
+        for uid in user_ids:
+            # One transaction per user keeps row locks short
+            stats_rollup_repository.rebuild_user_rollup(db, uid)
+            db.commit()
+        return len(user_ids)
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill per-user stats rollups.")
+    parser.add_argument("--all", action="store_true", help="rebuild every user, not only missing rollups")
+    parser.add_argument("--user-id", type=UUID, help="rebuild a single user")
+    args = parser.parse_args()
+    
+    count = rebuild_rollups(rebuild_all=args.all, user_id=args.user_id)
+    print(f"Rebuilt stats rollup for {count} user(s)", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,18 @@
 """FastAPI main application."""
 
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from .core.config import settings
-from .core.firebase import initialize_firebase
-from .api.routes import users, sessions, notation_sessions, stats
+from .core.compression import add_compression
+from .core.database import (
+    async_engine, async_replica_engine, sync_pool_metrics, async_pool_metrics, replica_pool_metrics
+)
+from .core.replica import routing_stats
+from .core.firebase import initialize_firebase, token_cache
+from .core.last_login import last_login_buffer, run_last_login_flusher
+from .api.routes import users, sessions, notation_sessions, stats, history, export, dashboard
 
 
 @asynccontextmanager
@@ -13,9 +20,15 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
     initialize_firebase()
+    last_login_flusher = asyncio.create_task(run_last_login_flusher())
     yield
-    # Shutdown
-    pass
+    # Shutdown (the flusher writes pending last_login values before exiting)
+    last_login_flusher.cancel()
+    with suppress(asyncio.CancelledError):
+        await last_login_flusher
+    await async_engine.dispose()
+    if async_replica_engine is not None:
+        await async_replica_engine.dispose()
 
 
 app = FastAPI(
@@ -25,6 +38,9 @@ app = FastAPI(
     redirect_slashes=False  # Prevent automatic redirects for trailing slashes
 )
 
+# Compress larger responses (inside CORS so preflights stay uncompressed)
+add_compression(app, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -32,6 +48,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Content-Disposition"],
 )
 
 # Include routers
@@ -39,6 +56,9 @@ app.include_router(users.router, prefix=settings.API_V1_PREFIX)
 app.include_router(sessions.router, prefix=settings.API_V1_PREFIX)
 app.include_router(notation_sessions.router, prefix=settings.API_V1_PREFIX)
 app.include_router(stats.router, prefix=settings.API_V1_PREFIX)
+app.include_router(history.router, prefix=settings.API_V1_PREFIX)
+app.include_router(export.router, prefix=settings.API_V1_PREFIX)
+app.include_router(dashboard.router, prefix=settings.API_V1_PREFIX)
 
 
 @app.get("/health")
@@ -46,3 +66,18 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
+
+@app.get("/metrics")
+async def metrics():
+    """Internal metrics endpoint (not proxied by nginx)."""
+    db_pools = [sync_pool_metrics.stats(), async_pool_metrics.stats()]
+    if async_replica_engine is not None:
+        db_pools.append(replica_pool_metrics.stats())
+    
+    return {
+        "population_stats_cache": stats.population_stats_cache.stats(),
+        "firebase_token_cache": token_cache.stats(),
+        "last_login_buffer": last_login_buffer.stats(),
+        "db_pools": db_pools,
+        "replica_routing": routing_stats.stats()
+    }
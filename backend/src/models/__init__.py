@@ -1,7 +1,9 @@
 """Database models."""
 
 from .user import User
-from .session import Session, NotationSession
+from .session import Session, NotationSession, SessionArchive, SessionId
+from .stats import UserStatsRollup, UserDrillStatsRollup, ImprovementBenchmarkSnapshot
 
-__all__ = ["User", "Session", "NotationSession"]
+__all__ = ["User", "Session", "NotationSession", "SessionArchive", "SessionId", "UserStatsRollup",
+           "UserDrillStatsRollup", "ImprovementBenchmarkSnapshot"]
 
@@ -1,25 +1,44 @@
 """Session models for training data."""
 
-from sqlalchemy import Column, String, Integer, DECIMAL, DateTime, Text, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Integer, DECIMAL, DateTime, Text, ForeignKey, REAL
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.sql import func
 import uuid
 
 from ..core.database import Base
 
 
+class Float32Array(TypeDecorator):
+    """real[] column read back as the shortest floats that round-trip (1.1, not 1.100000023841858)."""
+    
+    impl = ARRAY(REAL)
+    cache_ok = True
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return [None if item is None else float(f"{item:.7g}") for item in value]
+
+
 class Session(Base):
-    """Training session model."""
+    """Training session model.
+    
+    Partitioned by month on session_date, which is therefore part of the
+    primary key. ``archived_at`` is set once pairs and recall detail have
+    moved to SessionArchive.
+    """
     
     __tablename__ = "sessions"
+    __table_args__ = {"postgresql_partition_by": "RANGE (session_date)"}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    session_date = Column(DateTime(timezone=True), nullable=False)
+    session_date = Column(DateTime(timezone=True), primary_key=True)
     drill_type = Column(String(50), nullable=False)
     pair_count = Column(Integer, nullable=False)
     pairs = Column(JSONB, nullable=False)
-    timings = Column(JSONB, nullable=False)
+    timings = Column(Float32Array, nullable=False)  # seconds per pair, in pair order
     average_time = Column(DECIMAL(10, 3), nullable=False)
     total_time = Column(DECIMAL(10, 3))
     recall_accuracy = Column(DECIMAL(5, 2), nullable=False)
@@ -29,16 +48,18 @@ class Session(Base):
     flow = Column(Integer)
     notes = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    archived_at = Column(DateTime(timezone=True))
 
 
 class NotationSession(Base):
-    """Notation training session model."""
+    """Notation training session model (partitioned and archived like Session)."""
     
     __tablename__ = "notation_sessions"
+    __table_args__ = {"postgresql_partition_by": "RANGE (session_date)"}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    session_date = Column(DateTime(timezone=True), nullable=False)
+    session_date = Column(DateTime(timezone=True), primary_key=True)
     drill_type = Column(String(50), nullable=False)
     attempts = Column(JSONB, nullable=False)
     total_pieces = Column(Integer, nullable=False)
@@ -48,4 +69,30 @@ class NotationSession(Base):
     total_time = Column(DECIMAL(10, 3))
     notes = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    archived_at = Column(DateTime(timezone=True))
+
+
+class SessionArchive(Base):
+    """Detail payload moved out of an old session row by the archival job."""
+    
+    __tablename__ = "session_archive"
+    
+    kind = Column(String(20), primary_key=True)  # "session" or "notation_session"
+    session_id = Column(UUID(as_uuid=True), primary_key=True)
+    payload = Column(JSONB, nullable=False)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
+
+class SessionId(Base):
+    """Owner of every session id.
+    
+    The partitioned tables can only enforce (id, session_date) as unique, so
+    ids are claimed here first: an id is stored once per kind whatever the
+    session's date.
+    """
+    
+    __tablename__ = "session_ids"
+    
+    kind = Column(String(20), primary_key=True)  # "session" or "notation_session"
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -0,0 +1,65 @@
+"""Per-user statistics rollup models."""
+
+from sqlalchemy import Column, String, Integer, DECIMAL, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from ..core.database import Base
+
+
+class UserStatsRollup(Base):
+    """Running totals of a user's sessions, maintained on every write."""
+    
+    __tablename__ = "user_stats_rollup"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    session_count = Column(Integer, nullable=False, default=0, server_default="0")
+    notation_session_count = Column(Integer, nullable=False, default=0, server_default="0")
+    total_pairs = Column(Integer, nullable=False, default=0, server_default="0")
+    session_accuracy_sum = Column(DECIMAL(14, 2), nullable=False, default=0, server_default="0")
+    notation_accuracy_sum = Column(DECIMAL(14, 2), nullable=False, default=0, server_default="0")
+    session_speed_sum = Column(DECIMAL(16, 3), nullable=False, default=0, server_default="0")
+    best_accuracy = Column(DECIMAL(5, 2))
+    best_speed = Column(DECIMAL(10, 3))
+    best_quality = Column(Integer)
+    current_streak = Column(Integer, nullable=False, default=0, server_default="0")
+    longest_streak = Column(Integer, nullable=False, default=0, server_default="0")
+    last_session_date = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    drill_stats = relationship(
+        "UserDrillStatsRollup",
+        lazy="joined",
+        order_by="UserDrillStatsRollup.drill_type",
+        cascade="all, delete-orphan"
+    )
+
+
+class UserDrillStatsRollup(Base):
+    """Running totals of a user's sessions for a single drill type."""
+    
+    __tablename__ = "user_drill_stats_rollup"
+    
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("user_stats_rollup.user_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    drill_type = Column(String(50), primary_key=True)
+    session_count = Column(Integer, nullable=False, default=0, server_default="0")
+    accuracy_sum = Column(DECIMAL(14, 2), nullable=False, default=0, server_default="0")
+    speed_sum = Column(DECIMAL(16, 3), nullable=False, default=0, server_default="0")
+    best_accuracy = Column(DECIMAL(5, 2))
+    best_speed = Column(DECIMAL(10, 3))
+
+
+class ImprovementBenchmarkSnapshot(Base):
+    """Precomputed population accuracy improvement after N sessions."""
+    
+    __tablename__ = "improvement_benchmarks"
+    
+    sessions = Column(Integer, primary_key=True)
+    avg_improvement = Column(DECIMAL(6, 2), nullable=False)
+    user_count = Column(Integer, nullable=False)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
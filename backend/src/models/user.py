@@ -1,6 +1,6 @@
 """User model definition."""
 
-from sqlalchemy import Column, String, DateTime, Boolean
+from sqlalchemy import Column, String, DateTime, Boolean, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -22,4 +22,7 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     last_login = Column(DateTime(timezone=True))
     is_active = Column(Boolean, default=True)
+    # Bumped with every session write; the ETag of the user's list and stats responses
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")
+    data_updated_at = Column(DateTime(timezone=True))
 
@@ -4,6 +4,11 @@ from . import user_repository
 from . import session_repository
 from . import notation_session_repository
 from . import stats_repository
+from . import stats_rollup_repository
+from . import session_storage_repository
+from . import history_repository
+from . import export_repository
 
-__all__ = ["user_repository", "session_repository", "notation_session_repository", "stats_repository"]
+__all__ = ["user_repository", "session_repository", "notation_session_repository", "stats_repository", "stats_rollup_repository",
+           "session_storage_repository", "history_repository", "export_repository"]
 
@@ -0,0 +1,17 @@
+"""Async repositories for use with an AsyncSession.
+
+Each function runs the matching sync repository function through
+``AsyncSession.run_sync``. The sync code runs in a greenlet while the asyncpg
+driver does the I/O, so database waits yield to the event loop and the query
+logic stays defined in one place.
+"""
+
+from . import user_repository
+from . import session_repository
+from . import notation_session_repository
+from . import stats_repository
+from . import history_repository
+from . import export_repository
+
+__all__ = ["user_repository", "session_repository", "notation_session_repository", "stats_repository", "history_repository",
+           "export_repository"]
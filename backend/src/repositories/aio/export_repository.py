@@ -0,0 +1,29 @@
+"""Async export repository."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, AsyncIterator, Dict, List, Optional
+from datetime import datetime
+from uuid import UUID
+from ...core.replica import use_replica
+from .. import export_repository
+
+
+async def stream_user_export(
+    db: AsyncSession,
+    user_id: UUID,
+    batch_size: int = 1000,
+    drill_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield a user's sessions, then notation sessions, in batches of row dicts (replica when configured).
+    
+    Unlike the other async functions this can't go through run_sync: rows
+    come from ``AsyncSession.stream`` (a server-side cursor) as they're read.
+    """
+    with use_replica(db, user_id):
+        for kind in export_repository.EXPORT_COLUMNS:
+            query = export_repository.user_export_query(kind, user_id, drill_type, start_date, end_date)
+            result = await db.stream(query.execution_options(yield_per=batch_size))
+            async for batch in result.mappings().partitions():
+                yield [dict(row) for row in batch]
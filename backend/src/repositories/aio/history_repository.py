@@ -0,0 +1,31 @@
+"""Async history repository."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.engine import Row
+from typing import List, Optional, Tuple
+from datetime import datetime
+from uuid import UUID
+from ...core.replica import use_replica
+from .. import history_repository
+
+
+async def get_user_history(
+    db: AsyncSession,
+    user_id: UUID,
+    limit: int = 100,
+    drill_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    after: Optional[Tuple[datetime, UUID]] = None
+) -> List[Row]:
+    """Get a page of a user's sessions and notation sessions, newest first (replica when configured)."""
+    with use_replica(db, user_id):
+        return await db.run_sync(
+            history_repository.get_user_history,
+            user_id,
+            limit=limit,
+            drill_type=drill_type,
+            start_date=start_date,
+            end_date=end_date,
+            after=after
+        )
@@ -0,0 +1,60 @@
+"""Async notation session repository."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+from datetime import datetime
+from uuid import UUID
+from ...core.replica import use_replica
+from ...models.session import NotationSession
+from ...schemas.session import NotationSessionCreate
+from .. import notation_session_repository
+
+
+async def create_notation_session(
+    db: AsyncSession,
+    user_id: UUID,
+    session_data: NotationSessionCreate
+) -> Tuple[Optional[NotationSession], bool]:
+    """Create a new notation training session, or return the stored one for a retried id."""
+    return await db.run_sync(notation_session_repository.create_notation_session, user_id, session_data)
+
+
+async def create_notation_sessions_bulk(
+    db: AsyncSession,
+    user_id: UUID,
+    sessions: List[Tuple[int, NotationSessionCreate]]
+) -> Tuple[List[Tuple[int, UUID, bool]], List[Tuple[int, str]]]:
+    """Insert a batch of ``(index, notation session)`` in one transaction."""
+    return await db.run_sync(notation_session_repository.create_notation_sessions_bulk, user_id, sessions)
+
+
+async def get_notation_session_by_id(db: AsyncSession, session_id: UUID) -> Optional[NotationSession]:
+    """Get notation session by ID."""
+    return await db.run_sync(notation_session_repository.get_notation_session_by_id, session_id)
+
+
+async def get_user_notation_sessions(
+    db: AsyncSession,
+    user_id: UUID,
+    skip: int = 0,
+    limit: int = 100,
+    drill_type: Optional[str] = None,
+    after: Optional[Tuple[datetime, UUID]] = None,
+    summary: bool = False
+) -> List[NotationSession]:
+    """Get all notation sessions for a user with optional filters (replica when configured)."""
+    with use_replica(db, user_id):
+        return await db.run_sync(
+            notation_session_repository.get_user_notation_sessions,
+            user_id,
+            skip=skip,
+            limit=limit,
+            drill_type=drill_type,
+            after=after,
+            summary=summary
+        )
+
+
+async def delete_notation_session(db: AsyncSession, session_id: UUID) -> None:
+    """Delete a notation session."""
+    await db.run_sync(notation_session_repository.delete_notation_session, session_id)
@@ -0,0 +1,64 @@
+"""Async session repository."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+from datetime import datetime
+from uuid import UUID
+from ...core.replica import use_replica
+from ...models.session import Session as SessionModel
+from ...schemas.session import SessionCreate
+from .. import session_repository
+
+
+async def create_session(
+    db: AsyncSession,
+    user_id: UUID,
+    session_data: SessionCreate
+) -> Tuple[Optional[SessionModel], bool]:
+    """Create a new training session, or return the stored one for a retried id."""
+    return await db.run_sync(session_repository.create_session, user_id, session_data)
+
+
+async def create_sessions_bulk(
+    db: AsyncSession,
+    user_id: UUID,
+    sessions: List[Tuple[int, SessionCreate]]
+) -> Tuple[List[Tuple[int, UUID, bool]], List[Tuple[int, str]]]:
+    """Insert a batch of ``(index, session)`` in one transaction."""
+    return await db.run_sync(session_repository.create_sessions_bulk, user_id, sessions)
+
+
+async def get_session_by_id(db: AsyncSession, session_id: UUID) -> Optional[SessionModel]:
+    """Get session by ID."""
+    return await db.run_sync(session_repository.get_session_by_id, session_id)
+
+
+async def get_user_sessions(
+    db: AsyncSession,
+    user_id: UUID,
+    skip: int = 0,
+    limit: int = 100,
+    drill_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    after: Optional[Tuple[datetime, UUID]] = None,
+    summary: bool = False
+) -> List[SessionModel]:
+    """Get all sessions for a user with optional filters (replica when configured)."""
+    with use_replica(db, user_id):
+        return await db.run_sync(
+            session_repository.get_user_sessions,
+            user_id,
+            skip=skip,
+            limit=limit,
+            drill_type=drill_type,
+            start_date=start_date,
+            end_date=end_date,
+            after=after,
+            summary=summary
+        )
+
+
+async def delete_session(db: AsyncSession, session_id: UUID) -> None:
+    """Delete a session."""
+    await db.run_sync(session_repository.delete_session, session_id)
@@ -0,0 +1,60 @@
+"""Async stats repository. Every stats query is read-only and uses the replica when configured."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Optional
+from datetime import datetime
+from uuid import UUID
+from ...core.replica import use_replica
+from .. import stats_repository
+
+
+async def get_user_stats(db: AsyncSession, user_id: UUID) -> Dict:
+    """Calculate user-specific statistics from the user's stats rollup."""
+    with use_replica(db, user_id):
+        return await db.run_sync(stats_repository.get_user_stats, user_id)
+
+
+async def get_user_streak(db: AsyncSession, user_id: UUID) -> Dict:
+    """Get current and longest practice streaks without computing full stats."""
+    with use_replica(db, user_id):
+        return await db.run_sync(stats_repository.get_user_streak, user_id)
+
+
+async def get_user_timeseries(
+    db: AsyncSession,
+    user_id: UUID,
+    bucket: str = "day",
+    drill_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    max_points: Optional[int] = None
+) -> List[Dict]:
+    """Bucket a user's sessions by day, week or month (UTC) per drill type."""
+    with use_replica(db, user_id):
+        return await db.run_sync(
+            stats_repository.get_user_timeseries,
+            user_id,
+            bucket=bucket,
+            drill_type=drill_type,
+            start_date=start_date,
+            end_date=end_date,
+            max_points=max_points
+        )
+
+
+async def get_user_timing_profile(db: AsyncSession, user_id: UUID, drill_type: Optional[str] = None) -> List[Dict]:
+    """Average and percentile recall time per pair position across a user's sessions."""
+    with use_replica(db, user_id):
+        return await db.run_sync(stats_repository.get_user_timing_profile, user_id, drill_type=drill_type)
+
+
+async def get_population_stats(db: AsyncSession, min_users: int = 1) -> Optional[Dict]:
+    """Calculate population-wide statistics (aggregate across all users)."""
+    with use_replica(db):
+        return await db.run_sync(stats_repository.get_population_stats, min_users=min_users)
+
+
+async def get_population_histogram(db: AsyncSession, metric: str, bins: int = 20) -> Optional[Dict]:
+    """Bucket a population metric (accuracy, speed or quality) into equal-width bins."""
+    with use_replica(db):
+        return await db.run_sync(stats_repository.get_population_histogram, metric, bins=bins)
@@ -0,0 +1,33 @@
+"""Async user repository."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from uuid import UUID
+from ...models.user import User
+from ...schemas.user import UserCreate, UserUpdate
+from .. import user_repository
+
+
+async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
+    """Get user by ID."""
+    return await db.run_sync(user_repository.get_user_by_id, user_id)
+
+
+async def get_user_by_firebase_uid(db: AsyncSession, firebase_uid: str) -> Optional[User]:
+    """Get user by Firebase UID."""
+    return await db.run_sync(user_repository.get_user_by_firebase_uid, firebase_uid)
+
+
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+    """Get user by email."""
+    return await db.run_sync(user_repository.get_user_by_email, email)
+
+
+async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
+    """Create a new user."""
+    return await db.run_sync(user_repository.create_user, user_data)
+
+
+async def update_user(db: AsyncSession, user_id: UUID, user_data: UserUpdate) -> Optional[User]:
+    """Update user profile."""
+    return await db.run_sync(user_repository.update_user, user_id, user_data)
@@ -0,0 +1,114 @@
+"""Idempotent multi-row inserts with per-row error isolation."""
+
+import uuid
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError
+from typing import Any, Dict, Iterable, List, Set, Tuple
+from uuid import UUID
+from ..models.session import SessionId
+
+
+def row_values(user_id: UUID, data: BaseModel) -> Dict[str, Any]:
+    """Column values for a create schema, assigning an id when the client sent none."""
+    values = {"user_id": user_id, **data.model_dump()}
+    if values.get("id") is None:
+        values["id"] = uuid.uuid4()
+    return values
+
+
+def claim_session_ids(db: Session, kind: str, user_id: UUID, ids: Iterable[UUID]) -> Tuple[Set[UUID], Set[UUID]]:
+    """Register ``ids`` of one kind for a user in session_ids.
+    
+    Returns ``(claimed, owned)``: the ids registered now, and the ids this
+    user had already registered (retries). Any other id belongs to another
+    user. The caller commits.
+    """
+    ids = list(dict.fromkeys(ids))
+    claimed = set(db.scalars(
+        pg_insert(SessionId)
+        .values([{"kind": kind, "id": session_id, "user_id": user_id} for session_id in ids])
+        .on_conflict_do_nothing(index_elements=["kind", "id"])
+        .returning(SessionId.id)
+    ))
+    taken = [session_id for session_id in ids if session_id not in claimed]
+    owned = set(db.scalars(
+        select(SessionId.id).where(
+            SessionId.kind == kind,
+            SessionId.id.in_(taken),
+            SessionId.user_id == user_id
+        )
+    )) if taken else set()
+    return claimed, owned
+
+
+def release_session_ids(db: Session, kind: str, ids: Iterable[UUID]) -> None:
+    """Unregister the ids of deleted sessions. The caller commits."""
+    ids = list(ids)
+    if ids:
+        db.execute(delete(SessionId).where(SessionId.kind == kind, SessionId.id.in_(ids)))
+
+
+def insert_rows(
+    db: Session,
+    model,
+    kind: str,
+    user_id: UUID,
+    rows: List[Tuple[int, Dict[str, Any]]]
+) -> Tuple[List[Tuple[int, UUID, bool]], List[Tuple[int, str]]]:
+    """Insert a user's ``(index, values)`` rows with one INSERT for the batch.
+    
+    Every row carries its ``id``, claimed in session_ids first. A row whose
+    id this user already stored is a retry and reported as existing rather
+    than written again; an id stored for another user is an error. If the
+    database rejects the batch (e.g. a value too long for its column), rows
+    are retried one by one in savepoints so only the bad rows fail.
+    
+    Returns ``(index, id, existing)`` for stored rows and ``(index, error)``
+    for rejected ones. The caller commits.
+    """
+    if not rows:
+        return [], []
+    
+    try:
+        with db.begin_nested():
+            return _insert_batch(db, model, kind, user_id, rows)
+    except DBAPIError:
+        pass
+    
+    stored: List[Tuple[int, UUID, bool]] = []
+    errors: List[Tuple[int, str]] = []
+    for index, values in rows:
+        try:
+            with db.begin_nested():
+                row_stored, row_errors = _insert_batch(db, model, kind, user_id, [(index, values)])
+        except DBAPIError as e:
+            row_stored, row_errors = [], [(index, str(e.orig).strip().splitlines()[0])]
+        stored.extend(row_stored)
+        errors.extend(row_errors)
+    return stored, errors
+
+
+def _insert_batch(db: Session, model, kind: str, user_id: UUID, rows: List[Tuple[int, Dict[str, Any]]]):
+    """Claim the rows' ids and insert the rows whose id was new."""
+    claimed, owned = claim_session_ids(db, kind, user_id, [values["id"] for _, values in rows])
+    
+    stored, errors, new_rows = [], [], []
+    new_ids: Set[UUID] = set()
+    for index, values in rows:
+        session_id = values["id"]
+        if session_id in claimed and session_id not in new_ids:
+            new_ids.add(session_id)
+            new_rows.append(values)
+            stored.append((index, session_id, False))
+        elif session_id in owned or session_id in new_ids:
+            # Stored earlier, or earlier in this batch
+            stored.append((index, session_id, True))
+        else:
+            errors.append((index, "Session id already in use"))
+    
+    if new_rows:
+        db.execute(insert(model), new_rows)
+    return stored, errors
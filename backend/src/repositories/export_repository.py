@@ -0,0 +1,57 @@
+"""Full-history export queries for sessions and notation sessions."""
+
+from sqlalchemy import select, literal
+from sqlalchemy.sql import Select
+from typing import Optional
+from datetime import datetime
+from uuid import UUID
+from ..models.session import SessionArchive
+from .session_storage_repository import ARCHIVED_DETAIL, archive_join, archived_detail_column
+
+# Exported columns per kind, in output order
+EXPORT_COLUMNS = {
+    "session": (
+        "id", "session_date", "drill_type", "pair_count", "pairs", "timings", "average_time", "total_time",
+        "recall_accuracy", "user_recall", "recall_validation", "vividness", "flow", "notes", "created_at"
+    ),
+    "notation_session": (
+        "id", "session_date", "drill_type", "total_pieces", "correct_count", "accuracy", "attempts",
+        "average_time", "total_time", "notes", "created_at"
+    )
+}
+
+
+def user_export_query(
+    kind: str,
+    user_id: UUID,
+    drill_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> Select:
+    """Select one kind of a user's sessions for export, oldest first.
+    
+    Archived sessions get their detail from session_archive in the same
+    query, so rows can be streamed without a lookup per session.
+    """
+    model, cleared = ARCHIVED_DETAIL[kind]
+    columns = [literal(kind).label("kind")]
+    for name in EXPORT_COLUMNS[kind]:
+        if name in cleared:
+            columns.append(archived_detail_column(kind, name).label(name))
+        else:
+            columns.append(getattr(model, name))
+    
+    query = select(*columns).select_from(model).outerjoin(
+        SessionArchive, archive_join(kind)
+    ).where(model.user_id == user_id)
+    
+    if drill_type:
+        query = query.where(model.drill_type == drill_type)
+    
+    if start_date:
+        query = query.where(model.session_date >= start_date)
+    
+    if end_date:
+        query = query.where(model.session_date <= end_date)
+    
+    return query.order_by(model.session_date, model.id)
@@ -0,0 +1,87 @@
+"""Merged, date-ordered history of sessions and notation sessions."""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, union_all, literal, tuple_
+from sqlalchemy.engine import Row
+from typing import List, Optional, Tuple
+from datetime import datetime
+from uuid import UUID
+from ..models.session import Session as SessionModel, NotationSession
+
+
+def _history_branch(
+    model,
+    kind: str,
+    item_count,
+    accuracy,
+    user_id: UUID,
+    limit: int,
+    drill_type: Optional[str],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    after: Optional[Tuple[datetime, UUID]]
+):
+    """One page of a single session table in history order, as a subquery."""
+    query = select(
+        literal(kind).label("kind"),
+        model.id,
+        model.session_date,
+        model.drill_type,
+        item_count.label("item_count"),
+        accuracy.label("accuracy"),
+        model.average_time,
+        model.total_time,
+        model.created_at
+    ).where(model.user_id == user_id)
+    
+    if drill_type:
+        query = query.where(model.drill_type == drill_type)
+    
+    if start_date:
+        query = query.where(model.session_date >= start_date)
+    
+    if end_date:
+        query = query.where(model.session_date <= end_date)
+    
+    if after:
+        query = query.where(tuple_(model.session_date, model.id) < tuple_(
+            *after, types=[model.session_date.type, model.id.type]
+        ))
+    
+    # Walks idx_<table>_user_date_id and stops after one page
+    return query.order_by(model.session_date.desc(), model.id.desc()).limit(limit).subquery(kind)
+
+
+def get_user_history(
+    db: Session,
+    user_id: UUID,
+    limit: int = 100,
+    drill_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    after: Optional[Tuple[datetime, UUID]] = None
+) -> List[Row]:
+    """Get a page of a user's sessions and notation sessions, newest first.
+    
+    Each table contributes at most ``limit`` rows past the ``after`` key, so
+    the UNION ALL merges two short index-ordered pages rather than either
+    full list. Rows carry ``kind`` ("session" or "notation_session") and the
+    columns both tables share.
+    """
+    filters = dict(
+        user_id=user_id, limit=limit, drill_type=drill_type,
+        start_date=start_date, end_date=end_date, after=after
+    )
+    branches = [
+        _history_branch(
+            SessionModel, "session", SessionModel.pair_count, SessionModel.recall_accuracy, **filters
+        ),
+        _history_branch(
+            NotationSession, "notation_session", NotationSession.total_pieces, NotationSession.accuracy, **filters
+        )
+    ]
+    history = union_all(*[select(branch) for branch in branches]).subquery("history")
+    
+    return db.execute(
+        select(history).order_by(history.c.session_date.desc(), history.c.id.desc()).limit(limit)
+    ).all()
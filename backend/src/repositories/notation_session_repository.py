@@ -1,31 +1,71 @@
 """Notation session repository for data access."""
 
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import tuple_, func, select, insert, cast, Text
+from typing import List, Optional, Tuple
+from datetime import datetime
 from uuid import UUID
-from ..models.session import NotationSession
+from ..models.session import NotationSession, SessionArchive
 from ..schemas.session import NotationSessionCreate
+from . import stats_rollup_repository, session_storage_repository
+from .bulk import insert_rows, row_values, claim_session_ids, release_session_ids
+
+# Scalar columns loaded for list summaries (no JSONB or free text)
+SUMMARY_COLUMNS = (
+    NotationSession.id, NotationSession.user_id, NotationSession.session_date, NotationSession.drill_type,
+    NotationSession.total_pieces, NotationSession.correct_count, NotationSession.accuracy,
+    NotationSession.average_time, NotationSession.total_time, NotationSession.created_at
+)
 
 
 def create_notation_session(
-    db: Session, 
-    user_id: UUID, 
+    db: Session,
+    user_id: UUID,
     session_data: NotationSessionCreate
-) -> NotationSession:
-    """Create a new notation training session."""
-    session = NotationSession(
-        user_id=user_id,
-        **session_data.model_dump()
-    )
-    db.add(session)
+) -> Tuple[Optional[NotationSession], bool]:
+    """Create a new notation training session, or return the stored one for a retried id.
+    
+    The id is claimed in session_ids first, so a retry with the same client
+    id (whatever its session_date) writes nothing. Returns the session and
+    whether it was created; the session is None if the id belongs to another
+    user.
+    """
+    values = row_values(user_id, session_data)
+    claimed, owned = claim_session_ids(db, "notation_session", user_id, [values["id"]])
+    if not claimed:
+        return (get_notation_session_by_id(db, values["id"]) if owned else None), False
+    
+    session = db.scalars(insert(NotationSession).values(**values).returning(NotationSession)).first()
+    stats_rollup_repository.record_notation_session(db, session)
     db.commit()
     db.refresh(session)
-    return session
+    return session, True
+
+
+def create_notation_sessions_bulk(
+    db: Session,
+    user_id: UUID,
+    sessions: List[Tuple[int, NotationSessionCreate]]
+) -> Tuple[List[Tuple[int, UUID, bool]], List[Tuple[int, str]]]:
+    """Insert a batch of ``(index, notation session)`` in one transaction.
+    
+    Returns ``(index, id, existing)`` for stored rows and ``(index, error)``
+    for rejected rows.
+    """
+    created, errors = insert_rows(db, NotationSession, "notation_session", user_id, [
+        (index, row_values(user_id, session_data)) for index, session_data in sessions
+    ])
+    if any(not existing for _, _, existing in created):
+        stats_rollup_repository.rebuild_user_rollup(db, user_id)
+    db.commit()
+    return created, errors
 
 
 def get_notation_session_by_id(db: Session, session_id: UUID) -> Optional[NotationSession]:
-    """Get notation session by ID."""
-    return db.query(NotationSession).filter(NotationSession.id == session_id).first()
+    """Get notation session by ID, with archived detail restored."""
+    session = db.query(NotationSession).filter(NotationSession.id == session_id).first()
+    session_storage_repository.restore_archived_detail(db, session)
+    return session
 
 
 def get_user_notation_sessions(
@@ -33,15 +73,39 @@ def get_user_notation_sessions(
     user_id: UUID,
     skip: int = 0,
     limit: int = 100,
-    drill_type: Optional[str] = None
+    drill_type: Optional[str] = None,
+    after: Optional[Tuple[datetime, UUID]] = None,
+    summary: bool = False
 ) -> List[NotationSession]:
-    """Get all notation sessions for a user with optional filters."""
+    """Get all notation sessions for a user with optional filters, newest first.
+    
+    ``after`` is the (session_date, id) of the last row already returned;
+    when given, ``skip`` is ignored.
+    With ``summary``, only SUMMARY_COLUMNS are loaded; otherwise archived
+    attempts are restored from the same query.
+    """
     query = db.query(NotationSession).filter(NotationSession.user_id == user_id)
     
+    if summary:
+        query = query.options(load_only(*SUMMARY_COLUMNS, raiseload=True))
+    else:
+        query = session_storage_repository.with_archived_detail(query, "notation_session")
+    
     if drill_type:
         query = query.filter(NotationSession.drill_type == drill_type)
     
-    return query.order_by(NotationSession.session_date.desc()).offset(skip).limit(limit).all()
+    if after:
+        query = query.filter(tuple_(NotationSession.session_date, NotationSession.id) < tuple_(
+            *after, types=[NotationSession.session_date.type, NotationSession.id.type]
+        ))
+    
+    query = query.order_by(NotationSession.session_date.desc(), NotationSession.id.desc())
+    
+    if not after:
+        query = query.offset(skip)
+    
+    rows = query.limit(limit).all()
+    return rows if summary else session_storage_repository.restore_archived_rows(rows)
 
 
 def delete_notation_session(db: Session, session_id: UUID) -> None:
@@ -49,5 +113,40 @@ def delete_notation_session(db: Session, session_id: UUID) -> None:
     session = get_notation_session_by_id(db, session_id)
     if session:
         db.delete(session)
+        session_storage_repository.delete_archived_detail(db, "notation_session", [session.id])
+        release_session_ids(db, "notation_session", [session.id])
+        db.flush()
+        stats_rollup_repository.rebuild_user_rollup(db, session.user_id)
         db.commit()
 
+
+def find_duplicate_notation_session_ids(db: Session) -> List[Tuple[UUID, UUID]]:
+    """Find duplicate notation sessions (e.g. from retried uploads before idempotent writes).
+    
+    Rows match on (user_id, session_date, drill_type, md5 of attempts, read from
+    the archive for archived rows). The earliest created row of each group
+    is kept; returns ``(id, user_id)`` of the others.
+    """
+    ranked = select(
+        NotationSession.id,
+        NotationSession.user_id,
+        func.row_number().over(
+            partition_by=(
+                NotationSession.user_id,
+                NotationSession.session_date,
+                NotationSession.drill_type,
+                func.md5(cast(session_storage_repository.archived_detail_column("notation_session", "attempts"), Text))
+            ),
+            order_by=(NotationSession.created_at, NotationSession.id)
+        ).label("position")
+    ).outerjoin(
+        SessionArchive, session_storage_repository.archive_join("notation_session")
+    ).subquery("ranked")
+    
+    return [
+        (row_id, user_id)
+        for row_id, user_id in db.execute(
+            select(ranked.c.id, ranked.c.user_id).where(ranked.c.position > 1)
+        )
+    ]
+
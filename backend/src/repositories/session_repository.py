@@ -1,29 +1,72 @@
 """Session repository for data access."""
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import List, Optional
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import and_, tuple_, func, select, insert, cast, Text
+from typing import List, Optional, Tuple
 from datetime import datetime
 from uuid import UUID
-from ..models.session import Session as SessionModel
+from ..models.session import Session as SessionModel, SessionArchive
 from ..schemas.session import SessionCreate
+from . import stats_rollup_repository, session_storage_repository
+from .bulk import insert_rows, row_values, claim_session_ids, release_session_ids
 
+# Scalar columns loaded for list summaries (no JSONB or free text)
+SUMMARY_COLUMNS = (
+    SessionModel.id, SessionModel.user_id, SessionModel.session_date, SessionModel.drill_type,
+    SessionModel.pair_count, SessionModel.average_time, SessionModel.total_time,
+    SessionModel.recall_accuracy, SessionModel.vividness, SessionModel.flow, SessionModel.created_at
+)
 
-def create_session(db: Session, user_id: UUID, session_data: SessionCreate) -> SessionModel:
-    """Create a new training session."""
-    session = SessionModel(
-        user_id=user_id,
-        **session_data.model_dump()
-    )
-    db.add(session)
+
+def create_session(
+    db: Session,
+    user_id: UUID,
+    session_data: SessionCreate
+) -> Tuple[Optional[SessionModel], bool]:
+    """Create a new training session, or return the stored one for a retried id.
+    
+    The id is claimed in session_ids first, so a retry with the same client
+    id (whatever its session_date) writes nothing. Returns the session and
+    whether it was created; the session is None if the id belongs to another
+    user.
+    """
+    values = row_values(user_id, session_data)
+    claimed, owned = claim_session_ids(db, "session", user_id, [values["id"]])
+    if not claimed:
+        return (get_session_by_id(db, values["id"]) if owned else None), False
+    
+    session = db.scalars(insert(SessionModel).values(**values).returning(SessionModel)).first()
+    stats_rollup_repository.record_session(db, session)
     db.commit()
     db.refresh(session)
-    return session
+    return session, True
+
+
+def create_sessions_bulk(
+    db: Session,
+    user_id: UUID,
+    sessions: List[Tuple[int, SessionCreate]]
+) -> Tuple[List[Tuple[int, UUID, bool]], List[Tuple[int, str]]]:
+    """Insert a batch of ``(index, session)`` in one transaction.
+    
+    Returns ``(index, id, existing)`` for stored rows (``existing`` marks a
+    retried id) and ``(index, error)`` for rejected rows. The rollup is
+    rebuilt once for the whole batch.
+    """
+    created, errors = insert_rows(db, SessionModel, "session", user_id, [
+        (index, row_values(user_id, session_data)) for index, session_data in sessions
+    ])
+    if any(not existing for _, _, existing in created):
+        stats_rollup_repository.rebuild_user_rollup(db, user_id)
+    db.commit()
+    return created, errors
 
 
 def get_session_by_id(db: Session, session_id: UUID) -> Optional[SessionModel]:
-    """Get session by ID."""
-    return db.query(SessionModel).filter(SessionModel.id == session_id).first()
+    """Get session by ID, with archived detail restored."""
+    session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
+    session_storage_repository.restore_archived_detail(db, session)
+    return session
 
 
 def get_user_sessions(
@@ -33,11 +76,25 @@ def get_user_sessions(
     limit: int = 100,
     drill_type: Optional[str] = None,
     start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None,
+    after: Optional[Tuple[datetime, UUID]] = None,
+    summary: bool = False
 ) -> List[SessionModel]:
-    """Get all sessions for a user with optional filters."""
+    """Get all sessions for a user with optional filters, newest first.
+    
+    ``after`` is the (session_date, id) of the last row already returned;
+    when given, the page starts right after it and ``skip`` is ignored.
+    With ``summary``, only SUMMARY_COLUMNS are loaded and other attributes
+    raise instead of lazy loading; otherwise archived detail is restored
+    from the same query.
+    """
     query = db.query(SessionModel).filter(SessionModel.user_id == user_id)
     
+    if summary:
+        query = query.options(load_only(*SUMMARY_COLUMNS, raiseload=True))
+    else:
+        query = session_storage_repository.with_archived_detail(query, "session")
+    
     if drill_type:
         query = query.filter(SessionModel.drill_type == drill_type)
     
@@ -47,7 +104,19 @@ def get_user_sessions(
     if end_date:
         query = query.filter(SessionModel.session_date <= end_date)
     
-    return query.order_by(SessionModel.session_date.desc()).offset(skip).limit(limit).all()
+    if after:
+        query = query.filter(tuple_(SessionModel.session_date, SessionModel.id) < tuple_(
+            *after, types=[SessionModel.session_date.type, SessionModel.id.type]
+        ))
+    
+    # id breaks ties so every row has a unique position for keyset paging
+    query = query.order_by(SessionModel.session_date.desc(), SessionModel.id.desc())
+    
+    if not after:
+        query = query.offset(skip)
+    
+    rows = query.limit(limit).all()
+    return rows if summary else session_storage_repository.restore_archived_rows(rows)
 
 
 def delete_session(db: Session, session_id: UUID) -> None:
@@ -55,5 +124,40 @@ def delete_session(db: Session, session_id: UUID) -> None:
     session = get_session_by_id(db, session_id)
     if session:
         db.delete(session)
+        session_storage_repository.delete_archived_detail(db, "session", [session.id])
+        release_session_ids(db, "session", [session.id])
+        db.flush()
+        stats_rollup_repository.rebuild_user_rollup(db, session.user_id)
         db.commit()
 
+
+def find_duplicate_session_ids(db: Session) -> List[Tuple[UUID, UUID]]:
+    """Find duplicate sessions (e.g. from retried uploads before idempotent writes).
+    
+    Rows match on (user_id, session_date, drill_type, md5 of pairs, read from
+    the archive for archived rows). The earliest created row of each group
+    is kept; returns ``(id, user_id)`` of the others.
+    """
+    ranked = select(
+        SessionModel.id,
+        SessionModel.user_id,
+        func.row_number().over(
+            partition_by=(
+                SessionModel.user_id,
+                SessionModel.session_date,
+                SessionModel.drill_type,
+                func.md5(cast(session_storage_repository.archived_detail_column("session", "pairs"), Text))
+            ),
+            order_by=(SessionModel.created_at, SessionModel.id)
+        ).label("position")
+    ).outerjoin(
+        SessionArchive, session_storage_repository.archive_join("session")
+    ).subquery("ranked")
+    
+    return [
+        (row_id, user_id)
+        for row_id, user_id in db.execute(
+            select(ranked.c.id, ranked.c.user_id).where(ranked.c.position > 1)
+        )
+    ]
+
@@ -0,0 +1,182 @@
+"""Session storage maintenance: monthly partitions and archival of cold detail.
+
+Old sessions keep their scalar columns (dates, counts, accuracy, times) in the
+partitioned tables, which the stats queries scan. Their bulky detail moves to
+``session_archive`` and is put back on the objects whenever sessions are
+read, so API responses look the same before and after archival.
+"""
+
+from sqlalchemy.orm import Session, Query
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import func, select, insert, update, delete, literal, null, tuple_, text, case, and_, JSON
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from datetime import datetime, date, timezone
+from uuid import UUID
+from ..models.session import Session as SessionModel, NotationSession, SessionArchive
+from . import user_repository
+
+# Archive kind -> (model, detail columns with the value left on the hot row)
+ARCHIVED_DETAIL = {
+    "session": (SessionModel, {"pairs": [], "user_recall": null(), "recall_validation": null()}),
+    "notation_session": (NotationSession, {"attempts": []})
+}
+
+
+def archive_kind(session: Union[SessionModel, NotationSession]) -> str:
+    """Archive kind for a session object."""
+    return "session" if isinstance(session, SessionModel) else "notation_session"
+
+
+def archive_join(kind: str):
+    """ON clause joining a session table to its rows in session_archive."""
+    model = ARCHIVED_DETAIL[kind][0]
+    return and_(SessionArchive.kind == kind, SessionArchive.session_id == model.id)
+
+
+def archived_detail_column(kind: str, name: str):
+    """A detail column that reads from session_archive for archived rows.
+    
+    The query must outer-join SessionArchive on archive_join(kind).
+    """
+    model = ARCHIVED_DETAIL[kind][0]
+    column = getattr(model, name)
+    archived = SessionArchive.payload[name]
+    if not isinstance(column.type, JSON):
+        archived = archived.astext
+    return case((model.archived_at.is_(None), column), else_=archived)
+
+
+def archive_sessions(db: Session, before: datetime, batch_size: int = 1000) -> Dict[str, int]:
+    """Move the detail of sessions dated before ``before`` into the archive.
+    
+    Works in batches, committing each one. Returns archived counts per kind.
+    Responses don't change, but the affected users' data_version is bumped
+    so no cached validator outlives the rewrite.
+    """
+    counts = {}
+    for kind, (model, cleared) in ARCHIVED_DETAIL.items():
+        counts[kind] = 0
+        while True:
+            keys = db.execute(
+                select(model.id, model.session_date, model.user_id).where(
+                    model.session_date < before,
+                    model.archived_at.is_(None)
+                ).limit(batch_size)
+            ).all()
+            if not keys:
+                break
+            
+            in_batch = tuple_(model.id, model.session_date).in_([(key.id, key.session_date) for key in keys])
+            payload = func.jsonb_build_object(*[
+                part for column in cleared for part in (literal(column), getattr(model, column))
+            ])
+            db.execute(insert(SessionArchive).from_select(
+                ["kind", "session_id", "payload"],
+                select(literal(kind), model.id, payload).where(in_batch)
+            ))
+            db.execute(
+                update(model).where(in_batch).values(archived_at=func.now(), **cleared),
+                execution_options={"synchronize_session": False}
+            )
+            user_repository.bump_data_versions(db, [key.user_id for key in keys])
+            db.commit()
+            counts[kind] += len(keys)
+    return counts
+
+
+def restore_archived_detail(db: Session, session: Union[SessionModel, NotationSession, None]) -> None:
+    """Put an archived session's detail back on the object (nothing is written)."""
+    if session is None or session.archived_at is None:
+        return
+    
+    kind = archive_kind(session)
+    archive = db.get(SessionArchive, (kind, session.id))
+    if archive is not None:
+        _set_archived_detail(session, kind, archive.payload)
+
+
+def with_archived_detail(query: Query, kind: str) -> Query:
+    """Add each row's archive payload (None unless archived) to a query of one session model.
+    
+    Pass the result rows to restore_archived_rows().
+    """
+    return query.add_columns(SessionArchive.payload).outerjoin(SessionArchive, archive_join(kind))
+
+
+def restore_archived_rows(
+    rows: Iterable[Tuple[Union[SessionModel, NotationSession], Optional[dict]]]
+) -> List[Union[SessionModel, NotationSession]]:
+    """Put the detail back on ``(session, payload)`` rows and return the sessions."""
+    sessions = []
+    for session, payload in rows:
+        if payload is not None:
+            _set_archived_detail(session, archive_kind(session), payload)
+        sessions.append(session)
+    return sessions
+
+
+def _set_archived_detail(session: Union[SessionModel, NotationSession], kind: str, payload: dict) -> None:
+    """Set the archived detail columns as loaded values (nothing is written)."""
+    for column in ARCHIVED_DETAIL[kind][1]:
+        set_committed_value(session, column, payload.get(column))
+
+
+def delete_archived_detail(db: Session, kind: str, session_ids: Iterable[UUID]) -> None:
+    """Delete archive rows for deleted sessions. The caller commits."""
+    session_ids = list(session_ids)
+    if session_ids:
+        db.execute(delete(SessionArchive).where(
+            SessionArchive.kind == kind,
+            SessionArchive.session_id.in_(session_ids)
+        ))
+
+
+def ensure_monthly_partitions(db: Session, months_ahead: int = 3) -> List[str]:
+    """Create missing monthly partitions up to ``months_ahead`` months from now.
+    
+    Returns the names of the partitions created. The caller commits.
+    """
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    created = []
+    for model, _ in ARCHIVED_DETAIL.values():
+        table = model.__tablename__
+        for offset in range(months_ahead + 1):
+            month = add_months(this_month, offset)
+            name = f"{table}_y{month:%Y}m{month:%m}"
+            if db.execute(select(func.to_regclass(name))).scalar() is not None:
+                continue
+            _create_partition(db, table, name, month)
+            created.append(name)
+    return created
+
+
+def _create_partition(db: Session, table: str, name: str, month: date) -> None:
+    """Create one monthly partition, moving its rows out of the default partition.
+    
+    session_date comes from the client, so a skewed clock can store sessions
+    months ahead; they land in ``<table>_default``, where Postgres refuses to
+    create an overlapping partition. The default partition is detached while
+    its rows for the month move over (inserts into ``table`` wait on the lock
+    until the caller commits).
+    """
+    default = f"{table}_default"
+    start = f"'{month.isoformat()} 00:00:00+00'"
+    end = f"'{add_months(month, 1).isoformat()} 00:00:00+00'"
+    in_month = f"session_date >= {start} AND session_date < {end}"
+    partition = f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES FROM ({start}) TO ({end})"
+    
+    if db.execute(text(f"SELECT 1 FROM {default} WHERE {in_month} LIMIT 1")).first() is None:
+        db.execute(text(partition))
+        return
+    
+    db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {default}"))
+    db.execute(text(partition))
+    db.execute(text(f"INSERT INTO {name} SELECT * FROM {default} WHERE {in_month}"))
+    db.execute(text(f"DELETE FROM {default} WHERE {in_month}"))
+    db.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT"))
+
+
+def add_months(month: date, count: int) -> date:
+    """First day of the month ``count`` months after ``month``."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
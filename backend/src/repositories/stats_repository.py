@@ -1,257 +1,290 @@
 """Stats repository for calculating user and population statistics."""
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy.orm import Session, lazyload
+from sqlalchemy import func, desc, select, union_all, cast, null, literal, case, true
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import aggregate_order_by
 from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from uuid import UUID
 from decimal import Decimal
 from ..models.session import Session as SessionModel, NotationSession
 from ..models.user import User
+from ..models.stats import UserStatsRollup, ImprovementBenchmarkSnapshot
+from . import stats_rollup_repository
 
 
 def get_user_stats(db: Session, user_id: UUID) -> Dict:
-    """Calculate user-specific statistics."""
-    # Get all sessions for user
-    sessions = db.query(SessionModel).filter(
-        SessionModel.user_id == user_id
-    ).all()
-    
-    notation_sessions = db.query(NotationSession).filter(
-        NotationSession.user_id == user_id
-    ).all()
+    """Calculate user-specific statistics from the user's stats rollup."""
+    rollup = stats_rollup_repository.get_user_rollup(db, user_id)
+    if rollup is None:
+        # Not backfilled yet - compute the same rollup on the fly
+        rollup = stats_rollup_repository.build_user_rollup(db, user_id)
     
-    total_sessions = len(sessions) + len(notation_sessions)
-    total_pairs = sum(s.pair_count for s in sessions)
-    
-    # Calculate averages
-    if sessions:
-        avg_accuracy = float(sum(s.recall_accuracy for s in sessions) / len(sessions))
-        avg_speed = float(sum(s.average_time for s in sessions) / len(sessions))
-        best_accuracy = float(max(s.recall_accuracy for s in sessions))
-        best_speed = float(min(s.average_time for s in sessions))
-        
-        # Best quality (vividness or flow)
-        quality_scores = [
-            s.vividness or s.flow 
-            for s in sessions 
-            if s.vividness is not None or s.flow is not None
-        ]
-        best_quality = int(max(quality_scores)) if quality_scores else 0
-    else:
-        avg_accuracy = 0.0
-        avg_speed = 0.0
-        best_accuracy = 0.0
-        best_speed = 0.0
-        best_quality = 0
-    
-    # Add notation session accuracy
-    if notation_sessions:
-        notation_avg_accuracy = sum(s.accuracy for s in notation_sessions) / len(notation_sessions)
-        if total_sessions > 0:
-            avg_accuracy = (avg_accuracy * len(sessions) + float(notation_avg_accuracy) * len(notation_sessions)) / total_sessions
-        best_accuracy = max(best_accuracy, float(max(s.accuracy for s in notation_sessions)))
-    
-    # Calculate streak
-    all_sessions = sorted(
-        sessions + notation_sessions,
-        key=lambda s: s.session_date,
-        reverse=True
-    )
+    total_sessions = rollup.session_count + rollup.notation_session_count
+    accuracy_sum = rollup.session_accuracy_sum + rollup.notation_accuracy_sum
     
-    streak_data = _calculate_streak(all_sessions)
+    avg_accuracy = float(accuracy_sum / total_sessions) if total_sessions else 0.0
+    avg_speed = float(rollup.session_speed_sum / rollup.session_count) if rollup.session_count else 0.0
+    best_speed = float(rollup.best_speed) if rollup.session_count else 0.0
     
-    # Calculate drill-specific stats
-    drill_stats = _calculate_drill_stats(sessions, notation_sessions)
+    last_session_date = rollup.last_session_date
     
     return {
         "total_sessions": total_sessions,
-        "total_pairs": total_pairs,
+        "total_pairs": rollup.total_pairs,
         "avg_accuracy": round(avg_accuracy, 2),
         "avg_speed": round(avg_speed, 3),
-        "best_accuracy": round(best_accuracy, 2),
+        "best_accuracy": round(float(rollup.best_accuracy or 0), 2),
         "best_speed": round(best_speed, 3),
-        "best_quality": best_quality,
-        "current_streak": streak_data["current_streak"],
-        "last_session_date": streak_data["last_session_date"].isoformat() if streak_data["last_session_date"] else None,
-        "days_since_last_session": streak_data["days_since_last_session"],
-        "drill_stats": drill_stats
+        "best_quality": int(rollup.best_quality or 0),
+        "current_streak": rollup.current_streak,
+        "last_session_date": last_session_date.isoformat() if last_session_date else None,
+        "days_since_last_session": _days_since(last_session_date),
+        "drill_stats": _drill_stats_from_rollup(rollup)
     }
 
 
-def _calculate_streak(sessions: List) -> Dict:
-    """Calculate current practice streak."""
-    if not sessions:
-        return {
-            "current_streak": 0,
-            "last_session_date": None,
-            "days_since_last_session": 0
-        }
-    
-    last_session_date = sessions[0].session_date
-    last_date = last_session_date.date() if hasattr(last_session_date, 'date') else datetime.fromisoformat(str(last_session_date)).date()
-    today = datetime.now().date()
-    days_since = (today - last_date).days
-    
-    # Calculate streak
-    session_dates = set()
-    for session in sessions:
-        session_date = session.session_date.date() if hasattr(session.session_date, 'date') else datetime.fromisoformat(str(session.session_date)).date()
-        session_dates.add(session_date)
-    
-    current_streak = 0
-    check_date = last_date
-    
-    while check_date in session_dates:
-        current_streak += 1
-        check_date = check_date - timedelta(days=1)
+def get_user_streak(db: Session, user_id: UUID) -> Dict:
+    """Get current and longest practice streaks without computing full stats."""
+    rollup = db.query(UserStatsRollup).options(
+        lazyload(UserStatsRollup.drill_stats)
+    ).filter(UserStatsRollup.user_id == user_id).first()
+    
+    if rollup is None:
+        current_streak, longest_streak = stats_rollup_repository.compute_streaks(db, user_id)
+        last_dates = [
+            db.query(func.max(model.session_date)).filter(model.user_id == user_id).scalar()
+            for model in (SessionModel, NotationSession)
+        ]
+        last_session_date = max((d for d in last_dates if d is not None), default=None)
+    else:
+        current_streak, longest_streak = rollup.current_streak, rollup.longest_streak
+        last_session_date = rollup.last_session_date
     
     return {
         "current_streak": current_streak,
-        "last_session_date": last_session_date,
-        "days_since_last_session": days_since
+        "longest_streak": max(longest_streak, current_streak),
+        "last_session_date": last_session_date.isoformat() if last_session_date else None,
+        "days_since_last_session": _days_since(last_session_date)
     }
 
 
-def _calculate_drill_stats(sessions: List[SessionModel], notation_sessions: List[NotationSession]) -> List[Dict]:
+def _days_since(last_session_date: Optional[datetime]) -> int:
+    """Whole days between the last session and today."""
+    if last_session_date is None:
+        return 0
+    return (datetime.now().date() - last_session_date.date()).days
+
+
+def _drill_stats_from_rollup(rollup: UserStatsRollup) -> List[Dict]:
     """Calculate statistics per drill type."""
-    drill_stats_map: Dict[str, Dict] = {}
-    
-    # Process regular sessions
-    for session in sessions:
-        drill_type = session.drill_type
-        if drill_type not in drill_stats_map:
-            drill_stats_map[drill_type] = {
-                "drill_type": drill_type,
-                "session_count": 0,
-                "best_accuracy": 0.0,
-                "best_speed": float('inf'),
-                "avg_accuracy": 0.0,
-                "avg_speed": 0.0,
-                "accuracies": [],
-                "speeds": []
-            }
-        
-        stats = drill_stats_map[drill_type]
-        stats["session_count"] += 1
-        stats["accuracies"].append(float(session.recall_accuracy))
-        stats["speeds"].append(float(session.average_time))
-        stats["best_accuracy"] = max(stats["best_accuracy"], float(session.recall_accuracy))
-        stats["best_speed"] = min(stats["best_speed"], float(session.average_time))
-    
-    # Process notation sessions
-    for session in notation_sessions:
-        drill_type = session.drill_type
-        if drill_type not in drill_stats_map:
-            drill_stats_map[drill_type] = {
-                "drill_type": drill_type,
-                "session_count": 0,
-                "best_accuracy": 0.0,
-                "best_speed": float('inf'),
-                "avg_accuracy": 0.0,
-                "avg_speed": 0.0,
-                "accuracies": [],
-                "speeds": []
-            }
-        
-        stats = drill_stats_map[drill_type]
-        stats["session_count"] += 1
-        stats["accuracies"].append(float(session.accuracy))
-        stats["speeds"].append(float(session.average_time))
-        stats["best_accuracy"] = max(stats["best_accuracy"], float(session.accuracy))
-        stats["best_speed"] = min(stats["best_speed"], float(session.average_time))
-    
-    # Calculate averages
     result = []
-    for drill_type, stats in drill_stats_map.items():
-        if stats["accuracies"]:
-            stats["avg_accuracy"] = round(sum(stats["accuracies"]) / len(stats["accuracies"]), 2)
-            stats["avg_speed"] = round(sum(stats["speeds"]) / len(stats["speeds"]), 3)
-        if stats["best_speed"] == float('inf'):
-            stats["best_speed"] = 0.0
-        
+    for drill in rollup.drill_stats:
+        count = drill.session_count
         result.append({
-            "drill_type": drill_type,
-            "session_count": stats["session_count"],
-            "best_accuracy": round(stats["best_accuracy"], 2),
-            "best_speed": round(stats["best_speed"], 3),
-            "avg_accuracy": stats["avg_accuracy"],
-            "avg_speed": stats["avg_speed"]
+            "drill_type": drill.drill_type,
+            "session_count": count,
+            "best_accuracy": round(float(drill.best_accuracy or 0), 2),
+            "best_speed": round(float(drill.best_speed or 0), 3),
+            "avg_accuracy": round(float(drill.accuracy_sum / count), 2),
+            "avg_speed": round(float(drill.speed_sum / count), 3)
         })
     
     return result
 
 
-def get_population_stats(db: Session, min_users: int = 1) -> Optional[Dict]:
-    """Calculate population-wide statistics (aggregate across all users)."""
-    # Check if we have enough users
-    user_count = db.query(func.count(User.id)).scalar()
-    if user_count < min_users:
-        return None
+def get_user_timeseries(
+    db: Session,
+    user_id: UUID,
+    bucket: str = "day",
+    drill_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    max_points: Optional[int] = None
+) -> List[Dict]:
+    """Bucket a user's sessions by day, week or month (UTC) per drill type.
+    
+    Both session tables are grouped in SQL with date_trunc, so only one row per
+    bucket and drill type leaves the database. With ``max_points`` each drill's
+    series is downsampled with LTTB on average accuracy.
+    """
+    branches = []
+    for model, accuracy in ((SessionModel, SessionModel.recall_accuracy), (NotationSession, NotationSession.accuracy)):
+        branch = select(
+            model.session_date,
+            model.drill_type,
+            accuracy.label("accuracy"),
+            model.average_time.label("speed")
+        ).where(model.user_id == user_id)
+        if drill_type:
+            branch = branch.where(model.drill_type == drill_type)
+        if start_date:
+            branch = branch.where(model.session_date >= start_date)
+        if end_date:
+            branch = branch.where(model.session_date <= end_date)
+        branches.append(branch)
+    history = union_all(*branches).subquery("history")
+    
+    bucket_start = func.date_trunc(bucket, func.timezone("UTC", history.c.session_date)).label("bucket")
+    rows = db.query(
+        bucket_start,
+        history.c.drill_type,
+        func.count(),
+        func.avg(history.c.accuracy),
+        func.max(history.c.accuracy),
+        func.avg(history.c.speed)
+    ).group_by(
+        bucket_start, history.c.drill_type
+    ).order_by(
+        history.c.drill_type, bucket_start
+    ).all()
     
-    # Get all sessions
-    all_sessions = db.query(SessionModel).all()
-    all_notation_sessions = db.query(NotationSession).all()
+    series: Dict[str, List[Dict]] = {}
+    for bucket_date, row_drill_type, count, avg_accuracy, best_accuracy, avg_speed in rows:
+        series.setdefault(row_drill_type, []).append({
+            "bucket": bucket_date.replace(tzinfo=timezone.utc),
+            "drill_type": row_drill_type,
+            "session_count": count,
+            "avg_accuracy": round(float(avg_accuracy), 2),
+            "best_accuracy": round(float(best_accuracy), 2),
+            "avg_speed": round(float(avg_speed), 3)
+        })
     
-    # Need at least some session data to calculate stats
-    if not all_sessions and not all_notation_sessions:
-        return None
+    points = []
+    for drill_points in series.values():
+        if max_points:
+            drill_points = _lttb(drill_points, max_points)
+        points.extend(drill_points)
+    return points
+
+
+def _lttb(points: List[Dict], threshold: int) -> List[Dict]:
+    """Largest-Triangle-Three-Buckets downsampling of a date-ordered series."""
+    if threshold >= len(points) or threshold < 3:
+        return points
     
-    # Calculate population averages
-    session_accuracies = [float(s.recall_accuracy) for s in all_sessions]
-    session_speeds = [float(s.average_time) for s in all_sessions]
-    notation_accuracies = [float(s.accuracy) for s in all_notation_sessions]
+    def x(point: Dict) -> float:
+        return point["bucket"].timestamp()
     
-    all_accuracies = session_accuracies + notation_accuracies
-    all_speeds = session_speeds
+    def y(point: Dict) -> float:
+        return point["avg_accuracy"]
     
-    avg_accuracy = sum(all_accuracies) / len(all_accuracies) if all_accuracies else 0.0
-    avg_speed = sum(all_speeds) / len(all_speeds) if all_speeds else 0.0
+    sampled = [points[0]]
+    bucket_size = (len(points) - 2) / (threshold - 2)
+    previous = points[0]
     
-    # Calculate quality average
-    quality_scores = [
-        s.vividness or s.flow 
-        for s in all_sessions 
-        if s.vividness is not None or s.flow is not None
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        
+        # Average of the next bucket is the third triangle vertex
+        next_bucket = points[end:min(int((i + 2) * bucket_size) + 1, len(points))] or [points[-1]]
+        avg_x = sum(x(p) for p in next_bucket) / len(next_bucket)
+        avg_y = sum(y(p) for p in next_bucket) / len(next_bucket)
+        
+        chosen = max(
+            points[start:end],
+            key=lambda p: abs(
+                (x(previous) - avg_x) * (y(p) - y(previous))
+                - (x(previous) - x(p)) * (avg_y - y(previous))
+            )
+        )
+        sampled.append(chosen)
+        previous = chosen
+    
+    sampled.append(points[-1])
+    return sampled
+
+
+def get_user_timing_profile(db: Session, user_id: UUID, drill_type: Optional[str] = None) -> List[Dict]:
+    """Average and percentile recall time per pair position across a user's sessions.
+    
+    The real[] timings are unnested WITH ORDINALITY and aggregated in SQL, so
+    only one row per position leaves the database.
+    """
+    timing = func.unnest(SessionModel.timings).table_valued("seconds", with_ordinality="position").render_derived()
+    query = db.query(
+        timing.c.position,
+        func.count(timing.c.seconds),
+        func.avg(timing.c.seconds),
+        func.percentile_cont(postgresql.array(PERCENTILES)).within_group(timing.c.seconds)
+    ).select_from(SessionModel).join(timing, true()).filter(
+        SessionModel.user_id == user_id,
+        timing.c.seconds.isnot(None)
+    )
+    if drill_type:
+        query = query.filter(SessionModel.drill_type == drill_type)
+    
+    return [
+        {
+            "position": position,
+            "count": count,
+            "avg": round(float(avg), 3),
+            "percentiles": _percentile_distribution(values, 3)
+        }
+        for position, count, avg, values in query.group_by(timing.c.position).order_by(timing.c.position)
     ]
-    avg_quality = float(sum(quality_scores) / len(quality_scores)) if quality_scores else 0.0
-    
-    # Calculate percentiles
-    sorted_accuracies = sorted(all_accuracies) if all_accuracies else []
-    sorted_speeds = sorted(all_speeds) if all_speeds else []
-    sorted_qualities = sorted(quality_scores) if quality_scores else []
-    
-    def percentile(data: List[float], p: float) -> float:
-        if not data:
-            return 0.0
-        k = (len(data) - 1) * p
-        f = int(k)
-        c = k - f
-        if f + 1 < len(data):
-            return data[f] + c * (data[f + 1] - data[f])
-        return data[f]
-    
-    accuracy_percentiles = {
-        "p25": round(percentile(sorted_accuracies, 0.25), 2),
-        "p50": round(percentile(sorted_accuracies, 0.50), 2),
-        "p75": round(percentile(sorted_accuracies, 0.75), 2),
-        "p90": round(percentile(sorted_accuracies, 0.90), 2)
+
+
+# Percentiles reported for every population metric
+PERCENTILES = (0.25, 0.50, 0.75, 0.90)
+
+# Session milestones used for improvement benchmarks
+BENCHMARK_SESSION_COUNTS = (5, 10, 25, 50)
+
+# Served until the improvement benchmark job has produced a snapshot
+DEFAULT_IMPROVEMENT_BENCHMARKS = [
+    {
+        "sessions": 5,
+        "avg_improvement": 10.0,
+        "description": "Average users improve 10% accuracy after 5 sessions"
+    },
+    {
+        "sessions": 10,
+        "avg_improvement": 15.0,
+        "description": "Average users improve 15% accuracy after 10 sessions"
+    },
+    {
+        "sessions": 25,
+        "avg_improvement": 25.0,
+        "description": "Average users improve 25% accuracy after 25 sessions"
+    },
+    {
+        "sessions": 50,
+        "avg_improvement": 35.0,
+        "description": "Average users improve 35% accuracy after 50 sessions"
     }
+]
+
+# Fixed histogram range for metrics with a known scale
+HISTOGRAM_RANGES = {"accuracy": (0.0, 100.0)}
+
+
+def get_population_stats(db: Session, min_users: int = 1) -> Optional[Dict]:
+    """Calculate population-wide statistics (aggregate across all users)."""
+    # Check if we have enough users
+    user_count = db.query(func.count(User.id)).scalar()
+    if user_count < min_users:
+        return None
     
-    speed_percentiles = {
-        "p25": round(percentile(sorted_speeds, 0.25), 3),
-        "p50": round(percentile(sorted_speeds, 0.50), 3),
-        "p75": round(percentile(sorted_speeds, 0.75), 3),
-        "p90": round(percentile(sorted_speeds, 0.90), 3)
-    }
+    # Averages and percentile distributions in a single pass over the scalar columns
+    samples = _population_samples()
+    percentile_fractions = postgresql.array(PERCENTILES)
+    (sample_count, avg_accuracy, avg_speed, avg_quality,
+     accuracy_values, speed_values, quality_values) = db.query(
+        func.count(),
+        func.avg(samples.c.accuracy),
+        func.avg(samples.c.speed),
+        func.avg(samples.c.quality),
+        func.percentile_cont(percentile_fractions).within_group(samples.c.accuracy),
+        func.percentile_cont(percentile_fractions).within_group(samples.c.speed),
+        func.percentile_cont(percentile_fractions).within_group(samples.c.quality)
+    ).one()
     
-    quality_percentiles = {
-        "p25": round(percentile(sorted_qualities, 0.25), 1),
-        "p50": round(percentile(sorted_qualities, 0.50), 1),
-        "p75": round(percentile(sorted_qualities, 0.75), 1),
-        "p90": round(percentile(sorted_qualities, 0.90), 1)
-    }
+    # Need at least some session data to calculate stats
+    if not sample_count:
+        return None
     
     # Calculate improvement benchmarks (average improvement after X sessions)
     improvement_benchmarks = _calculate_improvement_benchmarks(db)
@@ -260,48 +293,177 @@ def get_population_stats(db: Session, min_users: int = 1) -> Optional[Dict]:
     drill_popularity = _calculate_drill_popularity(db)
     
     return {
-        "avg_accuracy": round(avg_accuracy, 2),
-        "avg_speed": round(avg_speed, 3),
-        "avg_quality": round(avg_quality, 1),
+        "avg_accuracy": round(float(avg_accuracy or 0), 2),
+        "avg_speed": round(float(avg_speed or 0), 3),
+        "avg_quality": round(float(avg_quality or 0), 1),
         "percentiles": {
-            "accuracy": accuracy_percentiles,
-            "speed": speed_percentiles,
-            "quality": quality_percentiles
+            "accuracy": _percentile_distribution(accuracy_values, 2),
+            "speed": _percentile_distribution(speed_values, 3),
+            "quality": _percentile_distribution(quality_values, 1)
         },
         "improvement_benchmarks": improvement_benchmarks,
         "drill_popularity": drill_popularity
     }
 
 
+def get_population_histogram(db: Session, metric: str, bins: int = 20) -> Optional[Dict]:
+    """Bucket a population metric (accuracy, speed or quality) into equal-width bins."""
+    samples = _population_samples()
+    value = samples.c[metric]
+    
+    low, high, sample_count = db.query(
+        func.min(value), func.max(value), func.count(value)
+    ).one()
+    if not sample_count:
+        return None
+    
+    low, high = HISTOGRAM_RANGES.get(metric, (float(low), float(high)))
+    if high > low:
+        # width_bucket puts the upper bound in an overflow bucket, fold it into the last bin
+        bucket = func.least(func.width_bucket(value, low, high, bins), bins)
+        width = (high - low) / bins
+    else:
+        bucket = literal(1)
+        bins = 1
+        width = 0.0
+    
+    counts = dict(
+        db.query(bucket, func.count())
+        .filter(value.isnot(None))
+        .group_by(bucket)
+        .all()
+    )
+    
+    return {
+        "metric": metric,
+        "total": sample_count,
+        "bins": [
+            {
+                "lower": round(low + width * i, 3),
+                "upper": round(low + width * (i + 1), 3),
+                "count": counts.get(i + 1, 0)
+            }
+            for i in range(bins)
+        ]
+    }
+
+
+def _population_samples():
+    """One row per session with its accuracy, speed and quality (notation sessions have accuracy only)."""
+    no_value = cast(null(), SessionModel.average_time.type)
+    return union_all(
+        select(
+            SessionModel.recall_accuracy.label("accuracy"),
+            SessionModel.average_time.label("speed"),
+            cast(stats_rollup_repository.quality_score(SessionModel), SessionModel.average_time.type).label("quality")
+        ),
+        select(NotationSession.accuracy, no_value, no_value)
+    ).subquery("samples")
+
+
+def _percentile_distribution(values: Optional[List], digits: int) -> Dict[str, float]:
+    """Map percentile_cont results onto the p25/p50/p75/p90 keys."""
+    values = values or [None] * len(PERCENTILES)
+    return {
+        f"p{int(fraction * 100)}": round(float(value or 0), digits)
+        for fraction, value in zip(PERCENTILES, values)
+    }
+
+
 def _calculate_improvement_benchmarks(db: Session) -> List[Dict]:
-    """Calculate improvement benchmarks based on user progress."""
-    # This is a simplified version - in a real implementation, you'd track
-    # user progress over time and calculate actual improvement rates
-    # For now, return default benchmarks
+    """Read improvement benchmarks from the precomputed snapshot."""
+    snapshots = db.query(ImprovementBenchmarkSnapshot).order_by(
+        ImprovementBenchmarkSnapshot.sessions
+    ).all()
+    
+    if not snapshots:
+        # Snapshot job hasn't run yet
+        return DEFAULT_IMPROVEMENT_BENCHMARKS
+    
     return [
         {
-            "sessions": 5,
-            "avg_improvement": 10.0,
-            "description": "Average users improve 10% accuracy after 5 sessions"
-        },
-        {
-            "sessions": 10,
-            "avg_improvement": 15.0,
-            "description": "Average users improve 15% accuracy after 10 sessions"
-        },
-        {
-            "sessions": 25,
-            "avg_improvement": 25.0,
-            "description": "Average users improve 25% accuracy after 25 sessions"
-        },
-        {
-            "sessions": 50,
-            "avg_improvement": 35.0,
-            "description": "Average users improve 35% accuracy after 50 sessions"
+            "sessions": snapshot.sessions,
+            "avg_improvement": float(snapshot.avg_improvement),
+            "description": _describe_improvement(snapshot.sessions, float(snapshot.avg_improvement))
         }
+        for snapshot in snapshots
     ]
 
 
+def refresh_improvement_benchmarks(db: Session) -> List[ImprovementBenchmarkSnapshot]:
+    """Recompute the improvement benchmark snapshot from every user's history.
+    
+    Each user's sessions and notation sessions are numbered in date order with
+    ROW_NUMBER(); the improvement after N sessions is the accuracy of session N
+    minus the accuracy of session 1, averaged over users with at least N sessions.
+    The caller commits.
+    """
+    history = union_all(
+        select(
+            SessionModel.user_id,
+            SessionModel.session_date,
+            SessionModel.id,
+            SessionModel.recall_accuracy.label("accuracy")
+        ),
+        select(
+            NotationSession.user_id,
+            NotationSession.session_date,
+            NotationSession.id,
+            NotationSession.accuracy
+        )
+    ).subquery("history")
+    
+    numbered = select(
+        history.c.user_id,
+        history.c.accuracy,
+        func.row_number().over(
+            partition_by=history.c.user_id,
+            order_by=(history.c.session_date, history.c.id)
+        ).label("session_number")
+    ).subquery("numbered")
+    
+    # One row per user with the accuracy at session 1 and at each milestone
+    milestones = (1,) + BENCHMARK_SESSION_COUNTS
+    per_user = select(
+        numbered.c.user_id,
+        *[
+            func.max(case((numbered.c.session_number == n, numbered.c.accuracy))).label(f"session_{n}")
+            for n in milestones
+        ]
+    ).where(
+        numbered.c.session_number.in_(milestones)
+    ).group_by(numbered.c.user_id).subquery("per_user")
+    
+    columns = []
+    for n in BENCHMARK_SESSION_COUNTS:
+        columns.append(func.avg(per_user.c[f"session_{n}"] - per_user.c.session_1))
+        columns.append(func.count(per_user.c[f"session_{n}"]))
+    row = db.execute(select(*columns)).one()
+    
+    snapshots = []
+    for i, n in enumerate(BENCHMARK_SESSION_COUNTS):
+        avg_improvement, user_count = row[2 * i], row[2 * i + 1]
+        if not user_count:
+            continue
+        snapshots.append(ImprovementBenchmarkSnapshot(
+            sessions=n,
+            avg_improvement=round(avg_improvement, 2),
+            user_count=user_count
+        ))
+    
+    db.query(ImprovementBenchmarkSnapshot).delete()
+    db.add_all(snapshots)
+    db.flush()
+    return snapshots
+
+
+def _describe_improvement(sessions: int, avg_improvement: float) -> str:
+    """Human-readable benchmark description."""
+    if avg_improvement >= 0:
+        return f"Average users improve {avg_improvement:.1f}% accuracy after {sessions} sessions"
+    return f"Average users' accuracy changes by {avg_improvement:.1f}% after {sessions} sessions"
+
+
 def _calculate_drill_popularity(db: Session) -> Dict[str, int]:
     """Calculate how popular each drill type is (session counts)."""
     session_counts = db.query(
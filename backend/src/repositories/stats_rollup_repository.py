@@ -0,0 +1,334 @@
+"""Stats rollup repository for maintaining per-user running totals.
+
+The rollup rows are updated in the same transaction as every session write,
+so reading a user's stats is a single primary-key lookup instead of a scan
+over their whole history. The same writes bump the user's data_version.
+"""
+
+from sqlalchemy.orm import Session, lazyload
+from sqlalchemy import func, select, union, cast, Integer
+from sqlalchemy.dialects.postgresql import insert as pg_insert, aggregate_order_by
+from typing import Dict, Optional, Tuple
+from datetime import datetime, date, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+from ..models.session import Session as SessionModel, NotationSession
+from ..models.stats import UserStatsRollup, UserDrillStatsRollup
+from . import user_repository
+
+# Columns copied from a freshly built rollup onto the stored row
+_ROLLUP_FIELDS = (
+    "session_count", "notation_session_count", "total_pairs",
+    "session_accuracy_sum", "notation_accuracy_sum", "session_speed_sum",
+    "best_accuracy", "best_speed", "best_quality",
+    "current_streak", "longest_streak", "last_session_date"
+)
+
+
+def get_user_rollup(db: Session, user_id: UUID) -> Optional[UserStatsRollup]:
+    """Get the stored rollup (with drill rows) for a user."""
+    return db.get(UserStatsRollup, user_id)
+
+
+def build_user_rollup(db: Session, user_id: UUID) -> UserStatsRollup:
+    """Compute a user's rollup from the raw session tables without storing it."""
+    session_rows = db.query(
+        SessionModel.drill_type,
+        func.count(SessionModel.id),
+        func.sum(SessionModel.pair_count),
+        func.sum(SessionModel.recall_accuracy),
+        func.sum(SessionModel.average_time),
+        func.max(SessionModel.recall_accuracy),
+        func.min(SessionModel.average_time),
+        func.max(quality_score(SessionModel)),
+        func.max(SessionModel.session_date)
+    ).filter(
+        SessionModel.user_id == user_id
+    ).group_by(SessionModel.drill_type).all()
+
+    notation_rows = db.query(
+        NotationSession.drill_type,
+        func.count(NotationSession.id),
+        func.sum(NotationSession.accuracy),
+        func.sum(NotationSession.average_time),
+        func.max(NotationSession.accuracy),
+        func.min(NotationSession.average_time),
+        func.max(NotationSession.session_date)
+    ).filter(
+        NotationSession.user_id == user_id
+    ).group_by(NotationSession.drill_type).all()
+
+    rollup = UserStatsRollup(
+        user_id=user_id,
+        session_count=0,
+        notation_session_count=0,
+        total_pairs=0,
+        session_accuracy_sum=Decimal(0),
+        notation_accuracy_sum=Decimal(0),
+        session_speed_sum=Decimal(0),
+        current_streak=0,
+        longest_streak=0
+    )
+    drills: Dict[str, UserDrillStatsRollup] = {}
+
+    for (drill_type, count, pairs, accuracy_sum, speed_sum,
+         best_accuracy, best_speed, best_quality, last_date) in session_rows:
+        rollup.session_count += count
+        rollup.total_pairs += pairs
+        rollup.session_accuracy_sum += accuracy_sum
+        rollup.session_speed_sum += speed_sum
+        rollup.best_accuracy = _max(rollup.best_accuracy, best_accuracy)
+        rollup.best_speed = _min(rollup.best_speed, best_speed)
+        rollup.best_quality = _max(rollup.best_quality, best_quality)
+        rollup.last_session_date = _max(rollup.last_session_date, last_date)
+        _merge_drill(drills, user_id, drill_type, count, accuracy_sum, speed_sum, best_accuracy, best_speed)
+
+    for (drill_type, count, accuracy_sum, speed_sum,
+         best_accuracy, best_speed, last_date) in notation_rows:
+        rollup.notation_session_count += count
+        rollup.notation_accuracy_sum += accuracy_sum
+        rollup.best_accuracy = _max(rollup.best_accuracy, best_accuracy)
+        rollup.last_session_date = _max(rollup.last_session_date, last_date)
+        _merge_drill(drills, user_id, drill_type, count, accuracy_sum, speed_sum, best_accuracy, best_speed)
+
+    if rollup.last_session_date is not None:
+        rollup.current_streak, rollup.longest_streak = compute_streaks(db, user_id)
+
+    rollup.drill_stats = [drills[drill_type] for drill_type in sorted(drills)]
+    return rollup
+
+
+def rebuild_user_rollup(db: Session, user_id: UUID) -> UserStatsRollup:
+    """Recompute and store a user's rollup. The caller commits.
+
+    The rollup row is locked before the session tables are read, so a
+    concurrent record_session either commits first (and is counted) or waits
+    for this transaction (and adds to the rebuilt totals).
+    """
+    # Rollup row first, then users: every writer takes the two locks in this order
+    rollup = _lock_user_rollup(db, user_id)[0]
+    user_repository.bump_data_version(db, user_id)
+    built = build_user_rollup(db, user_id)
+    drill_rows = list(built.drill_stats)
+
+    for field in _ROLLUP_FIELDS:
+        setattr(rollup, field, getattr(built, field))
+
+    db.query(UserDrillStatsRollup).filter(
+        UserDrillStatsRollup.user_id == user_id
+    ).delete()
+    db.add_all(drill_rows)
+    db.flush()
+    db.expire(rollup, ["drill_stats"])
+    return rollup
+
+
+def record_session(db: Session, session: SessionModel) -> None:
+    """Add a newly flushed training session to its user's rollup."""
+    rollup, created = _lock_user_rollup(db, session.user_id)
+    if created:
+        # First write for this user (or a user not yet backfilled)
+        rebuild_user_rollup(db, session.user_id)
+        return
+
+    user_repository.bump_data_version(db, session.user_id)
+    accuracy = Decimal(session.recall_accuracy)
+    speed = Decimal(session.average_time)
+    quality = session.vividness or session.flow
+
+    rollup.session_count += 1
+    rollup.total_pairs += session.pair_count
+    rollup.session_accuracy_sum += accuracy
+    rollup.session_speed_sum += speed
+    rollup.best_accuracy = _max(rollup.best_accuracy, accuracy)
+    rollup.best_speed = _min(rollup.best_speed, speed)
+    rollup.best_quality = _max(rollup.best_quality, quality)
+    _record_session_date(db, rollup, session.session_date)
+    _increment_drill(db, session.user_id, session.drill_type, accuracy, speed)
+    db.flush()
+
+
+def record_notation_session(db: Session, session: NotationSession) -> None:
+    """Add a newly flushed notation session to its user's rollup."""
+    rollup, created = _lock_user_rollup(db, session.user_id)
+    if created:
+        rebuild_user_rollup(db, session.user_id)
+        return
+
+    user_repository.bump_data_version(db, session.user_id)
+    accuracy = Decimal(session.accuracy)
+    speed = Decimal(session.average_time)
+
+    rollup.notation_session_count += 1
+    rollup.notation_accuracy_sum += accuracy
+    rollup.best_accuracy = _max(rollup.best_accuracy, accuracy)
+    _record_session_date(db, rollup, session.session_date)
+    _increment_drill(db, session.user_id, session.drill_type, accuracy, speed)
+    db.flush()
+
+
+def quality_score(model):
+    """SQL equivalent of ``vividness or flow`` for a session row."""
+    return func.coalesce(func.nullif(model.vividness, 0), model.flow)
+
+
+def _lock_user_rollup(db: Session, user_id: UUID) -> tuple:
+    """Ensure the user's rollup row exists and lock it for this transaction.
+
+    Returns the row and whether it was created by this call.
+    """
+    created = db.execute(
+        pg_insert(UserStatsRollup)
+        .values(user_id=user_id)
+        .on_conflict_do_nothing(index_elements=["user_id"])
+        .returning(UserStatsRollup.user_id)
+    ).first() is not None
+
+    rollup = db.query(UserStatsRollup).options(
+        lazyload(UserStatsRollup.drill_stats)
+    ).filter(
+        UserStatsRollup.user_id == user_id
+    ).with_for_update().populate_existing().one()
+    return rollup, created
+
+
+def _increment_drill(db: Session, user_id: UUID, drill_type: str, accuracy: Decimal, speed: Decimal) -> None:
+    """Add one session to the user's per-drill rollup row."""
+    stmt = pg_insert(UserDrillStatsRollup).values(
+        user_id=user_id,
+        drill_type=drill_type,
+        session_count=1,
+        accuracy_sum=accuracy,
+        speed_sum=speed,
+        best_accuracy=accuracy,
+        best_speed=speed
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "drill_type"],
+        set_={
+            "session_count": UserDrillStatsRollup.session_count + 1,
+            "accuracy_sum": UserDrillStatsRollup.accuracy_sum + stmt.excluded.accuracy_sum,
+            "speed_sum": UserDrillStatsRollup.speed_sum + stmt.excluded.speed_sum,
+            "best_accuracy": func.greatest(UserDrillStatsRollup.best_accuracy, stmt.excluded.best_accuracy),
+            "best_speed": func.least(UserDrillStatsRollup.best_speed, stmt.excluded.best_speed)
+        }
+    )
+    db.execute(stmt)
+
+
+def _record_session_date(db: Session, rollup: UserStatsRollup, session_date: datetime) -> None:
+    """Advance the last session date and streaks for a new session."""
+    session_date = _as_utc(session_date)
+    if rollup.last_session_date is None:
+        rollup.current_streak = 1
+        rollup.longest_streak = max(rollup.longest_streak or 0, 1)
+        rollup.last_session_date = session_date
+        return
+
+    day = _utc_day(session_date)
+    last_day = _utc_day(rollup.last_session_date)
+
+    if day > last_day:
+        rollup.current_streak = rollup.current_streak + 1 if day == last_day + timedelta(days=1) else 1
+        rollup.longest_streak = max(rollup.longest_streak or 0, rollup.current_streak)
+        rollup.last_session_date = session_date
+    elif day == last_day:
+        rollup.last_session_date = max(_as_utc(rollup.last_session_date), session_date)
+    else:
+        # An older session (e.g. an offline upload) may join two streaks
+        rollup.current_streak, rollup.longest_streak = compute_streaks(db, rollup.user_id)
+
+
+def compute_streaks(db: Session, user_id: UUID) -> Tuple[int, int]:
+    """Current and longest runs of consecutive UTC practice days.
+
+    Gaps-and-islands over the distinct practice days: ``day - ROW_NUMBER()`` is
+    constant within a run of consecutive days. The current streak is the run
+    ending on the last practice day.
+    """
+    days = union(
+        select(_utc_day_column(SessionModel).label("day")).where(SessionModel.user_id == user_id),
+        select(_utc_day_column(NotationSession)).where(NotationSession.user_id == user_id)
+    ).subquery("days")
+
+    numbered = select(
+        days.c.day,
+        (days.c.day - cast(func.row_number().over(order_by=days.c.day), Integer)).label("island")
+    ).subquery("numbered")
+
+    islands = select(
+        func.max(numbered.c.day).label("end_day"),
+        func.count().label("length")
+    ).group_by(numbered.c.island).subquery("islands")
+
+    current, longest = db.execute(select(
+        func.array_agg(aggregate_order_by(islands.c.length, islands.c.end_day.desc()))[1],
+        func.max(islands.c.length)
+    )).one()
+    return current or 0, longest or 0
+
+
+def _merge_drill(
+    drills: Dict[str, UserDrillStatsRollup],
+    user_id: UUID,
+    drill_type: str,
+    count: int,
+    accuracy_sum: Decimal,
+    speed_sum: Decimal,
+    best_accuracy: Decimal,
+    best_speed: Decimal
+) -> None:
+    """Merge one grouped row into the per-drill rollups (drills can span both tables)."""
+    drill = drills.get(drill_type)
+    if drill is None:
+        drills[drill_type] = UserDrillStatsRollup(
+            user_id=user_id,
+            drill_type=drill_type,
+            session_count=count,
+            accuracy_sum=accuracy_sum,
+            speed_sum=speed_sum,
+            best_accuracy=best_accuracy,
+            best_speed=best_speed
+        )
+        return
+
+    drill.session_count += count
+    drill.accuracy_sum += accuracy_sum
+    drill.speed_sum += speed_sum
+    drill.best_accuracy = _max(drill.best_accuracy, best_accuracy)
+    drill.best_speed = _min(drill.best_speed, best_speed)
+
+
+def _utc_day_column(model):
+    """SQL expression for the UTC calendar day of a session."""
+    return func.date(func.timezone("UTC", model.session_date))
+
+
+def _utc_day(value: datetime) -> date:
+    """UTC calendar day of a session date."""
+    return _as_utc(value).date()
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Normalize a datetime to UTC, treating naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _max(current, value):
+    """Max that ignores missing values."""
+    if current is None:
+        return value
+    if value is None:
+        return current
+    return max(current, value)
+
+
+def _min(current, value):
+    """Min that ignores missing values."""
+    if current is None:
+        return value
+    if value is None:
+        return current
+    return min(current, value)
@@ -1,7 +1,8 @@
 """User repository for data access."""
 
 from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy import update, func
+from typing import Iterable, Optional
 from uuid import UUID
 from ..models.user import User
 from ..schemas.user import UserCreate, UserUpdate
@@ -41,3 +42,25 @@ def update_user(db: Session, user_id: UUID, user_data: UserUpdate) -> Optional[U
         db.refresh(user)
     return user
 
+
+def bump_data_version(db: Session, user_id: UUID) -> None:
+    """Mark a user's session data as changed. The caller commits.
+    
+    updated_at is kept as is; it tracks profile changes.
+    """
+    bump_data_versions(db, [user_id])
+
+
+def bump_data_versions(db: Session, user_ids: Iterable[UUID]) -> None:
+    """bump_data_version for several users at once. The caller commits."""
+    user_ids = sorted(set(user_ids))
+    if not user_ids:
+        return
+    db.execute(
+        update(User).where(User.id.in_(user_ids)).values(
+            data_version=User.data_version + 1,
+            data_updated_at=func.now(),
+            updated_at=User.updated_at
+        ),
+        execution_options={"synchronize_session": False}
+    )
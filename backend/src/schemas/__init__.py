@@ -2,13 +2,15 @@
 
 from .user import UserCreate, UserUpdate, UserResponse
 from .session import (
-    SessionCreate, SessionResponse,
-    NotationSessionCreate, NotationSessionResponse
+    SessionCreate, SessionResponse, SessionSummaryResponse,
+    NotationSessionCreate, NotationSessionResponse, NotationSessionSummaryResponse,
+    HistoryItemResponse, BulkCreatedItem, BulkItemError, BulkCreateResponse
 )
 
 __all__ = [
     "UserCreate", "UserUpdate", "UserResponse",
-    "SessionCreate", "SessionResponse",
-    "NotationSessionCreate", "NotationSessionResponse"
+    "SessionCreate", "SessionResponse", "SessionSummaryResponse",
+    "NotationSessionCreate", "NotationSessionResponse", "NotationSessionSummaryResponse",
+    "HistoryItemResponse", "BulkCreatedItem", "BulkItemError", "BulkCreateResponse"
 ]
 
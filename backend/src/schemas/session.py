@@ -3,13 +3,20 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from uuid import UUID
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Literal
 from decimal import Decimal
 
 
 class SessionCreate(BaseModel):
-    """Schema for creating a training session."""
+    """Schema for creating a training session.
     
+    ``id`` is optional; a client-generated id makes retries idempotent.
+    In bulk uploads an item may send ``idempotency_key`` instead, mapped to
+    the same id as that key in a single POST's Idempotency-Key header.
+    """
+    
+    id: Optional[UUID] = None
+    idempotency_key: Optional[str] = Field(None, max_length=255, exclude=True)
     session_date: datetime
     drill_type: str
     pair_count: int
@@ -44,14 +51,37 @@ class SessionResponse(BaseModel):
     flow: Optional[int]
     notes: Optional[str]
     created_at: datetime
+    # Set once pairs and recall detail moved to session_archive; responses
+    # still carry them
+    archived_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class SessionSummaryResponse(BaseModel):
+    """Schema for a session list row without pairs, timings or recall detail."""
+    
+    id: UUID
+    session_date: datetime
+    drill_type: str
+    pair_count: int
+    average_time: Decimal
+    total_time: Optional[Decimal]
+    recall_accuracy: Decimal
+    vividness: Optional[int]
+    flow: Optional[int]
+    created_at: datetime
     
     class Config:
         from_attributes = True
 
 
 class NotationSessionCreate(BaseModel):
-    """Schema for creating a notation training session."""
+    """Schema for creating a notation training session (``id`` and ``idempotency_key`` as for SessionCreate)."""
     
+    id: Optional[UUID] = None
+    idempotency_key: Optional[str] = Field(None, max_length=255, exclude=True)
     session_date: datetime
     drill_type: str
     attempts: List[Dict[str, Any]]
@@ -78,7 +108,66 @@ class NotationSessionResponse(BaseModel):
     total_time: Optional[Decimal]
     notes: Optional[str]
     created_at: datetime
+    # As for SessionResponse: attempts are still returned once archived
+    archived_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
 
+
+class NotationSessionSummaryResponse(BaseModel):
+    """Schema for a notation session list row without attempts or notes."""
+    
+    id: UUID
+    session_date: datetime
+    drill_type: str
+    total_pieces: int
+    correct_count: int
+    accuracy: Decimal
+    average_time: Decimal
+    total_time: Optional[Decimal]
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class HistoryItemResponse(BaseModel):
+    """Schema for a row of the merged session history."""
+    
+    kind: Literal["session", "notation_session"]
+    id: UUID
+    session_date: datetime
+    drill_type: str
+    item_count: int
+    accuracy: Decimal
+    average_time: Decimal
+    total_time: Optional[Decimal]
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class BulkCreatedItem(BaseModel):
+    """A bulk item that was stored, by its position in the request."""
+    
+    index: int
+    id: UUID
+    # True when the id was already stored (a retried upload); nothing was written
+    existing: bool = False
+
+
+class BulkItemError(BaseModel):
+    """A bulk item that was rejected, by its position in the request."""
+    
+    index: int
+    detail: Any
+
+
+class BulkCreateResponse(BaseModel):
+    """Schema for bulk create response. Valid items are stored even if others fail."""
+    
+    created: List[BulkCreatedItem]
+    errors: List[BulkItemError]
+
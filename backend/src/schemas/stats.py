@@ -3,6 +3,7 @@
 from pydantic import BaseModel
 from typing import List, Optional, Dict
 from decimal import Decimal
+from datetime import datetime
 
 
 class DrillStatsResponse(BaseModel):
@@ -30,6 +31,14 @@ class UserStatsResponse(BaseModel):
     drill_stats: List[DrillStatsResponse]
 
 
+class StreakResponse(BaseModel):
+    """Practice streak summary."""
+    current_streak: int
+    longest_streak: int
+    last_session_date: Optional[str]
+    days_since_last_session: int
+
+
 class PercentileDistribution(BaseModel):
     """Percentile distribution."""
     p25: float
@@ -55,6 +64,51 @@ class PopulationStatsResponse(BaseModel):
     drill_popularity: Dict[str, int]
 
 
+class HistogramBin(BaseModel):
+    """Single equal-width histogram bin."""
+    lower: float
+    upper: float
+    count: int
+
+
+class PopulationHistogramResponse(BaseModel):
+    """Population distribution of one metric."""
+    metric: str
+    total: int
+    bins: List[HistogramBin]
+
+
+class TimeseriesPoint(BaseModel):
+    """Aggregated sessions of one drill type in one time bucket."""
+    bucket: datetime
+    drill_type: str
+    session_count: int
+    avg_accuracy: float
+    best_accuracy: float
+    avg_speed: float
+
+
+class TimeseriesResponse(BaseModel):
+    """Bucketed progress series for charts."""
+    bucket: str
+    points: List[TimeseriesPoint]
+
+
+class TimingPosition(BaseModel):
+    """Recall time statistics for one pair position."""
+    position: int
+    count: int
+    avg: float
+    percentiles: PercentileDistribution
+
 
+class TimingProfileResponse(BaseModel):
+    """Per-position recall times across a user's sessions."""
+    drill_type: Optional[str]
+    positions: List[TimingPosition]
 
 
+class DashboardResponse(BaseModel):
+    """Everything the home dashboard renders, in one response."""
+    user_stats: UserStatsResponse
+    population_stats: Optional[PopulationStatsResponse]
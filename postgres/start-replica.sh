@@ -0,0 +1,15 @@
+#!/bin/sh
+# Hot standby of the "postgres" service: cloned with pg_basebackup on first start.
+# REPLICA_APPLY_DELAY (e.g. 5s) holds back replay to make replication lag visible.
+set -e
+
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+    until pg_basebackup -h postgres -U replicator -D "$PGDATA" -R -X stream -c fast; do
+        echo "Waiting for the primary..."
+        rm -rf "${PGDATA:?}"/*
+        sleep 2
+    done
+    chmod 700 "$PGDATA"
+fi
+
+exec postgres -c hot_standby=on -c recovery_min_apply_delay="${REPLICA_APPLY_DELAY:-0}"
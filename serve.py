@@ -2,12 +2,31 @@
 """
 Simple HTTP server for BLD Memory Trainer development.
 Run: python serve.py
+
+Each connection gets its own thread. HTML pages are cached in memory with the
+API base URL already injected (until the file changes), and other files go
+out with sendfile. Responses carry ETag/Last-Modified for 304 revalidation,
+and precompressed .br/.gz siblings are served to clients that accept them.
+
+Assets under public/ and dist/ are content-hashed at startup (written to
+asset-manifest.json). HTML references to them are rewritten to
+name.<hash>.ext URLs, which are the only responses cached as immutable.
+Modules they import keep their plain names and, like HTML, are revalidated
+on every use, so a page never mixes scripts from two deploys.
+Run: python serve.py --build  (at image build time: manifest + .gz/.br files)
 """
 
+import email.utils
+import gzip
+import hashlib
 import http.server
-import socketserver
+import io
+import json
 import os
+import posixpath
+import re
 import sys
+import threading
 
 # Force unbuffered output for Docker logs
 sys.stdout.reconfigure(line_buffering=True)
@@ -16,7 +35,147 @@ sys.stderr.reconfigure(line_buffering=True)
 PORT = int(os.environ.get('PORT', '3000'))
 DIRECTORY = "."
 
+# Files at least this large are sent with sendfile (zero-copy)
+SENDFILE_MIN_SIZE = 64 * 1024
+
+# Precompressed siblings, in order of preference
+PRECOMPRESSED = (('br', '.br'), ('gzip', '.gz'))
+
+# Extensions that benefit from compression
+COMPRESSIBLE = ('.js', '.css', '.html', '.json', '.xml', '.svg', '.txt', '.ts')
+
+# Assets fingerprinted into name.<hash>.ext URLs
+ASSET_ROOTS = ('public', 'dist')
+ASSET_MANIFEST = 'asset-manifest.json'
+FINGERPRINTED = ('.js', '.css', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.ico', '.woff', '.woff2')
+FINGERPRINT_RE = re.compile(r'^(?P<base>.+)\.(?P<digest>[0-9a-f]{10})(?P<ext>\.[A-Za-z0-9]+)$')
+
+# Scripts that can be imported by plain name from a fingerprinted entry module
+MODULE_EXTENSIONS = ('.js', '.mjs', '.ts')
+
+# Relative src/href values in HTML (no scheme, query or fragment)
+ASSET_REF_RE = re.compile(r'''(\b(?:src|href)=)(["'])([^"'#?:]+)\2''')
+
+
+def _url_path(path):
+    """Path relative to the served directory, with forward slashes."""
+    return os.path.relpath(path).replace(os.sep, '/')
+
+
+class AssetManifest:
+    """Content hashes of the assets under ASSET_ROOTS, keyed by their served path."""
+    
+    def __init__(self, roots):
+        self.roots = roots
+        self.digests = {}
+        self.version = ''
+    
+    def build(self):
+        digests = {}
+        for root in self.roots:
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    if not filename.lower().endswith(FINGERPRINTED):
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    with open(path, 'rb') as f:
+                        digests[_url_path(path)] = hashlib.sha256(f.read()).hexdigest()[:10]
+        self.digests = digests
+        self.version = hashlib.sha256(json.dumps(digests, sort_keys=True).encode()).hexdigest()[:10]
+        return self
+    
+    def hashed(self, path):
+        """Fingerprinted name for a served path, or None if it isn't a hashed asset."""
+        digest = self.digests.get(path)
+        if digest is None:
+            return None
+        base, ext = posixpath.splitext(path)
+        return f'{base}.{digest}{ext}'
+    
+    def write(self, manifest_path):
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({path: self.hashed(path) for path in sorted(self.digests)}, f, indent=2)
+            f.write('\n')
+    
+    def rewrite_html(self, html_path, content):
+        """Point an HTML file's relative asset references at their fingerprinted names."""
+        base_dir = posixpath.dirname(_url_path(html_path))
+        
+        def replace(match):
+            attribute, quote, ref = match.groups()
+            if ref.startswith('//'):
+                return match.group(0)
+            target = posixpath.normpath(ref.lstrip('/') if ref.startswith('/') else posixpath.join(base_dir, ref))
+            # Same /public fallback as the request handler
+            hashed = self.hashed(target) or self.hashed(posixpath.join('public', target))
+            if hashed is None:
+                return match.group(0)
+            return f'{attribute}{quote}{posixpath.join(posixpath.dirname(ref), posixpath.basename(hashed))}{quote}'
+        
+        return ASSET_REF_RE.sub(replace, content)
+
+
+asset_manifest = AssetManifest(ASSET_ROOTS)
+
+
+class InjectedHTMLCache:
+    """HTML files with the API base URL script injected and asset references fingerprinted.
+    
+    Entries are reloaded when the file's mtime or size changes.
+    """
+    
+    def __init__(self, api_base_url, manifest):
+        self.manifest = manifest
+        self.script_tag = f'<script>window.API_BASE_URL = "{api_base_url}";</script>'
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    def get(self, file_path):
+        """Return (body, gzipped body, etag, mtime) for an HTML file. Raises FileNotFoundError."""
+        stat = os.stat(file_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(file_path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = self._inject(self.manifest.rewrite_html(file_path, f.read()))
+        body = content.encode('utf-8')
+        # The manifest version changes the page (its asset URLs) without touching the file
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}-{self.manifest.version}"'
+        page = (body, gzip.compress(body, 6), etag, stat.st_mtime)
+        with self._lock:
+            self._entries[file_path] = (key, page)
+        return page
+    
+    def _inject(self, content):
+        # Insert the script tag before the closing head tag or at the beginning of body
+        if '</head>' in content:
+            return content.replace('</head>', f'{self.script_tag}\n</head>')
+        if '<body>' in content:
+            return content.replace('<body>', f'<body>\n{self.script_tag}')
+        return f'{self.script_tag}\n{content}'
+
+
+html_cache = InjectedHTMLCache(os.environ.get('API_BASE_URL', 'http://localhost:8000/api/v1'), asset_manifest)
+
+
 class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep-alive: every response below sends Content-Length
+    protocol_version = 'HTTP/1.1'
+    
+    # Set by _route for a name.<hash>.ext URL matching the current file (reset per request)
+    fingerprinted = False
+    
+    extensions_map = {
+        **http.server.SimpleHTTPRequestHandler.extensions_map,
+        # Serve .ts files with JavaScript MIME type for development
+        '.ts': 'application/javascript',
+        # Serve XML and TXT files with proper MIME types for SEO
+        '.xml': 'application/xml; charset=utf-8',
+        '.txt': 'text/plain; charset=utf-8',
+    }
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=DIRECTORY, **kwargs)
     
@@ -28,36 +187,58 @@ class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     def end_headers(self):
         # Allow ES modules
         self.send_header('Access-Control-Allow-Origin', '*')
-        # Serve .ts files with JavaScript MIME type for development
-        if self.path.endswith('.ts'):
-            self.send_header('Content-Type', 'application/javascript')
-        # Serve XML files with proper MIME type for SEO
-        elif self.path.endswith('.xml'):
-            self.send_header('Content-Type', 'application/xml; charset=utf-8')
-        # Serve TXT files with proper MIME type for SEO
-        elif self.path.endswith('.txt'):
-            self.send_header('Content-Type', 'text/plain; charset=utf-8')
-        
-        # Performance optimizations: Cache headers and compression hints
-        path_lower = self.path.lower()
-        if any(path_lower.endswith(ext) for ext in ['.js', '.css', '.png', '.jpg', '.jpeg', '.svg', '.woff', '.woff2', '.ico']):
-            # Cache static assets for 1 year
+        
+        # Performance optimizations: Cache headers
+        path_lower = self.path.split('?', 1)[0].lower()
+        if self.fingerprinted:
+            # Content-hashed URL: cache for 1 year
             self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
         elif path_lower.endswith('.html'):
-            # Cache HTML for shorter period, allow revalidation
-            self.send_header('Cache-Control', 'public, max-age=3600, must-revalidate')
+            # HTML carries the current asset hashes, so always revalidate (a 304 when unchanged)
+            self.send_header('Cache-Control', 'no-cache')
+        elif path_lower.endswith(MODULE_EXTENSIONS):
+            # Imported by plain name from the entry modules: a stale copy would pair
+            # with the other deploy's modules and break named imports, so revalidate too
+            self.send_header('Cache-Control', 'no-cache')
+        elif any(path_lower.endswith(ext) for ext in FINGERPRINTED):
+            # Other unhashed assets (images, fonts): short cache, then revalidate
+            self.send_header('Cache-Control', 'public, max-age=300')
         
-        # Compression hint (actual compression would need middleware)
-        if any(path_lower.endswith(ext) for ext in ['.js', '.css', '.html', '.json', '.xml']):
+        if any(path_lower.endswith(ext) for ext in COMPRESSIBLE):
             self.send_header('Vary', 'Accept-Encoding')
         
         super().end_headers()
     
+    def parse_request(self):
+        # One handler serves every request on a keep-alive connection
+        self.fingerprinted = False
+        return super().parse_request()
+    
     def do_GET(self):
+        self._route()
+        if self._is_html():
+            self._send_html(head_only=False)
+            return
+        super().do_GET()
+    
+    def do_HEAD(self):
+        self._route()
+        if self._is_html():
+            self._send_html(head_only=True)
+            return
+        super().do_HEAD()
+    
+    def _route(self):
         # Redirect root path to public/index.html
         if self.path == '/' or self.path == '/public/' or self.path == '/public/index.html':
             self.path = '/public/index.html'
         
+        # Fingerprinted URL: serve the file it was hashed from
+        path, separator, query = self.path.partition('?')
+        fingerprint = FINGERPRINT_RE.match(path)
+        if fingerprint and not os.path.exists(self.translate_path(path)):
+            self.path = f"{fingerprint.group('base')}{fingerprint.group('ext')}{separator}{query}"
+        
         # Fallback for assets under /public
         resolved_path = self.translate_path(self.path)
         if not os.path.exists(resolved_path):
@@ -65,47 +246,190 @@ class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             if os.path.exists(self.translate_path(fallback_path)):
                 self.path = fallback_path
         
-        # Check if this is an HTML file that needs API base URL injection
-        if self.path.endswith('.html') or self.path == '/public/index.html':
-            # Get the API base URL from environment variable
-            api_base_url = os.environ.get('API_BASE_URL', 'http://localhost:8000/api/v1')
-            
-            # Read the HTML file
-            file_path = 'public/index.html' if self.path == '/public/index.html' else self.path.lstrip('/')
+        # An outdated hash still gets the current file, just not cached as immutable
+        if fingerprint:
+            served = _url_path(self.translate_path(self.path))
+            self.fingerprinted = asset_manifest.digests.get(served) == fingerprint.group('digest')
+    
+    def _is_html(self):
+        return self.path.split('?', 1)[0].endswith('.html')
+    
+    def _send_html(self, head_only):
+        """Send an HTML page from the injected HTML cache."""
+        try:
+            body, gzipped, etag, mtime = html_cache.get(self.translate_path(self.path))
+        except (FileNotFoundError, IsADirectoryError):
+            self.send_error(404, "File not found")
+            return
+        
+        encoding = 'gzip' if self._accepts('gzip') else None
+        payload = gzipped if encoding else body
+        if encoding:
+            # Each representation gets its own strong ETag, as for precompressed files
+            etag = f'{etag[:-1]}-{encoding}"'
+        
+        if self._not_modified(etag, mtime):
+            self._send_not_modified(etag, mtime)
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', self.date_time_string(mtime))
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(payload)
+    
+    def send_head(self):
+        """Open a regular file for GET/HEAD with validators and content negotiation.
+        
+        Directories, missing files and the like go through the default handler.
+        """
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path) or path.endswith('/'):
+            return super().send_head()
+        
+        encoding, served_path = None, path
+        if path.lower().endswith(COMPRESSIBLE):
+            for candidate, suffix in PRECOMPRESSED:
+                sibling = path + suffix
+                if self._accepts(candidate) and _is_fresh_sibling(sibling, path):
+                    encoding, served_path = candidate, sibling
+                    break
+        
+        try:
+            f = open(served_path, 'rb')
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+        
+        try:
+            stat = os.fstat(f.fileno())
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-" + encoding if encoding else ""}"'
+            if self._not_modified(etag, stat.st_mtime):
+                f.close()
+                self._send_not_modified(etag, stat.st_mtime)
+                return None
             
+            self.send_response(200)
+            self.send_header('Content-Type', self.guess_type(path))
+            if encoding:
+                self.send_header('Content-Encoding', encoding)
+            self.send_header('Content-Length', str(stat.st_size))
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', self.date_time_string(stat.st_mtime))
+            self.end_headers()
+            return f
+        except Exception:
+            f.close()
+            raise
+    
+    def copyfile(self, source, outputfile):
+        """Send large files with sendfile; headers were already flushed by end_headers."""
+        try:
+            size = os.fstat(source.fileno()).st_size
+        except (AttributeError, io.UnsupportedOperation):
+            size = 0
+        if size >= SENDFILE_MIN_SIZE:
+            self.connection.sendfile(source)
+        else:
+            super().copyfile(source, outputfile)
+    
+    def _not_modified(self, etag, mtime):
+        """Check If-None-Match, or If-Modified-Since when no If-None-Match was sent."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            tags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags
+        
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Inject the API base URL script
-                script_tag = f'<script>window.API_BASE_URL = "{api_base_url}";</script>'
-                
-                # Insert the script tag before the closing head tag or at the beginning of body
-                if '</head>' in content:
-                    content = content.replace('</head>', f'{script_tag}\n</head>')
-                elif '<body>' in content:
-                    content = content.replace('<body>', f'<body>\n{script_tag}')
-                else:
-                    content = f'{script_tag}\n{content}'
-                
-                # Send the modified content
-                self.send_response(200)
-                self.send_header('Content-Type', 'text/html; charset=utf-8')
-                self.end_headers()
-                self.wfile.write(content.encode('utf-8'))
-                return
-                
-            except FileNotFoundError:
-                # If file not found, fall back to default behavior
-                pass
-        
-        # For all other files, use the default behavior
-        super().do_GET()
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            return since is not None and int(mtime) <= since.timestamp()
+        return False
+    
+    def _send_not_modified(self, etag, mtime):
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', self.date_time_string(mtime))
+        self.end_headers()
+    
+    def _accepts(self, encoding):
+        """Whether Accept-Encoding allows ``encoding`` (q=0 excludes it)."""
+        for part in self.headers.get('Accept-Encoding', '').split(','):
+            name, _, params = part.strip().partition(';')
+            if name.strip().lower() == encoding:
+                return params.replace(' ', '').lower() not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+        return False
+
+
+def _is_fresh_sibling(sibling, original):
+    """A precompressed file counts only if it is at least as new as the original."""
+    try:
+        return os.stat(sibling).st_mtime >= os.stat(original).st_mtime
+    except OSError:
+        return False
+
+
+def build_assets():
+    """Write the asset manifest and precompressed .gz (and .br with the brotli module) siblings."""
+    asset_manifest.write(ASSET_MANIFEST)
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+    
+    compressed = 0
+    for root in ASSET_ROOTS:
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                # HTML is compressed in memory after injection
+                if not filename.lower().endswith(COMPRESSIBLE) or filename.lower().endswith('.html'):
+                    continue
+                path = os.path.join(dirpath, filename)
+                stat = os.stat(path)
+                if stat.st_size < 1024:
+                    continue
+                with open(path, 'rb') as f:
+                    data = f.read()
+                siblings = [('.gz', gzip.compress(data, 9))]
+                if brotli is not None:
+                    siblings.append(('.br', brotli.compress(data, quality=11)))
+                for suffix, payload in siblings:
+                    with open(path + suffix, 'wb') as f:
+                        f.write(payload)
+                    # Same mtime as the original, so the sibling counts as fresh
+                    os.utime(path + suffix, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+                compressed += 1
+    return compressed
+
+
+class ThreadedHTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
 
 if __name__ == "__main__":
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    asset_manifest.build()
     
-    with socketserver.TCPServer(("", PORT), MyHTTPRequestHandler) as httpd:
+    if '--build' in sys.argv[1:]:
+        count = build_assets()
+        print(f"📦 Fingerprinted {len(asset_manifest.digests)} assets, precompressed {count} files", flush=True)
+        sys.exit(0)
+    
+    try:
+        asset_manifest.write(ASSET_MANIFEST)
+    except OSError as e:
+        print(f"⚠️  Could not write {ASSET_MANIFEST}: {e}", flush=True)
+    
+    with ThreadedHTTPServer(("", PORT), MyHTTPRequestHandler) as httpd:
         print("🧠 BLD Memory Trainer development server running...", flush=True)
         print(f"📍 Server listening on port {PORT}", flush=True)
         print(f"📍 Serving files from: {os.getcwd()}", flush=True)
@@ -114,5 +438,3 @@ if __name__ == "__main__":
             httpd.serve_forever()
         except KeyboardInterrupt:
             print("\n🛑 Server stopped by user", flush=True)
-
-
@@ -10,7 +10,7 @@ import { getQualityMetric } from './services/quality-adapter.js';
 import { getAllSessions } from './storage/storage-adapter.js';
 import { getAllNotationSessions } from './storage/storage-adapter.js';
 import { getAuthState, waitForAuthInit } from './services/auth-service.js';
-import { getUserStats, getPopulationStats } from './services/api-client.js';
+import { getUserStats, getPopulationStats, getDashboard } from './services/api-client.js';
 import { clearAllSessions } from './storage/session-storage.js';
 import { generateCSV, downloadCSV } from './services/csv-exporter.js';
 import { initializeAuthUI, refreshAuthUI } from './ui/auth-ui.js';
@@ -399,8 +399,16 @@ async function loadAndRenderHomeDashboard(): Promise<void> {
     const authState = getAuthState();
     const isAuthenticated = authState.isAuthenticated;
     
+    if (isAuthenticated) {
+      // One request: stats computed server-side, population stats included
+      const dashboard = await getDashboard();
+      renderHomeDashboard([], [], dashboard.populationStats, dashboard.userStats);
+      showScreen('home-dashboard-screen');
+      return;
+    }
+    
     console.log('Loading sessions and notation sessions...');
-    // Load sessions (from API if authenticated, from localStorage if not)
+    // Load sessions from localStorage
     const sessions = await getAllSessions();
     const notationSessions = await getAllNotationSessions();
     console.log('Loaded sessions:', sessions.length, 'notation sessions:', notationSessions.length);
@@ -3,7 +3,8 @@
  */
 
 import { getAuthToken } from './auth-service.js';
-import { SessionData, NotationSessionData } from '../types.js';
+import { SessionData, NotationSessionData, DrillType } from '../types.js';
+import type { UserStats, DrillStats } from './stats-calculator.js';
 
 // Get API base URL from global config or default
 // In production, this should be set by serve.py script injection
@@ -59,9 +60,10 @@ export async function createSession(sessionData: SessionData): Promise<SessionDa
     notes: sessionData.notes
   };
   
+  // The local id makes retries idempotent: the server returns the stored session
   const response = await fetch(`${finalApiBaseUrl}/sessions`, {
     method: 'POST',
-    headers,
+    headers: sessionData.id ? { ...headers, 'Idempotency-Key': sessionData.id } : headers,
     body: JSON.stringify(backendData)
   });
   
@@ -145,7 +147,7 @@ export async function createNotationSession(
   
   const response = await fetch(`${finalApiBaseUrl}/notation-sessions`, {
     method: 'POST',
-    headers,
+    headers: sessionData.id ? { ...headers, 'Idempotency-Key': sessionData.id } : headers,
     body: JSON.stringify(backendData)
   });
   
@@ -289,6 +291,50 @@ export async function getPopulationStats(): Promise<PopulationStatsResponse | nu
   }
 }
 
+export interface DashboardData {
+  userStats: UserStats;
+  populationStats: PopulationStatsResponse | null;
+}
+
+// Home dashboard in one request: the user's stats (same numbers calculateUserStats
+// derives from the full session lists) and population stats
+export async function getDashboard(): Promise<DashboardData> {
+  const headers = await getAuthHeaders();
+  const response = await fetch(`${finalApiBaseUrl}/dashboard`, { headers });
+  
+  if (!response.ok) throw new Error('Failed to fetch dashboard');
+  
+  const data = await response.json();
+  const stats: UserStatsResponse = data.user_stats;
+  
+  return {
+    userStats: {
+      totalSessions: stats.total_sessions,
+      totalPairs: stats.total_pairs,
+      avgAccuracy: stats.avg_accuracy,
+      avgSpeed: stats.avg_speed,
+      bestAccuracy: stats.best_accuracy,
+      bestSpeed: stats.best_speed,
+      bestQuality: stats.best_quality,
+      currentStreak: stats.current_streak,
+      lastSessionDate: stats.last_session_date,
+      daysSinceLastSession: stats.days_since_last_session,
+      drillStats: new Map<DrillType, DrillStats>(stats.drill_stats.map(drill => [
+        drill.drill_type as DrillType,
+        {
+          drillType: drill.drill_type as DrillType,
+          sessionCount: drill.session_count,
+          bestAccuracy: drill.best_accuracy,
+          bestSpeed: drill.best_speed,
+          avgAccuracy: drill.avg_accuracy,
+          avgSpeed: drill.avg_speed
+        }
+      ]))
+    },
+    populationStats: data.population_stats
+  };
+}
+
 async function getPopulationStatsPublic(): Promise<PopulationStatsResponse | null> {
   try {
     const headers = {
@@ -311,3 +357,324 @@ async function getPopulationStatsPublic(): Promise<PopulationStatsResponse | nul
   }
 }
 
+
+export interface PopulationHistogramResponse {
+  metric: 'accuracy' | 'speed' | 'quality';
+  total: number;
+  bins: Array<{
+    lower: number;
+    upper: number;
+    count: number;
+  }>;
+}
+
+export async function getPopulationHistogram(
+  metric: 'accuracy' | 'speed' | 'quality' = 'accuracy',
+  bins: number = 20
+): Promise<PopulationHistogramResponse | null> {
+  // Public endpoint (no auth required)
+  const params = new URLSearchParams({ metric, bins: bins.toString() });
+  const response = await fetch(`${finalApiBaseUrl}/stats/population/histogram?${params}`, {
+    headers: { 'Content-Type': 'application/json' }
+  });
+  
+  if (!response.ok) {
+    if (response.status === 503) {
+      return null;
+    }
+    throw new Error('Failed to fetch population histogram');
+  }
+  
+  return await response.json();
+}
+
+export interface TimeseriesResponse {
+  bucket: 'day' | 'week' | 'month';
+  points: Array<{
+    bucket: string;
+    drill_type: string;
+    session_count: number;
+    avg_accuracy: number;
+    best_accuracy: number;
+    avg_speed: number;
+  }>;
+}
+
+export async function getUserTimeseries(
+  bucket: 'day' | 'week' | 'month' = 'day',
+  options: { drillType?: string; startDate?: string; endDate?: string; maxPoints?: number } = {}
+): Promise<TimeseriesResponse> {
+  const headers = await getAuthHeaders();
+  const params = new URLSearchParams({
+    bucket,
+    ...(options.drillType ? { drill_type: options.drillType } : {}),
+    ...(options.startDate ? { start_date: options.startDate } : {}),
+    ...(options.endDate ? { end_date: options.endDate } : {}),
+    ...(options.maxPoints ? { max_points: options.maxPoints.toString() } : {})
+  });
+  
+  const response = await fetch(`${finalApiBaseUrl}/stats/timeseries?${params}`, { headers });
+  
+  if (!response.ok) throw new Error('Failed to fetch stats timeseries');
+  
+  return await response.json();
+}
+
+export interface TimingProfileResponse {
+  drill_type: string | null;
+  positions: Array<{
+    position: number;
+    count: number;
+    avg: number;
+    percentiles: { p25: number; p50: number; p75: number; p90: number };
+  }>;
+}
+
+export async function getUserTimingProfile(drillType?: string): Promise<TimingProfileResponse> {
+  const headers = await getAuthHeaders();
+  const params = new URLSearchParams(drillType ? { drill_type: drillType } : {});
+  
+  const response = await fetch(`${finalApiBaseUrl}/stats/timings?${params}`, { headers });
+  
+  if (!response.ok) throw new Error('Failed to fetch timing profile');
+  
+  return await response.json();
+}
+
+export interface StreakResponse {
+  current_streak: number;
+  longest_streak: number;
+  last_session_date: string | null;
+  days_since_last_session: number;
+}
+
+export async function getUserStreak(): Promise<StreakResponse> {
+  const headers = await getAuthHeaders();
+  const response = await fetch(`${finalApiBaseUrl}/stats/streak`, { headers });
+  
+  if (!response.ok) throw new Error('Failed to fetch streak');
+  
+  return await response.json();
+}
+
+export interface SessionSummary {
+  id: string;
+  date: string;
+  drillType: string;
+  pairCount: number;
+  averageTime: number;
+  totalTime?: number;
+  recallAccuracy: number;
+  vividness?: number;
+  flow?: number;
+}
+
+export interface SessionSummaryPage {
+  sessions: SessionSummary[];
+  nextCursor: string | null;
+}
+
+// Slim session rows for lists and charts; use getSession(id) for pairs and timings
+export async function getUserSessionSummaries(
+  limit: number = 100,
+  options: { cursor?: string; drillType?: string } = {}
+): Promise<SessionSummaryPage> {
+  const headers = await getAuthHeaders();
+  const params = new URLSearchParams({
+    limit: limit.toString(),
+    ...(options.cursor ? { cursor: options.cursor } : {}),
+    ...(options.drillType ? { drill_type: options.drillType } : {})
+  });
+  
+  const response = await fetch(`${finalApiBaseUrl}/sessions/summary?${params}`, { headers });
+  
+  if (!response.ok) throw new Error('Failed to fetch session summaries');
+  
+  const backendSessions = await response.json();
+  
+  return {
+    sessions: backendSessions.map((session: any) => ({
+      id: session.id,
+      date: session.session_date,
+      drillType: session.drill_type,
+      pairCount: Number(session.pair_count),
+      averageTime: Number(session.average_time),
+      totalTime: session.total_time ? Number(session.total_time) : undefined,
+      recallAccuracy: Number(session.recall_accuracy),
+      vividness: session.vividness,
+      flow: session.flow
+    })),
+    nextCursor: response.headers.get('X-Next-Cursor')
+  };
+}
+
+export interface HistoryItem {
+  kind: 'session' | 'notation_session';
+  id: string;
+  date: string;
+  drillType: string;
+  itemCount: number;
+  accuracy: number;
+  averageTime: number;
+  totalTime?: number;
+}
+
+export interface HistoryPage {
+  items: HistoryItem[];
+  nextCursor: string | null;
+}
+
+// Sessions and notation sessions merged newest-first by the server
+export async function getUserHistory(
+  limit: number = 100,
+  options: { cursor?: string; drillType?: string; startDate?: string; endDate?: string } = {}
+): Promise<HistoryPage> {
+  const headers = await getAuthHeaders();
+  const params = new URLSearchParams({
+    limit: limit.toString(),
+    ...(options.cursor ? { cursor: options.cursor } : {}),
+    ...(options.drillType ? { drill_type: options.drillType } : {}),
+    ...(options.startDate ? { start_date: options.startDate } : {}),
+    ...(options.endDate ? { end_date: options.endDate } : {})
+  });
+  
+  const response = await fetch(`${finalApiBaseUrl}/history?${params}`, { headers });
+  
+  if (!response.ok) throw new Error('Failed to fetch history');
+  
+  const items = await response.json();
+  
+  return {
+    items: items.map((item: any) => ({
+      kind: item.kind,
+      id: item.id,
+      date: item.session_date,
+      drillType: item.drill_type,
+      itemCount: Number(item.item_count),
+      accuracy: Number(item.accuracy),
+      averageTime: Number(item.average_time),
+      totalTime: item.total_time ? Number(item.total_time) : undefined
+    })),
+    nextCursor: response.headers.get('X-Next-Cursor')
+  };
+}
+
+export type ExportFormat = 'csv' | 'ndjson' | 'parquet';
+
+// Full history streamed by the server (no paging); parquet only where the server has pyarrow
+export async function exportUserHistory(
+  format: ExportFormat = 'csv',
+  options: { drillType?: string; startDate?: string; endDate?: string } = {}
+): Promise<{ blob: Blob; filename: string }> {
+  const headers = await getAuthHeaders();
+  const params = new URLSearchParams({
+    format,
+    ...(options.drillType ? { drill_type: options.drillType } : {}),
+    ...(options.startDate ? { start_date: options.startDate } : {}),
+    ...(options.endDate ? { end_date: options.endDate } : {})
+  });
+
+  const response = await fetch(`${finalApiBaseUrl}/export?${params}`, { headers });
+
+  if (!response.ok) throw new Error('Failed to export history');
+
+  const disposition = response.headers.get('Content-Disposition') || '';
+  const filename = /filename="([^"]+)"/.exec(disposition)?.[1] || `bld-history.${format}`;
+
+  return { blob: await response.blob(), filename };
+}
+
+export async function getSession(sessionId: string): Promise<SessionData> {
+  const headers = await getAuthHeaders();
+  const response = await fetch(`${finalApiBaseUrl}/sessions/${sessionId}`, { headers });
+  
+  if (!response.ok) throw new Error('Failed to fetch session');
+  
+  const session = await response.json();
+  
+  return {
+    id: session.id,
+    date: session.session_date,
+    drillType: session.drill_type,
+    pairCount: Number(session.pair_count),
+    pairs: session.pairs,
+    timings: session.timings,
+    averageTime: Number(session.average_time),
+    totalTime: session.total_time ? Number(session.total_time) : undefined,
+    recallAccuracy: Number(session.recall_accuracy),
+    userRecall: session.user_recall,
+    recallValidation: session.recall_validation,
+    vividness: session.vividness,
+    flow: session.flow,
+    notes: session.notes
+  };
+}
+
+export interface BulkCreateResult {
+  created: Array<{ index: number; id: string }>;
+  errors: Array<{ index: number; detail: unknown }>;
+}
+
+// Items per bulk request (the backend rejects more than BULK_MAX_ITEMS, 500 by default)
+const BULK_BATCH_SIZE = 200;
+
+async function postBulk(path: string, items: object[], localIds: string[]): Promise<BulkCreateResult> {
+  const headers = await getAuthHeaders();
+  const result: BulkCreateResult = { created: [], errors: [] };
+  
+  for (let offset = 0; offset < items.length; offset += BULK_BATCH_SIZE) {
+    // Each item is keyed by its local id, like the Idempotency-Key of a single POST,
+    // so a session gets the same server id however and in whichever batch it's uploaded
+    const batch = items.slice(offset, offset + BULK_BATCH_SIZE).map((item, i) => ({
+      ...item,
+      idempotency_key: localIds[offset + i]
+    }));
+    
+    const response = await fetch(`${finalApiBaseUrl}${path}`, {
+      method: 'POST',
+      headers,
+      body: JSON.stringify(batch)
+    });
+    
+    if (!response.ok) throw new Error(`Failed to upload sessions to ${path}`);
+    
+    // Indexes are per batch; shift them back to positions in `items`
+    const stored: BulkCreateResult = await response.json();
+    result.created.push(...stored.created.map(item => ({ ...item, index: item.index + offset })));
+    result.errors.push(...stored.errors.map(error => ({ ...error, index: error.index + offset })));
+  }
+  
+  return result;
+}
+
+export async function createSessionsBulk(sessions: SessionData[]): Promise<BulkCreateResult> {
+  return postBulk('/sessions/bulk', sessions.map(sessionData => ({
+    session_date: sessionData.date,
+    drill_type: sessionData.drillType,
+    pair_count: sessionData.pairCount,
+    pairs: sessionData.pairs,
+    timings: sessionData.timings,
+    average_time: sessionData.averageTime,
+    total_time: sessionData.totalTime,
+    recall_accuracy: sessionData.recallAccuracy,
+    user_recall: sessionData.userRecall,
+    recall_validation: sessionData.recallValidation,
+    vividness: sessionData.vividness,
+    flow: sessionData.flow,
+    notes: sessionData.notes
+  })), sessions.map(session => session.id));
+}
+
+export async function createNotationSessionsBulk(sessions: NotationSessionData[]): Promise<BulkCreateResult> {
+  return postBulk('/notation-sessions/bulk', sessions.map(sessionData => ({
+    session_date: sessionData.date,
+    drill_type: sessionData.drillType,
+    attempts: sessionData.attempts,
+    total_pieces: sessionData.totalPieces,
+    correct_count: sessionData.correctCount,
+    accuracy: sessionData.accuracy,
+    average_time: sessionData.averageTime,
+    total_time: sessionData.totalTime,
+    notes: sessionData.notes
+  })), sessions.map(session => session.id));
+}
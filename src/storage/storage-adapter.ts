@@ -68,22 +68,24 @@ export async function migrateLocalDataToAPI(): Promise<void> {
   
   console.log(`Migrating ${localSessions.length} sessions and ${localNotationSessions.length} notation sessions...`);
   
-  // Migrate regular sessions
-  for (const session of localSessions) {
-    try {
-      await apiClient.createSession(session);
-    } catch (error) {
-      console.error('Failed to migrate session:', session.id, error);
+  // Migrate regular sessions (bulk upload, one request per batch)
+  try {
+    const result = await apiClient.createSessionsBulk(localSessions);
+    for (const error of result.errors) {
+      console.error('Failed to migrate session:', localSessions[error.index].id, error.detail);
     }
+  } catch (error) {
+    console.error('Failed to migrate sessions:', error);
   }
   
   // Migrate notation sessions
-  for (const session of localNotationSessions) {
-    try {
-      await apiClient.createNotationSession(session);
-    } catch (error) {
-      console.error('Failed to migrate notation session:', session.id, error);
+  try {
+    const result = await apiClient.createNotationSessionsBulk(localNotationSessions);
+    for (const error of result.errors) {
+      console.error('Failed to migrate notation session:', localNotationSessions[error.index].id, error.detail);
     }
+  } catch (error) {
+    console.error('Failed to migrate notation sessions:', error);
   }
   
   // Clear local storage after successful migration
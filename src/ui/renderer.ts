@@ -996,13 +996,14 @@ export function renderSessionDetail(session: SessionData | NotationSessionData,
 export function renderHomeDashboard(
   sessions: SessionData[],
   notationSessions: NotationSessionData[] = [],
-  populationStats: any = null
+  populationStats: any = null,
+  precomputedStats?: UserStats
 ): void {
   const authState = getAuthState();
   const isAuthenticated = authState.isAuthenticated;
   
-  // Calculate user stats
-  const userStats = calculateUserStats(sessions, notationSessions);
+  // Calculate user stats (unless the server already did, see getDashboard)
+  const userStats = precomputedStats ?? calculateUserStats(sessions, notationSessions);
   
   // Render navigation
   renderNavigation();